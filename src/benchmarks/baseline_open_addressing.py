@@ -0,0 +1,633 @@
+'''
+ * A hash table implementation using open addressing over flat parallel arrays.
+ *
+ * Main inspiration: William Fiset
+ * https://github.com/williamfiset/Algorithms/blob/master/src/main/java/com/williamfiset/algorithms/datastructures/hashtable/HashTableOpenAddressingBase.java
+ *
+ * NOTE: a frozen copy of the HashTableOpenAddressing class as it was before
+ * the keys were hashed once and __contains__ stopped catching exceptions,
+ * used by bench_hash_table_lookup.py as the baseline of the lookup path.
+ * It must not be changed together with the class in datastructures.
+ *
+ * @author Cosimo Giovanni Negri
+ * @date   18 Oct 2026
+'''
+
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from datastructures.hashtable.abstract_hash_table import AbstractHashTable
+
+
+# Marker left in the keys array where an entry has been removed,
+# so that probing sequences passing through that slot are not broken
+_TOMBSTONE = object()
+
+
+class HashTableOpenAddressing(AbstractHashTable):
+    '''
+    A hash table implementation using open addressing over flat parallel arrays.
+    NOTE: the probing sequence can be 'linear', 'quadratic' or 'robin_hood'.
+    Robin Hood hashing uses linear probing, but keeps the entries of every
+    probing sequence sorted by their distance from the home slot: a failed
+    lookup can stop early, and removals shift the following entries back
+    instead of leaving tombstones.
+    NOTE: capacity is the number of entries the table is expected to hold,
+    so that it is allocated once instead of being doubled many times.
+    '''
+    
+    PROBINGS = ('linear', 'quadratic', 'robin_hood')
+    
+    def __init__(self, capacity=None, probing='linear'):
+        if probing not in self.PROBINGS:
+            raise ValueError(f"probing must be one of {self.PROBINGS}, not {probing!r}")
+        
+        self.__INITIAL_CAPACITY = 8
+        self.__LOAD_FACTOR = 0.5
+        
+        self.__probing = probing
+        self.__quadratic = probing == 'quadratic'
+        self.__robin_hood = probing == 'robin_hood'
+        self.__min_capacity = self.__capacity_for(capacity or 0)
+        self.__init_table(self.__min_capacity)
+        self.__iter_index = None
+    
+    
+    def __init_table(self, capacity):
+        '''
+        Allocate empty parallel arrays with the given capacity, O(capacity).
+        NOTE: the capacity must be a power of two, so that the index
+        can be computed with a mask and quadratic probing visits every slot.
+        '''
+        self.__capacity = capacity
+        self.__mask = capacity - 1
+        self.__threshold = int(capacity * self.__LOAD_FACTOR)
+        self.__size = 0
+        self.__used = 0  # size + tombstones
+        self.__hashes = [None] * capacity
+        self.__keys = [None] * capacity
+        self.__values = [None] * capacity
+        # Distance of every entry from its home slot, only for Robin Hood hashing
+        self.__distances = [0] * capacity if self.__robin_hood else None
+    
+    
+    def __check_key_type(self, key):
+        '''
+        Raise an error if the key type is not valid, O(1).
+        '''
+        if key is None:
+            raise TypeError("key must not be None")
+        if isinstance(key, bool):
+            raise TypeError("key must not be a boolean")
+        
+        try:
+            hash(key)
+        except:
+            raise TypeError(f"unhashable key: {type(key)}")
+    
+    
+    def __hash_key(self, key):
+        '''
+        Return the hash of the key, raising an error
+        if the key type is not valid, O(1).
+        '''
+        if key is None or key is True or key is False:
+            self.__check_key_type(key)
+        try:
+            return hash(key)
+        except TypeError:
+            raise TypeError(f"unhashable key: {type(key)}")
+    
+    
+    def __capacity_for(self, size):
+        '''
+        Return the smallest capacity that can hold the given
+        number of entries without being resized, O(log(size)).
+        '''
+        capacity = self.__INITIAL_CAPACITY
+        while int(capacity * self.__LOAD_FACTOR) < size:
+            capacity *= 2
+        return capacity
+    
+    
+    @property
+    def capacity(self):
+        '''
+        Return the number of buckets of the table, O(1).
+        '''
+        return self.__capacity
+    
+    
+    @property
+    def probing(self):
+        '''
+        Return the probing sequence used by the hash table, O(1).
+        '''
+        return self.__probing
+    
+    
+    def clear(self):
+        '''
+        Empty the hash table, O(capacity).
+        '''
+        self.__init_table(self.__min_capacity)
+    
+    
+    def isempty(self):
+        '''
+        Return whether or not the hash table is empty, O(1).
+        '''
+        return self.__size == 0
+    
+    
+    def __resize_table(self):
+        '''
+        Rebuild the parallel arrays dropping all the tombstones, O(n).
+        NOTE: the capacity is doubled only if the live entries need it,
+        otherwise the arrays are just cleaned up with the same capacity.
+        '''
+        capacity = self.__capacity
+        if self.__size >= self.__threshold // 2:
+            capacity *= 2
+        self.__rehash_table(capacity)
+    
+    
+    def __rehash_table(self, capacity):
+        '''
+        Move all the live entries to new parallel arrays
+        with the given capacity, O(n).
+        '''
+        old_hashes = self.__hashes
+        old_keys = self.__keys
+        old_values = self.__values
+        size = self.__size
+        
+        self.__init_table(capacity)
+        if self.__robin_hood:
+            for i in range(len(old_hashes)):
+                if old_hashes[i] is not None:
+                    self.__robin_hood_place(old_hashes[i], old_keys[i], old_values[i])
+            self.__size = self.__used = size
+            return
+        
+        hashes = self.__hashes
+        keys = self.__keys
+        values = self.__values
+        mask = self.__mask
+        quadratic = self.__quadratic
+        
+        for i in range(len(old_hashes)):
+            key = old_keys[i]
+            if key is None or key is _TOMBSTONE: continue
+            
+            # No duplicates and no tombstones, so the first free slot is the right one
+            key_hash = old_hashes[i]
+            index = key_hash & mask
+            step = 0
+            while hashes[index] is not None:
+                step += 1
+                index = (index + (step if quadratic else 1)) & mask
+            
+            hashes[index] = key_hash
+            keys[index] = key
+            values[index] = old_values[i]
+        
+        self.__size = self.__used = size
+    
+    
+    def reserve(self, size):
+        '''
+        Resize the table once so that it can hold the given
+        number of entries without being resized again, O(n).
+        NOTE: the table is never shrunk by this method.
+        '''
+        capacity = self.__capacity_for(size)
+        if capacity > self.__capacity:
+            self.__rehash_table(capacity)
+    
+    
+    def __find_index(self, key, hash):
+        '''
+        Return the index of the slot holding the key if it exists
+        in the hash table, otherwise return -1, O(1)*.
+        NOTE: the cached hash is compared before the key itself.
+        '''
+        if self.__robin_hood:
+            return self.__robin_hood_find_index(key, hash)
+        
+        hashes = self.__hashes
+        keys = self.__keys
+        mask = self.__mask
+        quadratic = self.__quadratic
+        
+        index = hash & mask
+        step = 0
+        while True:
+            slot_hash = hashes[index]
+            if slot_hash is None:
+                return -1
+            if slot_hash == hash:
+                slot_key = keys[index]
+                if slot_key is key or \
+                        (type(slot_key) == type(key) and slot_key == key):
+                    return index
+            
+            step += 1
+            index = (index + (step if quadratic else 1)) & mask
+    
+    
+    def __robin_hood_find_index(self, key, hash):
+        '''
+        Return the index of the slot holding the key if it exists
+        in the hash table, otherwise return -1, O(1)*.
+        NOTE: the search stops as soon as it meets an entry closer to its
+        home slot than the key would be, since the key cannot be further.
+        '''
+        hashes = self.__hashes
+        keys = self.__keys
+        distances = self.__distances
+        mask = self.__mask
+        
+        index = hash & mask
+        distance = 0
+        while True:
+            slot_hash = hashes[index]
+            if slot_hash is None or distances[index] < distance:
+                return -1
+            if slot_hash == hash:
+                slot_key = keys[index]
+                if slot_key is key or \
+                        (type(slot_key) == type(key) and slot_key == key):
+                    return index
+            
+            distance += 1
+            index = (index + 1) & mask
+    
+    
+    def __robin_hood_place(self, hash, key, value):
+        '''
+        Insert an entry whose key does not exist in the hash table,
+        taking the slot of every entry closer to its home slot
+        and carrying that entry forward, O(1)*.
+        '''
+        hashes = self.__hashes
+        keys = self.__keys
+        values = self.__values
+        distances = self.__distances
+        mask = self.__mask
+        
+        index = hash & mask
+        distance = 0
+        while hashes[index] is not None:
+            if distances[index] < distance:
+                hashes[index], hash = hash, hashes[index]
+                keys[index], key = key, keys[index]
+                values[index], value = value, values[index]
+                distances[index], distance = distance, distances[index]
+            
+            distance += 1
+            index = (index + 1) & mask
+        
+        hashes[index] = hash
+        keys[index] = key
+        values[index] = value
+        distances[index] = distance
+    
+    
+    def __robin_hood_add(self, key, key_hash, value):
+        '''
+        Add a key-value pair if the key does not exist in the
+        hash table, otherwise update the key's value, O(1)*.
+        '''
+        index = self.__robin_hood_find_index(key, key_hash)
+        if index != -1:
+            self.__values[index] = value
+            return
+        
+        self.__robin_hood_place(key_hash, key, value)
+        self.__size += 1
+        self.__used += 1
+        
+        if self.__used > self.__threshold: self.__resize_table()
+    
+    
+    def __robin_hood_remove_index(self, index):
+        '''
+        Remove the entry at the given index shifting back the following
+        entries of the probing sequence, and return the key's value, O(1)*.
+        '''
+        hashes = self.__hashes
+        keys = self.__keys
+        values = self.__values
+        distances = self.__distances
+        mask = self.__mask
+        
+        value = values[index]
+        next_index = (index + 1) & mask
+        while hashes[next_index] is not None and distances[next_index] > 0:
+            hashes[index] = hashes[next_index]
+            keys[index] = keys[next_index]
+            values[index] = values[next_index]
+            distances[index] = distances[next_index] - 1
+            index = next_index
+            next_index = (index + 1) & mask
+        
+        hashes[index] = keys[index] = values[index] = None
+        distances[index] = 0
+        self.__size -= 1
+        self.__used -= 1
+        return value
+    
+    
+    def __probe_lengths(self):
+        '''
+        Return the list of the distances of every entry
+        from its home slot, O(n)*.
+        '''
+        if self.__robin_hood:
+            return [distance for hash, distance in zip(self.__hashes, self.__distances)
+                    if hash is not None]
+        
+        lengths = []
+        mask = self.__mask
+        for i, key in enumerate(self.__keys):
+            if key is None or key is _TOMBSTONE: continue
+            
+            index = self.__hashes[i] & mask
+            step = 0
+            while index != i:
+                step += 1
+                index = (index + (step if self.__quadratic else 1)) & mask
+            lengths.append(step)
+        
+        return lengths
+    
+    
+    def max_probe_length(self):
+        '''
+        Return the maximum distance of an entry from its home slot,
+        so the number of extra probes of the worst lookup, O(n)*.
+        '''
+        return max(self.__probe_lengths(), default=0)
+    
+    
+    def mean_probe_length(self):
+        '''
+        Return the mean distance of the entries from their home slot,
+        so the number of extra probes of an average lookup, O(n)*.
+        '''
+        lengths = self.__probe_lengths()
+        if not lengths:
+            return 0.0
+        return sum(lengths) / len(lengths)
+    
+    
+    def get(self, key, default=None):
+        '''
+        Return the key's value if the key exists in the hash table,
+        otherwise return the default value, O(1).
+        NOTE: If only one argument is given, the default value is
+        set to None, AND the function can return None even if
+        a key's value is None, so watch out...
+        NOTE: If the key type is not valid, raise an error.
+        '''
+        self.__check_key_type(key)
+        index = self.__find_index(key, hash(key))
+        
+        if index == -1:
+            return default
+        else:
+            return self.__values[index]
+    
+    
+    def add(self, key, value):
+        '''
+        Add a key-value pair if the key does not exist in the
+        hash table, otherwise update the key's value, O(1)*.
+        NOTE: If the key type is not valid, raise an error.
+        '''
+        self.__check_key_type(key)
+        self.__insert(key, hash(key), value)
+    
+    
+    def update(self, items):
+        '''
+        Add all the key-value pairs of a mapping or of an iterable
+        of pairs, updating the values of the existing keys, O(k).
+        NOTE: the table is resized at most once, and every key
+        is validated and hashed only once.
+        NOTE: If a key type is not valid, raise an error.
+        '''
+        if hasattr(items, 'items'):
+            items = items.items()
+        if not hasattr(items, '__len__'):
+            items = list(items)
+        self.reserve(self.__size + len(items))
+        
+        insert = self.__insert
+        hash_key = self.__hash_key
+        for key, value in items:
+            insert(key, hash_key(key), value)
+    
+    
+    def __insert(self, key, key_hash, value):
+        '''
+        Add a key-value pair if the key does not exist in the
+        hash table, otherwise update the key's value, O(1)*.
+        '''
+        if self.__robin_hood:
+            self.__robin_hood_add(key, key_hash, value)
+            return
+        
+        hashes = self.__hashes
+        keys = self.__keys
+        mask = self.__mask
+        quadratic = self.__quadratic
+        
+        index = key_hash & mask
+        step = 0
+        tombstone_index = -1
+        while True:
+            slot_hash = hashes[index]
+            if slot_hash is None:
+                break
+            
+            slot_key = keys[index]
+            if slot_key is _TOMBSTONE:
+                # Remember the first tombstone to reuse it for the insertion
+                if tombstone_index == -1:
+                    tombstone_index = index
+            elif slot_hash == key_hash and (slot_key is key or \
+                    (type(slot_key) == type(key) and slot_key == key)):
+                self.__values[index] = value
+                return
+            
+            step += 1
+            index = (index + (step if quadratic else 1)) & mask
+        
+        if tombstone_index != -1:
+            index = tombstone_index
+        else:
+            self.__used += 1
+        
+        hashes[index] = key_hash
+        keys[index] = key
+        self.__values[index] = value
+        self.__size += 1
+        
+        if self.__used > self.__threshold: self.__resize_table()
+    
+    
+    def __remove_index(self, index):
+        '''
+        Replace the entry at the given index with a tombstone
+        and return the key's value, O(1).
+        NOTE: Robin Hood hashing shifts the following entries back instead.
+        '''
+        if self.__robin_hood:
+            return self.__robin_hood_remove_index(index)
+        
+        value = self.__values[index]
+        self.__keys[index] = _TOMBSTONE
+        self.__values[index] = None
+        self.__size -= 1
+        return value
+    
+    
+    def remove(self, key, default=None):
+        '''
+        Remove a key-value pair and return the key's value
+        if the key exists in the hash table,
+        otherwise return the default value, O(1).
+        NOTE: If only one argument is given, the default value is
+        set to None, AND the function can return None even if
+        a key's value is None, so watch out...
+        NOTE: If the key type is not valid, raise an error.
+        '''
+        self.__check_key_type(key)
+        index = self.__find_index(key, hash(key))
+        
+        if index == -1:
+            return default
+        else:
+            return self.__remove_index(index)
+    
+    
+    def keys(self):
+        '''
+        Return a copy of the list of keys
+        found within the hash table, O(capacity).
+        '''
+        return [key for key in self.__keys
+                if key is not None and key is not _TOMBSTONE]
+    
+    
+    def values(self):
+        '''
+        Return a copy of the list of values
+        found within the hash table, O(capacity).
+        '''
+        keys = self.__keys
+        return [value for key, value in zip(keys, self.__values)
+                if key is not None and key is not _TOMBSTONE]
+    
+    
+    def items(self):
+        '''
+        Return a copy of the list of key-value tuple pairs
+        found within the hash table, O(capacity).
+        '''
+        return [(key, value) for key, value in zip(self.__keys, self.__values)
+                if key is not None and key is not _TOMBSTONE]
+    
+    
+    def __len__(self):
+        '''
+        Return the size of the hash table, O(1).
+        '''
+        return self.__size
+    
+    
+    def __getitem__(self, key):
+        '''
+        Return the key's value if the key exists in the hash table,
+        otherwise raise an error, O(1)*.
+        NOTE: If the key type is not valid, raise an error.
+        '''
+        self.__check_key_type(key)
+        index = self.__find_index(key, hash(key))
+        
+        if index == -1:
+            raise KeyError(f"{key} not in hash table")
+        else:
+            return self.__values[index]
+    
+    
+    def __setitem__(self, key, value):
+        '''
+        Add a key-value pair if the key does not exist in the
+        hash table, otherwise update the key's value, O(1)*.
+        NOTE: If the key type is not valid, raise an error.
+        '''
+        self.add(key, value)
+    
+    
+    def __delitem__(self, key):
+        '''
+        Remove a key-value pair if the key exists in the hash table,
+        otherwise raise an error, O(1).
+        NOTE: If the key type is not valid, raise an error.
+        '''
+        self.__check_key_type(key)
+        index = self.__find_index(key, hash(key))
+        
+        if index == -1:
+            raise KeyError(f"{key} not in hash table")
+        else:
+            self.__remove_index(index)
+    
+    
+    def __contains__(self, key):
+        '''
+        Return whether or not a key is in the hash table, O(1).
+        '''
+        try:
+            self.__getitem__(key)
+            return True
+        except:
+            return False
+    
+    
+    def __iter__(self):
+        '''
+        Called when iteration is initialized, O(1).
+        '''
+        self.__iter_index = 0
+        return self
+    
+    
+    def __next__(self):
+        '''
+        To move to the next key, O(1)*.
+        '''
+        keys = self.__keys
+        while self.__iter_index < self.__capacity:
+            key = keys[self.__iter_index]
+            self.__iter_index += 1
+            if key is not None and key is not _TOMBSTONE:
+                return key
+        
+        raise StopIteration
+    
+    
+    def __str__(self):
+        '''
+        Return a string to print the entries
+        of the hash table, O(capacity).
+        '''
+        strings = []
+        for key, value in self.items():
+            strings.append(f"{str(key)}: {str(value)}")
+        
+        return '{' + ', '.join(strings) + '}'
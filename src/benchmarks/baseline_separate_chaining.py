@@ -0,0 +1,589 @@
+'''
+ * A hash table implementation using separate chaining with a doubly linked list.
+ *
+ * Main inspiration: William Fiset
+ * https://github.com/williamfiset/Algorithms/blob/master/src/main/java/com/williamfiset/algorithms/datastructures/hashtable/HashTableSeparateChaining.java
+ *
+ * NOTE: a frozen copy of the HashTableSeparateChaining class as it was before
+ * the keys were hashed once and __contains__ stopped catching exceptions,
+ * used by bench_hash_table_lookup.py as the baseline of the lookup path.
+ * It must not be changed together with the class in datastructures.
+ *
+ * @author Cosimo Giovanni Negri
+ * @date   27 Aug 2022
+'''
+
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from datastructures.hashtable.abstract_hash_table import AbstractHashTable
+from datastructures.linkedlist.doubly_linked_list import DoublyLinkedList
+
+
+class Entry:
+    '''
+    Entry class to represent the key-value pair of the hash table.
+    '''
+    def __init__(self, key, value, key_hash=None):
+        self.key = key
+        self.value = value
+        self.hash = hash(key) if key_hash is None else key_hash
+    
+    def __eq__(self, other):
+        if self.hash != other.hash:
+            return False
+        return self.key == other.key
+    
+    def __str__(self):
+        return f"{str(self.key)}: {str(self.value)}"
+
+
+class HashTableSeparateChaining(AbstractHashTable):
+    '''
+    A hash table implementation using separate chaining with a doubly linked list.
+    NOTE: if incremental is set to True, the table is resized incrementally:
+    the old and the new table coexist, and every operation migrates only
+    a bounded number of buckets, so that no single operation is O(n).
+    NOTE: capacity is the number of entries the table is expected to hold,
+    so that it is allocated once instead of being doubled many times.
+    NOTE: the table is halved when it becomes a quarter full compared to
+    the load factor, and never shrinks below its initial capacity.
+    '''
+    
+    def __init__(self, capacity=None, incremental=False):
+        self.__INITIAL_CAPACITY = 4
+        self.__LOAD_FACTOR = 0.75
+        # Buckets migrated by every operation, enough to complete a migration
+        # before the table can need to grow or to shrink again
+        self.__REHASH_STEP = 16
+        
+        self.__incremental = incremental
+        self.__old_table = None
+        self.__rehash_index = 0
+        
+        self.__min_capacity = self.__capacity_for(capacity or 0)
+        self.__set_capacity(self.__min_capacity)
+        self.__size = 0
+        self.__table = [None] * self.__capacity
+        self.__iter_index = None
+        self.__iterator = None
+    
+    
+    def __check_key_type(self, key):
+        '''
+        Raise an error if the key type is not valid, O(1).
+        '''
+        if key is None:
+            raise TypeError("key must not be None")
+        if isinstance(key, bool):
+            raise TypeError("key must not be a boolean")
+        
+        try:
+            hash(key)
+        except:
+            raise TypeError(f"unhashable key: {type(key)}")
+    
+    
+    def __hash_key(self, key):
+        '''
+        Return the hash of the key, raising an error
+        if the key type is not valid, O(1).
+        '''
+        if key is None or key is True or key is False:
+            self.__check_key_type(key)
+        try:
+            return hash(key)
+        except TypeError:
+            raise TypeError(f"unhashable key: {type(key)}")
+    
+    
+    def __set_capacity(self, capacity):
+        '''
+        Set the capacity of the table, and the sizes over and under
+        which the table has to grow or to shrink, O(1).
+        NOTE: the gap between the two thresholds avoids
+        growing and shrinking over and over again.
+        '''
+        self.__capacity = capacity
+        self.__threshold = int(capacity * self.__LOAD_FACTOR)
+        self.__low_threshold = int(capacity * self.__LOAD_FACTOR / 4)
+    
+    
+    def __capacity_for(self, size):
+        '''
+        Return the smallest capacity that can hold the given
+        number of entries without being resized, O(log(size)).
+        '''
+        capacity = self.__INITIAL_CAPACITY
+        while int(capacity * self.__LOAD_FACTOR) < size:
+            capacity *= 2
+        return capacity
+            
+    
+    @property
+    def capacity(self):
+        '''
+        Return the number of buckets of the table, O(1).
+        '''
+        return self.__capacity
+    
+    
+    def clear(self):
+        '''
+        Empty the hash table, O(n).
+        '''
+        for bucket in self.__all_buckets():
+            bucket.clear()
+        
+        self.__old_table = None
+        self.__rehash_index = 0
+        self.__set_capacity(self.__min_capacity)
+        self.__size = 0
+        self.__table = [None] * self.__capacity
+    
+    
+    def isempty(self):
+        '''
+        Return whether or not the hash table is empty, O(1).
+        '''
+        return self.__size == 0
+        
+    
+    def __get_index(self, hash):
+        '''
+        Convert a hash to an index and return it, O(1).
+        '''
+        # Strip the negative sign and place the hash in the domain [0, capacity - 1]
+        return (~hash + 1) % self.__capacity
+    
+    
+    def __all_buckets(self):
+        '''
+        Return a generator over all the non empty buckets,
+        including the ones of the table being migrated, O(n).
+        '''
+        for bucket in self.__table:
+            if bucket is not None:
+                yield bucket
+        
+        if self.__old_table is not None:
+            for bucket in self.__old_table:
+                if bucket is not None:
+                    yield bucket
+    
+    
+    def __rehash_step(self, buckets):
+        '''
+        Migrate up to the given number of buckets from the old table
+        to the new one, O(buckets)*.
+        '''
+        old_table = self.__old_table
+        old_capacity = len(old_table)
+        stop = min(self.__rehash_index + buckets, old_capacity)
+        
+        for index in range(self.__rehash_index, stop):
+            bucket = old_table[index]
+            if bucket is None: continue
+            
+            for entry in bucket:
+                self.__table_append(entry)
+            
+            # Memory cleanup of the migrated bucket
+            bucket.clear()
+            old_table[index] = None
+        
+        self.__rehash_index = stop
+        if stop == old_capacity:
+            self.__old_table = None
+            self.__rehash_index = 0
+    
+    
+    def __table_append(self, entry):
+        '''
+        Append an entry whose key does not exist
+        to the right bucket of the table, O(1).
+        '''
+        bucket_index = self.__get_index(entry.hash)
+        bucket = self.__table[bucket_index]
+        if bucket is None:
+            bucket = self.__table[bucket_index] = DoublyLinkedList()
+        bucket.append(entry)
+    
+    
+    def __resize_table(self, capacity):
+        '''
+        Resize the table holding buckets of entries, O(n).
+        NOTE: in incremental mode only a new empty table is allocated, O(capacity),
+        and the entries are migrated a few buckets at a time by the next operations.
+        '''
+        if self.__incremental:
+            # A migration still in progress must be completed first
+            if self.__old_table is not None:
+                self.__rehash_step(len(self.__old_table))
+            
+            self.__old_table = self.__table
+            self.__rehash_index = 0
+            self.__set_capacity(capacity)
+            self.__table = [None] * self.__capacity
+            return
+        
+        self.__rehash_table(capacity)
+    
+    
+    def __rehash_table(self, capacity):
+        '''
+        Move all the entries to a new table with the given capacity, O(n).
+        NOTE: empty buckets are not copied, so their memory is freed.
+        '''
+        self.__set_capacity(capacity)
+        
+        new_table = [None] * self.__capacity
+                
+        for bucket in self.__table:
+            if bucket is None: continue
+            
+            for entry in bucket:
+                new_bucket_index = self.__get_index(entry.hash)
+                new_bucket = new_table[new_bucket_index]
+                
+                if new_bucket is None:
+                    new_bucket = new_table[new_bucket_index] = DoublyLinkedList()
+                    
+                new_bucket.append(entry)
+            
+            # Memory cleanup of the copied bucket
+            bucket.clear()
+            bucket = None
+        
+        self.__table = new_table
+    
+    
+    def reserve(self, size):
+        '''
+        Resize the table once so that it can hold the given
+        number of entries without being resized again, O(n).
+        NOTE: the table is never shrunk by this method.
+        '''
+        if self.__old_table is not None:
+            self.__rehash_step(len(self.__old_table))
+        
+        capacity = self.__capacity_for(size)
+        if capacity > self.__capacity:
+            self.__rehash_table(capacity)
+    
+    
+    def compact(self):
+        '''
+        Rebuild the table with the smallest capacity that can hold
+        its entries, freeing all the empty buckets, O(n).
+        NOTE: the table never shrinks below its initial capacity.
+        '''
+        if self.__old_table is not None:
+            self.__rehash_step(len(self.__old_table))
+        
+        capacity = max(self.__min_capacity, self.__capacity_for(self.__size))
+        self.__rehash_table(capacity)
+    
+    
+    def __bucket_search_entry(self, bucket, key):
+        '''
+        Return the key's entry if the key exists in the given bucket
+        of the hash table, otherwise return None, O(1).
+        '''
+        if bucket is None: return None
+        
+        for entry in bucket:
+            if type(entry.key) == type(key) and entry.key == key:
+                return entry
+        
+        return None
+    
+    
+    def __search_entry(self, key, key_hash):
+        '''
+        Return the bucket holding the key's entry and the entry itself
+        if the key exists in the hash table, otherwise return (None, None), O(1).
+        NOTE: during an incremental resize a few buckets are migrated first,
+        and the old table is consulted too if the key is not in the new one.
+        '''
+        if self.__old_table is not None:
+            self.__rehash_step(self.__REHASH_STEP)
+        
+        bucket = self.__table[self.__get_index(key_hash)]
+        entry = self.__bucket_search_entry(bucket, key)
+        
+        if entry is None and self.__old_table is not None:
+            old_table = self.__old_table
+            bucket = old_table[(~key_hash + 1) % len(old_table)]
+            entry = self.__bucket_search_entry(bucket, key)
+        
+        if entry is None:
+            return None, None
+        return bucket, entry
+    
+    
+    def get(self, key, default=None):
+        '''
+        Return the key's value if the key exists in the hash table,
+        otherwise return the default value, O(1).
+        NOTE: If only one argument is given, the default value is
+        set to None, AND the function can return None even if
+        a key's value is None, so watch out...
+        NOTE: If the key type is not valid, raise an error.
+        '''
+        self.__check_key_type(key)
+        bucket, entry = self.__search_entry(key, hash(key))
+        
+        if entry is None:
+            return default
+        else:
+            return entry.value
+    
+    
+    def add(self, key, value):
+        '''
+        Add a key-value pair if the key does not exist in the
+        hash table, otherwise update the key's value, O(1).
+        NOTE: If the key type is not valid, raise an error.
+        '''
+        self.__check_key_type(key)
+        bucket, existent_entry = self.__search_entry(key, hash(key))
+        
+        if existent_entry is None:
+            self.__table_append(Entry(key, value))
+            self.__size += 1
+            if self.__size > self.__threshold: self.__resize_table(self.__capacity * 2)
+        else:
+            existent_entry.value = value
+    
+    
+    def update(self, items):
+        '''
+        Add all the key-value pairs of a mapping or of an iterable
+        of pairs, updating the values of the existing keys, O(k).
+        NOTE: the table is resized at most once, and every key
+        is validated and hashed only once.
+        NOTE: If a key type is not valid, raise an error.
+        '''
+        if hasattr(items, 'items'):
+            items = items.items()
+        if not hasattr(items, '__len__'):
+            items = list(items)
+        self.reserve(self.__size + len(items))
+        
+        table = self.__table
+        capacity = self.__capacity
+        for key, value in items:
+            key_hash = self.__hash_key(key)
+            bucket_index = (~key_hash + 1) % capacity
+            bucket = table[bucket_index]
+            
+            if bucket is None:
+                bucket = table[bucket_index] = DoublyLinkedList()
+            else:
+                entry = self.__bucket_search_entry(bucket, key)
+                if entry is not None:
+                    entry.value = value
+                    continue
+            
+            bucket.append(Entry(key, value, key_hash))
+            self.__size += 1
+                
+    
+    def __bucket_remove_entry(self, bucket, entry):
+        '''
+        Remove an entry from its bucket and return the key's value, O(1)*.
+        NOTE: an emptied bucket is dropped from its table, and the table
+        is halved if it went under the low threshold.
+        '''
+        bucket.remove(entry)
+        self.__size -= 1
+        
+        if bucket.isempty():
+            self.__drop_bucket(bucket, entry.hash)
+        
+        if self.__size < self.__low_threshold and \
+                self.__capacity > self.__min_capacity and \
+                self.__old_table is None:
+            self.__resize_table(self.__capacity // 2)
+        
+        return entry.value
+    
+    
+    def __drop_bucket(self, bucket, key_hash):
+        '''
+        Remove an empty bucket from the table holding it, O(1).
+        '''
+        bucket_index = self.__get_index(key_hash)
+        if self.__table[bucket_index] is bucket:
+            self.__table[bucket_index] = None
+            return
+        
+        old_table = self.__old_table
+        old_bucket_index = (~key_hash + 1) % len(old_table)
+        old_table[old_bucket_index] = None
+    
+    
+    def remove(self, key, default=None):
+        '''
+        Remove a key-value pair and return the key's value
+        if the key exists in the hash table,
+        otherwise return the default value, O(1).
+        NOTE: If only one argument is given, the default value is
+        set to None, AND the function can return None even if
+        a key's value is None, so watch out...
+        NOTE: If the key type is not valid, raise an error.
+        '''
+        self.__check_key_type(key)
+        bucket, entry = self.__search_entry(key, hash(key))
+        
+        if entry is None:
+            return default
+        else:
+            return self.__bucket_remove_entry(bucket, entry)
+    
+    
+    def keys(self):
+        '''
+        Return a copy of the list of keys
+        found within the hash table, O(n).
+        '''
+        keys = []
+        for bucket in self.__all_buckets():
+            for entry in bucket:
+                keys.append(entry.key)
+        
+        return keys
+    
+    
+    def values(self):
+        '''
+        Return a copy of the list of values
+        found within the hash table, O(n).
+        '''
+        values = []
+        for bucket in self.__all_buckets():
+            for entry in bucket:
+                values.append(entry.value)
+        
+        return values
+    
+    
+    def items(self):
+        '''
+        Return a copy of the list of key-value tuple pairs
+        found within the hash table, O(n).
+        '''
+        items = []
+        for bucket in self.__all_buckets():
+            for entry in bucket:
+                items.append((entry.key, entry.value))
+        
+        return items
+    
+    
+    def __len__(self):
+        '''
+        Return the size of the hash table, O(1).
+        '''
+        return self.__size
+    
+    
+    def __getitem__(self, key):
+        '''
+        Return the key's value if the key exists in the hash table,
+        otherwise raise an error, O(1)*.
+        NOTE: If the key type is not valid, raise an error.
+        '''
+        self.__check_key_type(key)
+        bucket, entry = self.__search_entry(key, hash(key))
+        
+        if entry is None:
+            raise KeyError(f"{key} not in hash table")
+        else:
+            return entry.value
+    
+    
+    def __setitem__(self, key, value):
+        '''
+        Add a key-value pair if the key does not exist in the
+        hash table, otherwise update the key's value, O(1).
+        NOTE: If the key type is not valid, raise an error.
+        '''
+        self.add(key, value)
+    
+    
+    def __delitem__(self, key):
+        '''
+        Remove a key-value pair if the key exists in the hash table,
+        otherwise raise an error, O(1).
+        NOTE: If the key type is not valid, raise an error.
+        '''
+        self.__check_key_type(key)
+        bucket, entry = self.__search_entry(key, hash(key))
+        
+        if entry is None:
+            raise KeyError(f"{key} not in hash table")
+        else:
+            self.__bucket_remove_entry(bucket, entry)
+    
+    
+    def __contains__(self, key):
+        '''
+        Return whether or not a key is in the hash table, O(1).
+        '''
+        try:
+            self.__getitem__(key)
+            return True
+        except:
+            return False
+    
+    
+    def __iter__(self):
+        '''
+        Called when iteration is initialized, O(1).
+        NOTE: an incremental resize in progress is completed first, O(n),
+        so that the entries do not move while they are being iterated.
+        '''
+        if self.__old_table is not None:
+            self.__rehash_step(len(self.__old_table))
+        self.__iter_index = 0
+        return self 
+    
+    
+    def __next__(self):
+        '''
+        To move to the next entry, O(1).
+        '''
+        while self.__iter_index < self.__capacity:
+            
+            if self.__iterator is None:
+                bucket = self.__table[self.__iter_index]
+                if bucket is None:
+                    self.__iter_index += 1
+                    continue
+                
+                self.__iterator = iter(bucket)
+            
+            try:
+                return next(self.__iterator).key
+            except Exception:
+                self.__iter_index += 1
+                self.__iterator = None
+        
+        raise StopIteration
+    
+    
+    def __str__(self):
+        '''
+        Return a string to print the values
+        of the binary search tree, O(n).
+        NOTE: inorder exploration is used to find the list of values
+        '''
+        strings = []
+        for bucket in self.__all_buckets():
+            for entry in bucket:
+                strings.append(str(entry))
+        
+        return '{' + ', '.join(strings) + '}'
@@ -0,0 +1,70 @@
+'''
+ * A benchmark comparing the asyncio queue of the project with asyncio.Queue:
+ * throughput of a single producer or of many producers feeding
+ * a single consumer, on a bounded or on an unbounded queue.
+ *
+ * Usage (from the src folder):
+ *   python benchmarks/bench_async_queue.py [--values 100000] [--producers 1 8]
+ *
+ * @author Cosimo Giovanni Negri
+ * @date   18 Oct 2026
+'''
+
+import argparse
+import asyncio
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from datastructures.queue.async_queue import AsyncQueue
+from bench_utils import measure_time, print_header, print_row
+
+
+# factory taking the maxsize, name of the enqueue method and name of the dequeue method
+QUEUES = {
+    'AsyncQueue': (lambda maxsize: AsyncQueue(maxsize=maxsize), 'enqueue', 'dequeue'),
+    'asyncio.Queue': (lambda maxsize: asyncio.Queue(maxsize=maxsize or 0), 'put', 'get'),
+}
+
+
+async def transfer(name, values, producers, maxsize):
+    '''
+    Move the given number of values from the producers
+    to a single consumer through a new queue of the given kind.
+    '''
+    factory, enqueue_name, dequeue_name = QUEUES[name]
+    queue = factory(maxsize)
+    enqueue, dequeue = getattr(queue, enqueue_name), getattr(queue, dequeue_name)
+    
+    async def produce(count):
+        for value in range(count):
+            await enqueue(value)
+    
+    async def consume():
+        for _ in range(values):
+            await dequeue()
+    
+    share = values // producers
+    counts = [share] * (producers - 1) + [values - share * (producers - 1)]
+    await asyncio.gather(consume(), *[produce(count) for count in counts])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the asyncio queues.")
+    parser.add_argument('--values', type=int, default=10**5, help="values moved through the queue")
+    parser.add_argument('--producers', type=int, nargs='+', default=[1, 8],
+                        help="numbers of concurrent producers")
+    parser.add_argument('--maxsizes', type=int, nargs='+', default=[0, 64],
+                        help="maximum sizes of the queue, where 0 means unbounded")
+    args = parser.parse_args()
+    
+    print_header('queue', 'producers', 'maxsize', 'values/s', width=16)
+    for producers in args.producers:
+        for maxsize in args.maxsizes:
+            for name in QUEUES:
+                elapsed, _ = measure_time(asyncio.run, transfer(name, args.values, producers, maxsize or None))
+                print_row(name, producers, maxsize or 'unbounded', args.values / elapsed)
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
@@ -0,0 +1,81 @@
+'''
+ * A benchmark comparing the B+ tree at several orders with the
+ * balanced binary search tree and the red-black tree: bytes per value
+ * and throughput of range scans over windows of consecutive values.
+ *
+ * Usage (from the src folder):
+ *   python benchmarks/bench_b_plus_tree.py [--values 100000] [--orders 16 64 256]
+ *
+ * @author Cosimo Giovanni Negri
+ * @date   18 Oct 2026
+'''
+
+import argparse
+import random
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from datastructures.binarysearchtree.binary_search_tree import BinarySearchTree
+from datastructures.binarysearchtree.red_black_tree import RedBlackTree
+from datastructures.bplustree.b_plus_tree import BPlusTree
+from bench_utils import measure_memory, measure_time, print_header, print_row
+
+
+def fill(tree, values):
+    '''
+    Add every value to the given tree and return it.
+    '''
+    add = tree.add
+    for value in values:
+        add(value)
+    return tree
+
+
+def scan(tree, windows):
+    '''
+    Consume the values of the tree inside every window,
+    and return the number of values seen.
+    '''
+    seen = 0
+    irange = tree.irange
+    for lo, hi in windows:
+        for _ in irange(lo, hi):
+            seen += 1
+    return seen
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the B+ tree with the binary trees.")
+    parser.add_argument('--values', type=int, default=10**5, help="values in every tree")
+    parser.add_argument('--orders', type=int, nargs='+', default=[16, 64, 256],
+                        help="orders of the B+ trees")
+    parser.add_argument('--window', type=int, default=100,
+                        help="values in the range of every scan")
+    parser.add_argument('--scans', type=int, default=2000, help="number of range scans")
+    args = parser.parse_args()
+    
+    random.seed(0)
+    values = random.sample(range(args.values * 10), args.values)
+    # the values are spaced by 10 on average
+    windows = []
+    for _ in range(args.scans):
+        lo = random.randrange(args.values * 10)
+        windows.append((lo, lo + args.window * 10))
+    
+    trees = {
+        'avl': lambda: BinarySearchTree(balanced=True),
+        'red-black': lambda: RedBlackTree(),
+    }
+    for order in args.orders:
+        trees[f'b+ ({order})'] = lambda order=order: BPlusTree(order=order)
+    
+    print_header('tree', 'values', 'bytes/value', 'height', 'scanned/s')
+    for name, factory in trees.items():
+        memory, tree = measure_memory(fill, factory(), values)
+        elapsed, seen = measure_time(scan, tree, windows)
+        print_row(name, args.values, memory / args.values, tree.height(), seen / elapsed)
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
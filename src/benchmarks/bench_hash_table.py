@@ -0,0 +1,80 @@
+'''
+ * A benchmark comparing the hash table engines:
+ * lookups per second, bytes per entry and probe lengths
+ * for a growing number of keys.
+ *
+ * Usage (from the src folder):
+ *   python benchmarks/bench_hash_table.py [--min-exp 4] [--max-exp 7]
+ *
+ * @author Cosimo Giovanni Negri
+ * @date   18 Oct 2026
+'''
+
+import argparse
+import random
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from datastructures.hashtable.hash_table_separate_chaining import HashTableSeparateChaining
+from datastructures.hashtable.hash_table_open_addressing import HashTableOpenAddressing
+from bench_utils import measure_time, measure_memory, print_header, print_row
+
+
+ENGINES = {
+    'chaining': lambda: HashTableSeparateChaining(),
+    'open-linear': lambda: HashTableOpenAddressing(probing='linear'),
+    'open-quadratic': lambda: HashTableOpenAddressing(probing='quadratic'),
+    'open-robin-hood': lambda: HashTableOpenAddressing(probing='robin_hood'),
+}
+
+
+def build(engine, keys):
+    '''
+    Return a new hash table of the given engine containing all the keys.
+    '''
+    table = ENGINES[engine]()
+    add = table.add
+    for key in keys:
+        add(key, key)
+    return table
+
+
+def lookup(table, keys):
+    '''
+    Look up all the given keys in the hash table.
+    '''
+    get = table.get
+    for key in keys:
+        get(key)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the hash table engines.")
+    parser.add_argument('--min-exp', type=int, default=4, help="smallest size as a power of ten")
+    parser.add_argument('--max-exp', type=int, default=7, help="biggest size as a power of ten")
+    parser.add_argument('--lookups', type=int, default=10**6, help="lookups timed for every size")
+    parser.add_argument('--engines', nargs='+', default=list(ENGINES), choices=list(ENGINES))
+    args = parser.parse_args()
+    
+    random.seed(0)
+    print_header('engine', 'keys', 'lookups/s', 'bytes/entry', 'max probe', 'mean probe')
+    
+    for exp in range(args.min_exp, args.max_exp + 1):
+        n = 10 ** exp
+        keys = [random.getrandbits(62) for _ in range(n)]
+        probes = random.choices(keys, k=min(n, args.lookups))
+        
+        for engine in args.engines:
+            memory, table = measure_memory(build, engine, keys)
+            elapsed, _ = measure_time(lookup, table, probes)
+            if hasattr(table, 'max_probe_length'):
+                probe_lengths = (table.max_probe_length(), table.mean_probe_length())
+            else:
+                probe_lengths = ('-', '-')
+            print_row(engine, n, len(probes) / elapsed, memory / n, *probe_lengths)
+            del table
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+'''
+ * A micro-benchmark of the hash table lookup path:
+ * get, [] and in, for keys that are found and keys that are missing,
+ * comparing every engine with a frozen copy of the class as it was
+ * before keys were hashed once and __contains__ stopped catching exceptions.
+ *
+ * Usage (from the src folder):
+ *   python benchmarks/bench_hash_table_lookup.py [--keys 100000]
+ *
+ * @author Cosimo Giovanni Negri
+ * @date   18 Oct 2026
+'''
+
+import argparse
+import random
+import string
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from datastructures.hashtable.hash_table_separate_chaining import HashTableSeparateChaining
+from datastructures.hashtable.hash_table_open_addressing import HashTableOpenAddressing
+from baseline_separate_chaining import HashTableSeparateChaining as BaselineSeparateChaining
+from baseline_open_addressing import HashTableOpenAddressing as BaselineOpenAddressing
+from bench_utils import measure_time, print_header, print_row
+
+
+ENGINES = {
+    'chaining (old)': BaselineSeparateChaining,
+    'chaining': HashTableSeparateChaining,
+    'open (old)': BaselineOpenAddressing,
+    'open': HashTableOpenAddressing,
+    'dict': dict,
+}
+
+
+def random_string(length=16):
+    '''
+    Return a new random string of letters.
+    '''
+    return ''.join(random.choices(string.ascii_letters, k=length))
+
+
+def get_all(table, keys):
+    get = table.get
+    for key in keys:
+        get(key)
+
+
+def getitem_all(table, keys):
+    for key in keys:
+        table[key]
+
+
+def contains_all(table, keys):
+    for key in keys:
+        key in table
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the hash table lookup path.")
+    parser.add_argument('--keys', type=int, default=10**5, help="number of keys in the table")
+    parser.add_argument('--repeat', type=int, default=5, help="the best of this many runs is shown")
+    args = parser.parse_args()
+    
+    random.seed(0)
+    keys = [random_string() for _ in range(args.keys)]
+    missing = [random_string() for _ in range(args.keys)]
+    hits = random.sample(keys, len(keys))
+    
+    print_header('engine', 'get hit/s', 'get miss/s', '[] hit/s', 'in hit/s', 'in miss/s')
+    for engine, factory in ENGINES.items():
+        table = factory()
+        for key in keys:
+            table[key] = key
+        
+        rates = []
+        for function, probes in ((get_all, hits), (get_all, missing), (getitem_all, hits),
+                                 (contains_all, hits), (contains_all, missing)):
+            best = min(measure_time(function, table, probes)[0] for _ in range(args.repeat))
+            rates.append(len(probes) / best)
+        print_row(engine, *rates)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+'''
+ * A benchmark comparing the stop-the-world and the incremental resize
+ * of the separate chaining hash table: worst and total time of the additions.
+ *
+ * Usage (from the src folder):
+ *   python benchmarks/bench_hash_table_resize.py [--keys 1000000]
+ *
+ * @author Cosimo Giovanni Negri
+ * @date   18 Oct 2026
+'''
+
+import argparse
+import random
+import time
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from datastructures.hashtable.hash_table import HashTable
+from bench_utils import measure_time, print_header, print_row
+
+
+def add_all(table, keys):
+    '''
+    Add all the keys to the hash table and return
+    the latency of the slowest addition in seconds.
+    '''
+    add = table.add
+    clock = time.perf_counter
+    worst = 0.0
+    for key in keys:
+        start = clock()
+        add(key, key)
+        elapsed = clock() - start
+        if elapsed > worst:
+            worst = elapsed
+    return worst
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the hash table resize policies.")
+    parser.add_argument('--keys', type=int, default=10**6, help="number of keys added")
+    args = parser.parse_args()
+    
+    random.seed(0)
+    keys = [random.getrandbits(62) for _ in range(args.keys)]
+    
+    print_header('resize', 'keys', 'total (s)', 'worst add (ms)')
+    for incremental in (False, True):
+        table = HashTable(engine='chaining', incremental=incremental)
+        total, worst = measure_time(add_all, table, keys)
+        name = 'incremental' if incremental else 'stop-the-world'
+        print_row(name, args.keys, round(total, 2), worst * 1000)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+'''
+ * A benchmark comparing the overlap queries of the interval tree
+ * with a scan of the intervals kept sorted in a balanced binary search tree.
+ *
+ * Usage (from the src folder):
+ *   python benchmarks/bench_interval_tree.py [--sizes 1000 10000 100000]
+ *
+ * @author Cosimo Giovanni Negri
+ * @date   18 Oct 2026
+'''
+
+import argparse
+import random
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from datastructures.binarysearchtree.binary_search_tree import BinarySearchTree
+from datastructures.binarysearchtree.interval_tree import IntervalTree
+from bench_utils import measure_time, print_header, print_row
+
+
+def make_intervals(size, max_length):
+    '''
+    Return size random intervals, with a start
+    up to size * 10 and a length up to max_length.
+    '''
+    random.seed(0)
+    intervals = []
+    for _ in range(size):
+        start = random.randrange(size * 10)
+        intervals.append((start, start + random.randrange(max_length)))
+    return intervals
+
+
+def scan_queries(tree, queries):
+    '''
+    Answer every query scanning all the intervals of the tree.
+    '''
+    found = 0
+    for lo, hi in queries:
+        found += len([interval for interval in tree.inorder() if interval[0] <= hi and interval[1] >= lo])
+    return found
+
+
+def overlap_queries(tree, queries):
+    '''
+    Answer every query with the overlap method of the interval tree.
+    '''
+    found = 0
+    for lo, hi in queries:
+        found += len(tree.overlap(lo, hi))
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the overlap queries with a full scan.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10**4, 10**5],
+                        help="numbers of intervals")
+    parser.add_argument('--queries', type=int, default=100, help="number of overlap queries")
+    parser.add_argument('--max-length', type=int, default=100, help="maximum length of an interval")
+    args = parser.parse_args()
+    
+    print_header('structure', 'intervals', 'queries/s', 'found/query')
+    for size in args.sizes:
+        intervals = make_intervals(size, args.max_length)
+        queries = [(lo, lo + args.max_length) for lo, _ in random.sample(intervals, args.queries)]
+        
+        bst = BinarySearchTree(balanced=True)
+        interval_tree = IntervalTree()
+        for start, end in intervals:
+            bst.add((start, end))
+            interval_tree.add(start, end)
+        
+        for name, tree, run in [('bst scan', bst, scan_queries), ('interval tree', interval_tree, overlap_queries)]:
+            elapsed, found = measure_time(run, tree, queries)
+            print_row(name, size, args.queries / elapsed, found / args.queries)
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
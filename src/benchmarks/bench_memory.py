@@ -0,0 +1,116 @@
+'''
+ * A memory report of all the data structures of the project:
+ * bytes per element of every structure, and bytes of every record type
+ * (linked list node, hash table entry, tree node) with and without __slots__.
+ *
+ * Usage (from the src folder):
+ *   python benchmarks/bench_memory.py [--elements 100000]
+ *
+ * @author Cosimo Giovanni Negri
+ * @date   18 Oct 2026
+'''
+
+import argparse
+import random
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from datastructures import LinkedList, Queue, Stack, HashTable, Set, BinarySearchTree
+from datastructures.linkedlist import doubly_linked_list
+from datastructures.hashtable import hash_table_separate_chaining
+from datastructures.binarysearchtree import binary_search_tree
+from bench_utils import measure_memory, print_header, print_row
+
+
+def fill(factory, method, values):
+    '''
+    Return a new structure built by the factory,
+    after calling the given method on every value.
+    '''
+    structure = factory()
+    add = getattr(structure, method)
+    for value in values:
+        add(value)
+    return structure
+
+
+def fill_table(factory, values):
+    '''
+    Return a new hash table built by the factory,
+    after mapping every value to itself.
+    '''
+    table = factory()
+    for value in values:
+        table[value] = value
+    return table
+
+
+STRUCTURES = {
+    'LinkedList': lambda values: fill(LinkedList, 'append', values),
+    'Queue': lambda values: fill(Queue, 'enqueue', values),
+    'Stack': lambda values: fill(Stack, 'push', values),
+    'HashTable (chain)': lambda values: fill_table(lambda: HashTable(engine='chaining'), values),
+    'HashTable (open)': lambda values: fill_table(lambda: HashTable(engine='open_addressing'), values),
+    'Set': lambda values: fill(Set, 'add', values),
+    'BinarySearchTree': lambda values: fill(BinarySearchTree, 'add', values),
+}
+
+RECORDS = {
+    'linked list Node': (doubly_linked_list.Node, (0,)),
+    'hash table Entry': (hash_table_separate_chaining.Entry, (0, 0)),
+    'tree Node': (binary_search_tree.Node, (0,)),
+}
+
+
+def make_records(record_class, args, records):
+    '''
+    Fill the given list with new records.
+    '''
+    for i in range(len(records)):
+        records[i] = record_class(*args)
+
+
+def record_size(record_class, args, count):
+    '''
+    Return the mean bytes of a record of the given class.
+    '''
+    records = [None] * count
+    memory, _ = measure_memory(make_records, record_class, args, records)
+    return memory / count
+
+
+def without_slots(record_class):
+    '''
+    Return a copy of the record class that stores
+    its attributes in a per-instance __dict__.
+    '''
+    return type(record_class.__name__, (), {'__init__': record_class.__init__})
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report the memory used by every data structure.")
+    parser.add_argument('--elements', type=int, default=10**5, help="elements in every structure")
+    args = parser.parse_args()
+    
+    random.seed(0)
+    values = random.sample(range(args.elements * 10), args.elements)
+    
+    print_header('structure', 'elements', 'bytes/element', width=20)
+    for name, build in STRUCTURES.items():
+        memory, _ = measure_memory(build, values)
+        print_row(name, args.elements, memory / args.elements, width=20)
+    
+    print()
+    print_header('record', 'with __dict__', 'with __slots__', width=20)
+    for name, (record_class, record_args) in RECORDS.items():
+        unslotted = record_size(without_slots(record_class), record_args, args.elements)
+        if hasattr(record_class, '__slots__'):
+            slotted = record_size(record_class, record_args, args.elements)
+        else:
+            slotted = '-'
+        print_row(name, unslotted, slotted, width=20)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,112 @@
+'''
+ * A benchmark comparing the binary heap priority queue with a balanced
+ * binary search tree used as a priority queue, and with the heapq module:
+ * throughput of filling and then draining the queue, and of a steady
+ * stream of additions and removals of the minimum.
+ *
+ * Usage (from the src folder):
+ *   python benchmarks/bench_priority_queue.py [--sizes 1000 100000]
+ *
+ * @author Cosimo Giovanni Negri
+ * @date   18 Oct 2026
+'''
+
+import argparse
+import heapq
+import random
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from datastructures.binarysearchtree.binary_search_tree import BinarySearchTree
+from datastructures.queue.priority_queue import PriorityQueue
+from bench_utils import measure_time, print_header, print_row
+
+
+class TreePriorityQueue:
+    '''
+    A priority queue on a balanced binary search tree, as used before
+    the binary heap: the priorities are paired with a counter,
+    since the tree cannot hold the same value twice.
+    '''
+    def __init__(self):
+        self.tree = BinarySearchTree(balanced=True)
+        self.counter = 0
+    
+    def enqueue(self, priority):
+        self.tree.add((priority, self.counter))
+        self.counter += 1
+    
+    def dequeue(self):
+        entry = self.tree.getmin()
+        self.tree.remove(entry)
+        return entry[0]
+
+
+class HeapqPriorityQueue:
+    '''
+    A priority queue on a list managed by the heapq module.
+    '''
+    def __init__(self):
+        self.heap = []
+    
+    def enqueue(self, priority):
+        heapq.heappush(self.heap, priority)
+    
+    def dequeue(self):
+        return heapq.heappop(self.heap)
+
+
+QUEUES = {
+    'binary heap': PriorityQueue,
+    'avl tree': TreePriorityQueue,
+    'heapq': HeapqPriorityQueue,
+}
+
+
+def fill_and_drain(factory, priorities):
+    '''
+    Enqueue all the priorities and then dequeue all of them.
+    '''
+    queue = factory()
+    for priority in priorities:
+        queue.enqueue(priority)
+    for _ in priorities:
+        queue.dequeue()
+
+
+def steady(factory, priorities):
+    '''
+    Enqueue half of the priorities, and then alternate
+    an enqueue and a dequeue for the other half.
+    '''
+    queue = factory()
+    half = len(priorities) // 2
+    for priority in priorities[:half]:
+        queue.enqueue(priority)
+    for priority in priorities[half:]:
+        queue.enqueue(priority)
+        queue.dequeue()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the priority queues.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10**5],
+                        help="numbers of priorities enqueued")
+    args = parser.parse_args()
+    
+    print_header('queue', 'priorities', 'fill+drain ops/s', 'steady ops/s', width=18)
+    for size in args.sizes:
+        random.seed(0)
+        # few distinct priorities, so that there are many ties
+        priorities = [random.randrange(size // 10 + 1) for _ in range(size)]
+        for name, factory in QUEUES.items():
+            elapsed, _ = measure_time(fill_and_drain, factory, priorities)
+            fill_rate = 2 * size / elapsed
+            elapsed, _ = measure_time(steady, factory, priorities)
+            steady_rate = (size + size - size // 2) / elapsed
+            print_row(name, size, fill_rate, steady_rate, width=18)
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
@@ -0,0 +1,98 @@
+'''
+ * A benchmark comparing the linked queue, the array queue and
+ * collections.deque: throughput of enqueue and dequeue, either filling
+ * the queue and then emptying it or keeping it at a steady size,
+ * and bytes per value of a full queue.
+ *
+ * Usage (from the src folder):
+ *   python benchmarks/bench_queue.py [--sizes 1000 100000] [--operations 1000000]
+ *
+ * @author Cosimo Giovanni Negri
+ * @date   18 Oct 2026
+'''
+
+import argparse
+import sys
+import os
+from collections import deque
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from datastructures.queue.linked_queue import LinkedQueue
+from datastructures.queue.array_queue import ArrayQueue
+from bench_utils import measure_memory, measure_time, print_header, print_row
+
+
+# factory, name of the enqueue method and name of the dequeue method
+QUEUES = {
+    'linked': (LinkedQueue, 'enqueue', 'dequeue'),
+    'array': (ArrayQueue, 'enqueue', 'dequeue'),
+    'deque': (deque, 'append', 'popleft'),
+}
+
+
+def fill(name, values):
+    '''
+    Return a new queue of the given kind containing the values.
+    '''
+    factory, enqueue_name, _ = QUEUES[name]
+    queue = factory()
+    enqueue = getattr(queue, enqueue_name)
+    for value in values:
+        enqueue(value)
+    return queue
+
+
+def fill_and_empty(name, size, rounds):
+    '''
+    Enqueue size values and then dequeue all of them, rounds times.
+    '''
+    factory, enqueue_name, dequeue_name = QUEUES[name]
+    queue = factory()
+    enqueue, dequeue = getattr(queue, enqueue_name), getattr(queue, dequeue_name)
+    for _ in range(rounds):
+        for value in range(size):
+            enqueue(value)
+        for _ in range(size):
+            dequeue()
+
+
+def steady(name, size, rounds):
+    '''
+    Enqueue size values, and then alternate an enqueue
+    and a dequeue size * rounds times, as a stream of messages.
+    '''
+    factory, enqueue_name, dequeue_name = QUEUES[name]
+    queue = factory()
+    enqueue, dequeue = getattr(queue, enqueue_name), getattr(queue, dequeue_name)
+    for value in range(size):
+        enqueue(value)
+    for value in range(size * rounds):
+        enqueue(value)
+        dequeue()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the queues on enqueue and dequeue.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10**5],
+                        help="numbers of values in the queue")
+    parser.add_argument('--operations', type=int, default=10**6,
+                        help="enqueues and dequeues of every measurement")
+    parser.add_argument('--queues', nargs='+', default=list(QUEUES), choices=list(QUEUES),
+                        help="queues to compare")
+    args = parser.parse_args()
+    
+    print_header('queue', 'values', 'fill+empty ops/s', 'steady ops/s', 'bytes/value', width=18)
+    for size in args.sizes:
+        rounds = max(args.operations // (2 * size), 1)
+        values = list(range(size))
+        for name in args.queues:
+            elapsed, _ = measure_time(fill_and_empty, name, size, rounds)
+            fill_rate = 2 * size * rounds / elapsed
+            elapsed, _ = measure_time(steady, name, size, rounds)
+            steady_rate = (size + 2 * size * rounds) / elapsed
+            memory, _ = measure_memory(fill, name, values)
+            print_row(name, size, fill_rate, steady_rate, memory / size, width=18)
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
@@ -0,0 +1,108 @@
+'''
+ * A benchmark comparing the plain binary search tree, the balanced one,
+ * the red-black tree and the skip list: throughput and height of the
+ * resulting structure, either on sorted additions or on a mixed workload
+ * of random additions and removals.
+ *
+ * Usage (from the src folder):
+ *   python benchmarks/bench_tree.py [--workload sorted] [--sizes 500 10000 100000]
+ *
+ * @author Cosimo Giovanni Negri
+ * @date   18 Oct 2026
+'''
+
+import argparse
+import random
+import sys
+import os
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+from datastructures.binarysearchtree.binary_search_tree import BinarySearchTree
+from datastructures.binarysearchtree.red_black_tree import RedBlackTree
+from datastructures.skiplist.skip_list import SkipList
+from bench_utils import measure_time, print_header, print_row
+
+
+# above this size the plain binary search tree is too slow on sorted additions,
+# since its height grows with every value and each addition costs O(n)
+DEGENERATE_LIMIT = 2 * 10**4
+
+
+TREES = {
+    'bst': lambda: BinarySearchTree(),
+    'avl': lambda: BinarySearchTree(balanced=True),
+    'red-black': lambda: RedBlackTree(),
+    'skip-list': lambda: SkipList(seed=0),
+}
+
+
+def sorted_workload(size):
+    '''
+    Return the operations adding size sorted values.
+    '''
+    return [(True, value) for value in range(size)]
+
+
+def mixed_workload(size):
+    '''
+    Return the operations adding size random values, where every
+    addition is followed by the removal of a random value in the tree
+    half of the time, so that the tree ends up with about size / 2 values.
+    '''
+    random.seed(0)
+    values = random.sample(range(size * 10), size)
+    operations = []
+    present = []
+    for value in values:
+        operations.append((True, value))
+        present.append(value)
+        if random.random() < 0.5:
+            index = random.randrange(len(present))
+            present[index], present[-1] = present[-1], present[index]
+            operations.append((False, present.pop()))
+    return operations
+
+
+WORKLOADS = {
+    'sorted': sorted_workload,
+    'mixed': mixed_workload,
+}
+
+
+def run(tree, operations):
+    '''
+    Apply all the operations to the tree and return it.
+    '''
+    add = tree.add
+    remove = tree.remove
+    for is_add, value in operations:
+        if is_add:
+            add(value)
+        else:
+            remove(value)
+    return tree
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the trees on a workload.")
+    parser.add_argument('--workload', default='sorted', choices=list(WORKLOADS),
+                        help="sorted additions or random additions and removals")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[500, 10**4, 10**5],
+                        help="numbers of values added")
+    parser.add_argument('--trees', nargs='+', default=list(TREES), choices=list(TREES),
+                        help="trees to compare")
+    args = parser.parse_args()
+    
+    print_header('tree', 'values', 'ops/s', 'height')
+    for size in args.sizes:
+        operations = WORKLOADS[args.workload](size)
+        for name in args.trees:
+            if name == 'bst' and args.workload == 'sorted' and size > DEGENERATE_LIMIT:
+                print_row(name, size, 'skipped', '-')
+                continue
+            elapsed, tree = measure_time(run, TREES[name](), operations)
+            print_row(name, size, len(operations) / elapsed, tree.height())
+
+
+if __name__ == '__main__':
+    main()
\ No newline at end of file
@@ -0,0 +1,72 @@
+'''
+ * Helper functions shared by all the benchmarks of the project.
+ *
+ * @author Cosimo Giovanni Negri
+ * @date   18 Oct 2026
+'''
+
+import gc
+import time
+import tracemalloc
+
+
+def measure_time(function, *args):
+    '''
+    Call the function with the given arguments and return
+    the elapsed time in seconds, together with its result.
+    NOTE: the garbage collector is disabled during the measurement.
+    '''
+    gc.collect()
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        result = function(*args)
+        elapsed = time.perf_counter() - start
+    finally:
+        gc.enable()
+    
+    return elapsed, result
+
+
+def measure_memory(function, *args):
+    '''
+    Call the function with the given arguments and return the number
+    of bytes still allocated by it, together with its result.
+    NOTE: the arguments are allocated before tracing starts,
+    so only the memory of the returned object is counted.
+    '''
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        result = function(*args)
+        gc.collect()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    
+    return after - before, result
+
+
+def print_header(*columns, width=16):
+    '''
+    Print the header of a results table.
+    '''
+    print(''.join(f"{column:>{width}}" for column in columns))
+    print('-' * width * len(columns))
+
+
+def print_row(*values, width=16):
+    '''
+    Print a row of a results table,
+    formatting the numbers in a readable way.
+    '''
+    cells = []
+    for value in values:
+        if isinstance(value, float):
+            cells.append(f"{value:>{width},.1f}")
+        elif isinstance(value, int):
+            cells.append(f"{value:>{width},}")
+        else:
+            cells.append(f"{value:>{width}}")
+    print(''.join(cells))
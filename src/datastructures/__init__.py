@@ -1,6 +1,16 @@
 from .linkedlist.doubly_linked_list import DoublyLinkedList as LinkedList
 from .queue.linked_queue import LinkedQueue as Queue
+from .queue.array_queue import ArrayQueue
+from .queue.blocking_queue import BlockingQueue
+from .queue.async_queue import AsyncQueue
+from .queue.priority_queue import PriorityQueue
 from .stack.linked_stack import LinkedStack as Stack
-from .hashtable.hash_table_separate_chaining import HashTableSeparateChaining as HashTable
+from .hashtable.hash_table import HashTable
 from .set.set import Set
-from .binarysearchtree.binary_search_tree import BinarySearchTree
\ No newline at end of file
+from .binarysearchtree.binary_search_tree import BinarySearchTree
+from .binarysearchtree.red_black_tree import RedBlackTree
+from .binarysearchtree.tree_map import TreeMap
+from .binarysearchtree.persistent_tree import PersistentTree
+from .binarysearchtree.interval_tree import IntervalTree
+from .bplustree.b_plus_tree import BPlusTree
+from .skiplist.skip_list import SkipList
\ No newline at end of file
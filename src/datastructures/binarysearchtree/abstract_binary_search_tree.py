@@ -0,0 +1,361 @@
+'''
+ * An abstract base class for a binary search tree, whose nodes
+ * keep the height and the size of their subtree.
+ *
+ * @author Cosimo Giovanni Negri
+ * @date   18 Oct 2026
+'''
+
+from ..queue.linked_queue import LinkedQueue
+from ..set.abstract_ordered_set import AbstractOrderedSet
+
+
+class AbstractBinarySearchTree(AbstractOrderedSet):
+    '''
+    An abstract base class for a binary search tree, whose nodes
+    keep the height and the size of their subtree.
+    NOTE: the subclasses keep the root in _root, and increase _modifications
+    whenever the tree changes, so that the iterators fail fast.
+    NOTE: the queries which only read the tree, like rank, select,
+    floor or irange, are shared by all the subclasses.
+    '''
+    def __init__(self):
+        self._root = None
+        self._modifications = 0  # to detect changes during an iteration
+        self._comparisons = 0  # made by add, remove, discard and in
+    
+    
+    def _reference_value(self):
+        '''
+        Return the value of the root, or None if the tree is empty, O(1).
+        '''
+        return None if self._root is None else self._root.value
+    
+    
+    def _search(self, value):
+        '''
+        Return the node with the given value if it exists in the
+        binary search tree, otherwise return None.
+        NOTE: the descent only compares with <, and remembers the last node
+        where it went right, which is the greatest value not above the given one:
+        a single check at the end tells whether the two values are equal.
+        '''
+        candidate = None
+        node = self._root
+        while node is not None:
+            self._comparisons += 1
+            if value < node.value:
+                node = node.left
+            else:
+                candidate = node
+                node = node.right
+        
+        if candidate is None:
+            return None
+        self._comparisons += 1
+        return None if candidate.value < value else candidate
+    
+    
+    def _count_less(self, value, inclusive):
+        '''
+        Return the number of values in the binary search tree
+        less than the given value, or less or equal if inclusive.
+        '''
+        count = 0
+        node = self._root
+        
+        while node is not None:
+            if value < node.value:
+                node = node.left
+            elif value > node.value:
+                count += (0 if node.left is None else node.left.size) + 1
+                node = node.right
+            else:
+                count += (0 if node.left is None else node.left.size) + (1 if inclusive else 0)
+                break
+        
+        return count
+    
+    
+    def _select(self, index):
+        '''
+        Return the value at the given index in the sorted order,
+        going down towards the subtree which contains it.
+        '''
+        node = self._root
+        while True:
+            left_size = 0 if node.left is None else node.left.size
+            if index < left_size:
+                node = node.left
+            elif index > left_size:
+                index -= left_size + 1
+                node = node.right
+            else:
+                return node.value
+    
+    
+    def _navigate(self, value, below, inclusive):
+        '''
+        Return the closest value in the binary search tree below or above
+        the given one, which is included if inclusive, or None.
+        '''
+        result = None
+        node = self._root
+        while node is not None:
+            if value == node.value and inclusive:
+                return node.value
+            
+            if below:
+                if node.value < value:
+                    result = node.value  # the closest one so far
+                    node = node.right
+                else:
+                    node = node.left
+            else:
+                if node.value > value:
+                    result = node.value  # the closest one so far
+                    node = node.left
+                else:
+                    node = node.right
+        
+        return result
+    
+    
+    def _lazy_range(self, lo, hi, lo_inclusive, hi_inclusive):
+        '''
+        Yield the values of the binary search tree between lo and hi in order,
+        using an explicit stack of the nodes in the range whose
+        value has not been yielded yet.
+        NOTE: only the nodes on the boundaries and the ones in the range are visited.
+        '''
+        modifications = self._modifications
+        stack = []
+        node = self._root
+        
+        while True:
+            # Go down towards the first value not below lo
+            while node is not None:
+                if lo is not None and (node.value < lo or (node.value == lo and not lo_inclusive)):
+                    node = node.right
+                else:
+                    stack.append(node)
+                    node = node.left
+            
+            if not stack:
+                return
+            node = stack.pop()
+            if hi is not None and (node.value > hi or (node.value == hi and not hi_inclusive)):
+                return
+            
+            yield node.value
+            if self._modifications != modifications:
+                raise RuntimeError("tree changed size during iteration")
+            
+            node = node.right
+    
+    
+    def _lazy_inorder(self, reverse):
+        '''
+        Yield the values of the binary search tree in order, or in
+        reverse order, using an explicit stack of the nodes whose
+        value has not been yielded yet, O(1) per value amortized.
+        '''
+        modifications = self._modifications
+        stack = []
+        node = self._root
+        
+        while stack or node is not None:
+            # Go down as far as possible towards the first value
+            while node is not None:
+                stack.append(node)
+                node = node.right if reverse else node.left
+            
+            node = stack.pop()
+            yield node.value
+            if self._modifications != modifications:
+                raise RuntimeError("tree changed size during iteration")
+            
+            node = node.left if reverse else node.right
+    
+    
+    def isempty(self):
+        '''
+        Return whether or not the binary search tree is empty, O(1).
+        '''
+        return self._root is None
+    
+    
+    def getmin(self):
+        '''
+        Return the minimum value in the binary search tree, O(height).
+        NOTE: If the tree is empty, raise an error.
+        '''
+        if self._root is None:
+            raise ValueError("tree is empty")
+        
+        node = self._root
+        while node.left is not None:
+            node = node.left
+        return node.value
+    
+    
+    def getmax(self):
+        '''
+        Return the maximum value in the binary search tree, O(height).
+        NOTE: If the tree is empty, raise an error.
+        '''
+        if self._root is None:
+            raise ValueError("tree is empty")
+        
+        node = self._root
+        while node.right is not None:
+            node = node.right
+        return node.value
+    
+    
+    def height(self):
+        '''
+        Return the height of the binary search tree, O(1).
+        NOTE: every node keeps the height of its subtree.
+        '''
+        return 0 if self._root is None else self._root.height
+    
+    
+    def stats(self):
+        '''
+        Return a dictionary with the size and the height of the binary
+        search tree, the optimal height for its size, and the ratio
+        between the height and the optimal one, O(1).
+        NOTE: a ratio far from 1 means that the tree is degenerating.
+        '''
+        size = len(self)
+        height = self.height()
+        optimal_height = size.bit_length()  # ceil(log2(n + 1))
+        
+        return {
+            'size': size,
+            'height': height,
+            'optimal_height': optimal_height,
+            'height_ratio': height / optimal_height if optimal_height else 1.0,
+        }
+    
+    
+    @property
+    def comparison_count(self):
+        '''
+        Return the number of comparisons between values made
+        by add, remove, discard and the membership test so far, O(1).
+        NOTE: each of them makes one comparison for every node on its path
+        down to a leaf, and one more to check for equality at the end,
+        that is about log2(n) + 1 if the tree is balanced.
+        '''
+        return self._comparisons
+    
+    
+    def inorder(self):
+        '''
+        Traverse the binary search tree in order and
+        return a copy of the list of values, O(n).
+        '''
+        return list(self._lazy_inorder(reverse=False))
+    
+    
+    def preorder(self):
+        '''
+        Traverse the binary search tree in pre-order and
+        return a copy of the list of values, O(n).
+        '''
+        values = []
+        nodes = [] if self._root is None else [self._root]
+        
+        while nodes:
+            node = nodes.pop()
+            values.append(node.value)
+            if node.right is not None: nodes.append(node.right)
+            if node.left is not None: nodes.append(node.left)
+        
+        return values
+    
+    
+    def postorder(self):
+        '''
+        Traverse the binary search tree in post-order and
+        return a copy of the list of values, O(n).
+        '''
+        # The reverse of a (node, right, left) traversal
+        values = []
+        nodes = [] if self._root is None else [self._root]
+        
+        while nodes:
+            node = nodes.pop()
+            values.append(node.value)
+            if node.left is not None: nodes.append(node.left)
+            if node.right is not None: nodes.append(node.right)
+        
+        values.reverse()
+        return values
+    
+    
+    def levelorder(self):
+        '''
+        Traverse the binary search tree in level-order and
+        return a copy of the list of values, O(n).
+        '''
+        values = []
+        nodes = LinkedQueue()
+        nodes.enqueue(self._root)
+        
+        while not nodes.isempty():
+            node = nodes.dequeue()
+            if node is None: continue
+            
+            values.append(node.value)
+            nodes.enqueue(node.left)
+            nodes.enqueue(node.right)
+        
+        return values
+    
+    
+    def __len__(self):
+        '''
+        Return the size of the binary search tree, O(1).
+        '''
+        return 0 if self._root is None else self._root.size
+    
+    
+    def __contains__(self, value):
+        '''
+        Return whether or not a value
+        is in the binary search tree, O(height).
+        '''
+        return self._search(value) is not None
+    
+    
+    def __iter__(self):
+        '''
+        Return a new lazy iterator over the values
+        of the binary search tree in order, O(1).
+        NOTE: the iterator keeps only a stack of O(height) nodes.
+        NOTE: adding or removing values while iterating raises an error.
+        '''
+        return self._lazy_inorder(reverse=False)
+    
+    
+    def __reversed__(self):
+        '''
+        Return a new lazy iterator over the values
+        of the binary search tree in reverse order, O(1).
+        NOTE: adding or removing values while iterating raises an error.
+        '''
+        return self._lazy_inorder(reverse=True)
+    
+    
+    def __str__(self):
+        '''
+        Return a string to print the binary search tree, O(n).
+        '''
+        strings = []
+        for value in self:
+            strings.append(str(value))
+        
+        return '[' + ', '.join(strings) + ']'
\ No newline at end of file
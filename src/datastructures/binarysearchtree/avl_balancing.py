@@ -0,0 +1,81 @@
+'''
+ * A mixin class with the rotations of an AVL balanced binary search tree,
+ * shared by all the trees whose nodes keep their height and size.
+ *
+ * @author Cosimo Giovanni Negri
+ * @date   18 Oct 2026
+'''
+
+
+class AVLBalancing():
+    '''
+    A mixin class with the rotations of an AVL balanced binary search tree.
+    NOTE: the nodes must have the left, right, height and size fields.
+    NOTE: a tree whose nodes keep more fields about their subtree
+    overrides _update_node, which is called whenever the children
+    of a node change, after the ones of its children.
+    '''
+    def __node_height(self, node):
+        '''
+        Return the height of the given node, or 0 if there is no node.
+        '''
+        return 0 if node is None else node.height
+    
+    
+    def _update_node(self, node):
+        '''
+        Compute again the height and the size of
+        the subtree of the given node from its children.
+        '''
+        left, right = node.left, node.right
+        left_height = 0 if left is None else left.height
+        right_height = 0 if right is None else right.height
+        node.height = (left_height if left_height > right_height else right_height) + 1
+        node.size = (0 if left is None else left.size) + (0 if right is None else right.size) + 1
+    
+    
+    def _rotate_left(self, node):
+        '''
+        Make the right child of the given node the root of
+        the subtree, and return it.
+        '''
+        pivot = node.right
+        node.right = pivot.left
+        pivot.left = node
+        self._update_node(node)
+        self._update_node(pivot)
+        return pivot
+    
+    
+    def _rotate_right(self, node):
+        '''
+        Make the left child of the given node the root of
+        the subtree, and return it.
+        '''
+        pivot = node.left
+        node.left = pivot.right
+        pivot.right = node
+        self._update_node(node)
+        self._update_node(pivot)
+        return pivot
+    
+    
+    def _rebalance(self, node):
+        '''
+        Update the given node whose subtrees have changed, and rotate it
+        if it is not balanced, then return the new root of the subtree.
+        '''
+        self._update_node(node)
+        balance = self.__node_height(node.left) - self.__node_height(node.right)
+        
+        if balance > 1:  # left heavy
+            if self.__node_height(node.left.left) < self.__node_height(node.left.right):
+                node.left = self._rotate_left(node.left)
+            return self._rotate_right(node)
+        
+        if balance < -1:  # right heavy
+            if self.__node_height(node.right.right) < self.__node_height(node.right.left):
+                node.right = self._rotate_right(node.right)
+            return self._rotate_left(node)
+        
+        return node
\ No newline at end of file
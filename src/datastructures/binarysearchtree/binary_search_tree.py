@@ -8,344 +8,222 @@
  * @date   31 Aug 2022
 '''
 
-from ..queue.linked_queue import LinkedQueue
+from .abstract_binary_search_tree import AbstractBinarySearchTree
+from .avl_balancing import AVLBalancing
 
 
 class Node:
     '''
     Node class to represent an element of the binary search tree.
     '''
+    __slots__ = ('value', 'left', 'right', 'height', 'size')
+    
     def __init__(self, value, left=None, right=None):
         self.value = value
         self.left = left
         self.right = right
+        self.height = 1
+        self.size = 1  # number of nodes in the subtree
         
     def __str__(self):
         return str(self.value)
 
 
-class BinarySearchTree():
+class BinarySearchTree(AVLBalancing, AbstractBinarySearchTree):
     '''
     A binary search tree implementation.
+    NOTE: if balanced is set to True, the tree is kept balanced as an AVL tree:
+    the heights of the two subtrees of every node differ at most by one,
+    so that the height of the tree is O(log(n)) even for sorted values.
     '''
-    def __init__(self):
-        self.__size = 0
-        self.__root = None
-        self.__trav_values = None
-        self.__trav_index = None
+    def __init__(self, balanced=False):
+        super().__init__()
+        self.__balanced = balanced
     
     
-    def __check_value_type(self, value):
+    def _build(self, values):
         '''
-        Raise an error if the value type is not valid, O(1).
+        Fill the empty binary search tree with a perfectly
+        balanced tree containing the sorted values.
         '''
-        if isinstance(value, bool):
-            raise TypeError("value must not be a boolean")
-        
-        if self.__root is None:
-            try:
-                value == value
-                value > value
-                value < value
-            except:
-                raise TypeError(f"uncomparable value: {type(value)}")
-            
-        else:
-            root_value = self.__root.value
-            try:
-                value == root_value
-                value > root_value
-                value < root_value
-            except:
-                raise TypeError(f"{type(value)} not comparable with {type(root_value)}")
+        self._root = self.__build(values, 0, len(values))
     
     
-    def __recursive_clear(self, node):
+    def __build(self, values, start, stop):
         '''
-        Cleanup memory of the given node, and then recurse into
-        the left and the right subtrees.
+        Return the root of a perfectly balanced subtree containing
+        the sorted values between the start and the stop indexes.
         '''
-        if node is None:
-            return
-        
-        left_child = node.left
-        right_child = node.right
-        node.value = None
-        node.left = node.right = None
+        if start >= stop:
+            return None
         
-        self.__recursive_clear(left_child)
-        self.__recursive_clear(right_child)
+        middle = (start + stop) // 2
+        node = Node(values[middle])
+        node.left = self.__build(values, start, middle)
+        node.right = self.__build(values, middle + 1, stop)
+        self._update_node(node)
+        return node
     
     
     def clear(self):
         '''
         Empty the binary search tree, O(n).
+        NOTE: the nodes are cleaned up with an explicit stack instead of
+        recursion, since an unbalanced tree may be as deep as its size.
         '''
-        self.__recursive_clear(self.__root)    
-        self.__size = 0
-        self.__root = None
-        
-    
-    def isempty(self):
-        '''
-        Return whether or not the binary search tree is empty, O(1).
-        '''
-        return self.__size == 0
-    
-    
-    def __recursive_add(self, node, value):
-        '''
-        Add a node in the right place if the value does not exist
-        in the binary search tree, otherwise do nothing.
-        '''
-        if node is None:
-            self.__size += 1
-            return Node(value)
+        nodes = [] if self._root is None else [self._root]
+        while nodes:
+            node = nodes.pop()
+            if node.left is not None: nodes.append(node.left)
+            if node.right is not None: nodes.append(node.right)
+            node.value = None
+            node.left = node.right = None
         
-        if value < node.value:
-            node.left = self.__recursive_add(node.left, value)
-        elif value > node.value:
-            node.right = self.__recursive_add(node.right, value)
-        
-        return node
+        self._modifications += 1
+        self._root = None
     
     
-    def add(self, value):
+    @property
+    def balanced(self):
         '''
-        Add a node in the right place if the value does not exist
-        in the binary search tree, otherwise do nothing, O(height).
-        NOTE: If the value type is not valid, raise an error.
+        Return whether or not the binary search tree is kept balanced, O(1).
         '''
-        self.__check_value_type(value)
-        self.__root = self.__recursive_add(self.__root, value)
+        return self.__balanced
     
     
-    def __get_leftmost_child(self, node):
+    def _rebalance(self, node):
         '''
-        Return the leftmost child of the given node.
+        Update the given node whose subtrees have changed, and rotate it
+        if the tree is balanced and the node is not,
+        then return the new root of the subtree.
         '''
-        while node.left is not None:
-            node = node.left
-        return node
-
-    
-    def getmin(self):
-        '''
-        Return the minimum value in the binary search tree, O(height).
-        '''
-        return self.__get_leftmost_child(self.__root).value
-    
-    
-    def __get_rightmost_child(self, node):
-        '''
-        Return the rightmost child of the given node.
-        '''
-        while node.right is not None:
-            node = node.right
-        return node
-
-    
-    def getmax(self):
-        '''
-        Return the maximum value in the binary search tree, O(height).
-        '''
-        return self.__get_rightmost_child(self.__root).value
+        if not self.__balanced:
+            self._update_node(node)
+            return node
+        return super()._rebalance(node)
     
     
-    def __recursive_search(self, node, value):
+    def __rebuild_path(self, path, child):
         '''
-        Return the node with the given value if it exists in the
-        binary search tree, otherwise return None.
+        Make the given subtree the child of the last node on the path, then go
+        back up the path rebalancing every node, and return the new root.
+        NOTE: path is the list of the nodes visited by a descent, each one
+        together with whether or not the descent went to its left.
         '''
-        if node is None:
-            return None
-        
-        if value == node.value:
-            return node
-        elif value < node.value:
-            return self.__recursive_search(node.left, value)
-        else:
-            return self.__recursive_search(node.right, value)
+        for node, is_left in reversed(path):
+            if is_left:
+                node.left = child
+            else:
+                node.right = child
+            child = self._rebalance(node)
+        return child
     
     
-    def __recursive_remove(self, node, value):
+    def add(self, value):
         '''
-        Remove the node with a specific value from the binary search tree.
+        Add a node in the right place if the value does not exist
+        in the binary search tree, otherwise do nothing, O(height).
+        Return whether or not the value has been added.
+        NOTE: the height is O(log(n)) if the tree is balanced.
+        NOTE: no recursion is used, so even a degenerate tree
+        as deep as its size does not raise an error.
+        NOTE: If the value type is not valid, raise an error.
         '''
-        if node is None:
-            return None
-        
-        if value < node.value:
-            node.left = self.__recursive_remove(node.left, value)
-            return node
-        if value > node.value:
-            node.right = self.__recursive_remove(node.right, value)
-            return node
-        
-        # here value == node.value
-        
-        if node.left is None:  # zero children or only right child
-            return node.right
-        if node.right is None:  # only left child
-            return node.left
+        self._check_new_value(value)
+        
+        path = []
+        candidate = None  # the last node where the descent went right
+        node = self._root
+        try:
+            while node is not None:
+                self._comparisons += 1
+                is_left = value < node.value
+                path.append((node, is_left))
+                if is_left:
+                    node = node.left
+                else:
+                    candidate = node
+                    node = node.right
             
-        else: # two children
-            temp = self.__get_rightmost_child(node.left)
-            node.value = temp.value
-            node.left = self.__recursive_remove(node.left, temp.value)
-            return node
+            if candidate is not None:
+                self._comparisons += 1
+                if not candidate.value < value:
+                    return False  # the value already exists
+        except TypeError:
+            # nothing has changed, since nodes change only on the way back
+            raise self._uncomparable(value) from None
+        
+        self._root = self.__rebuild_path(path, Node(value))
+        self._modifications += 1
+        return True
     
     
     def remove(self, value):
         '''
         Remove the node with a specific value if it exists in the
         binary search tree, otherwise raise an error, O(height).
+        NOTE: the height is O(log(n)) if the tree is balanced.
+        NOTE: no recursion is used, so even a degenerate tree
+        as deep as its size does not raise an error.
         NOTE: If the value type is not valid, raise an error.
         '''
-        self.__check_value_type(value)
-        node = self.__recursive_search(self.__root, value)
-        
-        if node is None:
+        self._check_new_value(value)
+        
+        path = []
+        candidate = None  # index on the path of the last node where the descent went right
+        node = self._root
+        try:
+            while node is not None:
+                self._comparisons += 1
+                is_left = value < node.value
+                path.append((node, is_left))
+                if is_left:
+                    node = node.left
+                else:
+                    candidate = len(path) - 1
+                    node = node.right
+            
+            if candidate is not None:
+                self._comparisons += 1
+                if path[candidate][0].value < value:
+                    candidate = None
+        except TypeError:
+            # nothing has changed, since nodes change only on the way back
+            raise self._uncomparable(value) from None
+        
+        if candidate is None:
             raise ValueError(f"{value} not in tree")
-        else:
-            self.__root = self.__recursive_remove(self.__root, value)
-            self.__size -= 1
-    
-    
-    def __recursive_height(self, node):
-        '''
-        Return the height of the given node using recursion.
-        '''
-        if node is None:
-            return 0
-        
-        left_height = self.__recursive_height(node.left) + 1
-        right_height = self.__recursive_height(node.right) + 1
-        return max(left_height, right_height)
-        
-    
-    def height(self):
-        '''
-        Return the height of the binary search tree, O(n).
-        '''
-        return self.__recursive_height(self.__root)
-    
-    
-    def inorder(self):
-        '''
-        Traverse the binary search tree in order and
-        return a copy of the list of values, O(n).
-        '''
-        values = []
-        
-        def explore(node):
-            if node is None: return
-            explore(node.left)
-            values.append(node.value)
-            explore(node.right)
-        
-        explore(self.__root)
-        return values
-
-    
-    def preorder(self):
-        '''
-        Traverse the binary search tree in pre-order and
-        return a copy of the list of values, O(n).
-        '''
-        values = []
-        
-        def explore(node):
-            if node is None: return
-            values.append(node.value)
-            explore(node.left)
-            explore(node.right)
-        
-        explore(self.__root)
-        return values
-    
-    
-    def postorder(self):
-        '''
-        Traverse the binary search tree in post-order and
-        return a copy of the list of values, O(n).
-        '''
-        values = []
-        
-        def explore(node):
-            if node is None: return
-            explore(node.left)
-            explore(node.right)
-            values.append(node.value)
         
-        explore(self.__root)
-        return values
-    
-    
-    def levelorder(self):
-        '''
-        Traverse the binary search tree in level-order and
-        return a copy of the list of values, O(n).
-        '''
-        values = []
-        nodes = LinkedQueue()
-        nodes.enqueue(self.__root)
+        # the nodes below the target are not changed
+        target = path[candidate][0]
+        del path[candidate:]
         
-        while not nodes.isempty():
-            node = nodes.dequeue()
-            if node is None: continue
-            
-            values.append(node.value)
-            nodes.enqueue(node.left)
-            nodes.enqueue(node.right)
-        
-        return values
-    
-    
-    def __len__(self):
-        '''
-        Return the size of the binary search tree, O(1).
-        '''
-        return self.__size
-    
-    
-    def __contains__(self, value):
-        '''
-        Return whether or not a value
-        is in the binary search tree, O(log(n)).
-        '''
-        return self.__recursive_search(self.__root, value) is not None
-    
-    
-    def __iter__(self):
-        '''
-        Called when iteration is initialized, O(1).
-        '''
-        self.__trav_values = self.inorder()
-        self.__trav_index = 0
-        return self
-    
-    
-    def __next__(self):
-        '''
-        To move to the next entry, O(1).
-        '''
-        if self.__trav_index is None or \
-                self.__trav_index >= self.__size:
-            raise StopIteration
+        if target.left is None:  # zero children or only right child
+            self._root = self.__rebuild_path(path, target.right)
+        elif target.right is None:  # only left child
+            self._root = self.__rebuild_path(path, target.left)
+        else:
+            # two children, the predecessor takes the place of the target
+            path.append((target, True))
+            node = target.left
+            while node.right is not None:
+                path.append((node, False))
+                node = node.right
+            target.value = node.value
+            self._root = self.__rebuild_path(path, node.left)
         
-        value = self.__trav_values[self.__trav_index]
-        self.__trav_index += 1
-        return value
+        self._modifications += 1
     
     
-    def __str__(self):
+    def discard(self, value):
         '''
-        Return a string to print the hash table, O(n)*.
+        Remove the node with a specific value if it exists in the
+        binary search tree, otherwise do nothing, O(height).
+        Return whether or not the value has been removed.
+        NOTE: If the value type is not valid, raise an error.
         '''
-        strings = []
-        for value in self.inorder():
-            strings.append(str(value))
-        
-        return '[' + ', '.join(strings) + ']'
-        
\ No newline at end of file
+        try:
+            self.remove(value)
+        except ValueError:
+            return False
+        return True
\ No newline at end of file
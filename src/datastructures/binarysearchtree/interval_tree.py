@@ -0,0 +1,378 @@
+'''
+ * An interval tree implementation, where the closed intervals
+ * are stored in the nodes of an AVL balanced binary search tree.
+ *
+ * Main inspiration: Introduction to Algorithms (Cormen et al.), chapter 14.3
+ *
+ * @author Cosimo Giovanni Negri
+ * @date   18 Oct 2026
+'''
+
+from .avl_balancing import AVLBalancing
+
+
+class Node:
+    '''
+    Node class to represent an interval of the interval tree.
+    '''
+    __slots__ = ('interval', 'count', 'left', 'right', 'height', 'size', 'max_end')
+    
+    def __init__(self, interval):
+        self.interval = interval  # (start, end) tuple
+        self.count = 1  # how many times the interval has been added
+        self.left = None
+        self.right = None
+        self.height = 1
+        self.size = 1  # number of nodes in the subtree
+        self.max_end = interval[1]  # greatest end in the subtree
+    
+    def __str__(self):
+        return str(self.interval)
+
+
+class IntervalTree(AVLBalancing):
+    '''
+    An interval tree implementation, where the closed intervals
+    are stored in the nodes of an AVL balanced binary search tree.
+    NOTE: the intervals are sorted by start and then by end,
+    and every node keeps the greatest end in its subtree, so that
+    the subtrees without any overlapping interval are skipped.
+    NOTE: the same interval may be added many times, for example two
+    bookings of the same time window: it is stored in a single node
+    together with its count, and reported once for every time.
+    '''
+    def __init__(self):
+        self.__size = 0
+        self.__root = None
+        self.__modifications = 0  # to detect changes during an iteration
+    
+    
+    def __check_value_type(self, value):
+        '''
+        Raise an error if the type of an endpoint is not valid, O(1).
+        '''
+        if isinstance(value, bool):
+            raise TypeError("endpoint must not be a boolean")
+        
+        if self.__root is None:
+            try:
+                value == value
+                value > value
+                value < value
+            except:
+                raise TypeError(f"uncomparable endpoint: {type(value)}")
+        
+        else:
+            root_start = self.__root.interval[0]
+            try:
+                value == root_start
+                value > root_start
+                value < root_start
+            except:
+                raise TypeError(f"{type(value)} not comparable with {type(root_start)}")
+    
+    
+    def __check_interval(self, start, end):
+        '''
+        Raise an error if the interval is not valid, O(1).
+        '''
+        self.__check_value_type(start)
+        self.__check_value_type(end)
+        if end < start:
+            raise ValueError("interval end must not be less than its start")
+    
+    
+    def clear(self):
+        '''
+        Empty the interval tree, O(1).
+        '''
+        self.__size = 0
+        self.__modifications += 1
+        self.__root = None
+    
+    
+    def isempty(self):
+        '''
+        Return whether or not the interval tree is empty, O(1).
+        '''
+        return self.__size == 0
+    
+    
+    def _update_node(self, node):
+        '''
+        Compute again the height, the size and the greatest end
+        of the subtree of the given node from its children.
+        '''
+        super()._update_node(node)
+        
+        left, right = node.left, node.right
+        max_end = node.interval[1]
+        if left is not None and left.max_end > max_end:
+            max_end = left.max_end
+        if right is not None and right.max_end > max_end:
+            max_end = right.max_end
+        node.max_end = max_end
+    
+    
+    def __recursive_add(self, node, interval):
+        '''
+        Add a node in the right place if the interval does not exist
+        in the interval tree, otherwise increase the count of its node.
+        '''
+        if node is None:
+            return Node(interval)
+        
+        if interval < node.interval:
+            node.left = self.__recursive_add(node.left, interval)
+        elif interval > node.interval:
+            node.right = self.__recursive_add(node.right, interval)
+        else:
+            node.count += 1
+            return node
+        
+        return self._rebalance(node)
+    
+    
+    def add(self, start, end):
+        '''
+        Add the closed interval [start, end] to the interval tree,
+        even if it already exists, O(log(n)).
+        NOTE: If the endpoints are not valid, raise an error.
+        '''
+        self.__check_interval(start, end)
+        self.__root = self.__recursive_add(self.__root, (start, end))
+        self.__size += 1
+        self.__modifications += 1
+    
+    
+    def __remove_rightmost(self, node):
+        '''
+        Remove the rightmost node of the given subtree, and return
+        the new root of the subtree together with it.
+        '''
+        if node.right is None:
+            return node.left, node
+        
+        node.right, rightmost = self.__remove_rightmost(node.right)
+        return self._rebalance(node), rightmost
+    
+    
+    def __recursive_remove(self, node, interval):
+        '''
+        Remove the given interval once from the interval tree, and
+        its node too if it was the last one.
+        NOTE: If the interval does not exist, raise an error
+        before changing anything.
+        '''
+        if node is None:
+            raise ValueError(f"{interval} not in interval tree")
+        
+        if interval < node.interval:
+            node.left = self.__recursive_remove(node.left, interval)
+            return self._rebalance(node)
+        if interval > node.interval:
+            node.right = self.__recursive_remove(node.right, interval)
+            return self._rebalance(node)
+        
+        # here interval == node.interval
+        
+        if node.count > 1:
+            node.count -= 1
+            return node
+        
+        if node.left is None:  # zero children or only right child
+            return node.right
+        if node.right is None:  # only left child
+            return node.left
+        
+        # two children, the predecessor takes the place of the node
+        node.left, predecessor = self.__remove_rightmost(node.left)
+        node.interval = predecessor.interval
+        node.count = predecessor.count
+        return self._rebalance(node)
+    
+    
+    def remove(self, start, end):
+        '''
+        Remove the closed interval [start, end] once if it exists
+        in the interval tree, otherwise raise an error, O(log(n)).
+        NOTE: If the endpoints are not valid, raise an error.
+        '''
+        self.__check_interval(start, end)
+        self.__root = self.__recursive_remove(self.__root, (start, end))
+        self.__size -= 1
+        self.__modifications += 1
+    
+    
+    def discard(self, start, end):
+        '''
+        Remove the closed interval [start, end] once if it exists
+        in the interval tree, otherwise do nothing, O(log(n)).
+        Return whether or not the interval has been removed.
+        NOTE: If the endpoints are not valid, raise an error.
+        '''
+        try:
+            self.remove(start, end)
+        except ValueError:
+            return False
+        return True
+    
+    
+    def height(self):
+        '''
+        Return the height of the interval tree, O(1).
+        '''
+        return 0 if self.__root is None else self.__root.height
+    
+    
+    def overlap(self, lo, hi):
+        '''
+        Return the sorted list of the k intervals in the interval tree
+        overlapping the closed interval [lo, hi], O(log(n) + k).
+        NOTE: the k intervals are reported by a single traversal, which
+        never enters a subtree whose greatest end is below lo, and stops
+        at the first interval starting after hi: apart from the path down
+        to hi, every node it visits holds an overlapping interval or is
+        an ancestor of one.
+        NOTE: the bound holds when the overlapping intervals are close
+        together in the tree, as in the common case of a query window
+        around a point; if they are scattered among many intervals that end
+        before lo, their ancestors add up to O(k*log(n/k)) in the worst case.
+        NOTE: an interval added many times is reported once for every time.
+        NOTE: If the endpoints are not valid, raise an error.
+        '''
+        self.__check_interval(lo, hi)
+        return list(self.__lazy_overlap(lo, hi))
+    
+    
+    def stab(self, point):
+        '''
+        Return the sorted list of the intervals in the interval tree
+        containing the given point, O(log(n) + k).
+        NOTE: it is the overlap query of [point, point], with the same bounds.
+        NOTE: If the point type is not valid, raise an error.
+        '''
+        self.__check_value_type(point)
+        return list(self.__lazy_overlap(point, point))
+    
+    
+    def __lazy_overlap(self, lo, hi):
+        '''
+        Yield the intervals of the interval tree overlapping [lo, hi] in order,
+        with a single in-order traversal pruned by the greatest ends.
+        NOTE: the explicit stack holds the nodes whose interval has not been
+        checked yet, and a subtree is entered only if some of its intervals
+        do not end before lo.
+        '''
+        modifications = self.__modifications
+        stack = []
+        node = self.__root
+        
+        while True:
+            # Go down to the left, as long as some interval does not end before lo
+            while node is not None and not node.max_end < lo:
+                stack.append(node)
+                node = node.left
+            
+            if not stack:
+                return
+            node = stack.pop()
+            start, end = node.interval
+            if start > hi:  # so do all the following intervals
+                return
+            
+            if not end < lo:
+                for _ in range(node.count):
+                    yield node.interval
+                    if self.__modifications != modifications:
+                        raise RuntimeError("interval tree changed size during iteration")
+            
+            node = node.right
+    
+    
+    def __len__(self):
+        '''
+        Return the number of intervals in the interval tree, O(1).
+        '''
+        return self.__size
+    
+    
+    def __find(self, interval):
+        '''
+        Return the node with the given interval if it exists
+        in the interval tree, otherwise return None.
+        '''
+        node = self.__root
+        while node is not None:
+            if interval < node.interval:
+                node = node.left
+            elif interval > node.interval:
+                node = node.right
+            else:
+                return node
+        return None
+    
+    
+    def count(self, start, end):
+        '''
+        Return how many times the closed interval [start, end]
+        is in the interval tree, O(log(n)).
+        NOTE: If the endpoints are not valid, raise an error.
+        '''
+        self.__check_interval(start, end)
+        node = self.__find((start, end))
+        return 0 if node is None else node.count
+    
+    
+    def __contains__(self, interval):
+        '''
+        Return whether or not a (start, end) tuple
+        is in the interval tree, O(log(n)).
+        '''
+        return self.__find(tuple(interval)) is not None
+    
+    
+    def __iter__(self):
+        '''
+        Return a new lazy iterator over the (start, end) tuples
+        of the interval tree in order, O(1).
+        NOTE: an interval added many times is yielded once for every time.
+        NOTE: adding or removing intervals while iterating raises an error.
+        '''
+        return self.__lazy_inorder()
+    
+    
+    def __lazy_inorder(self):
+        '''
+        Yield the intervals of the interval tree in order, using an explicit
+        stack of the nodes whose interval has not been yielded yet.
+        '''
+        modifications = self.__modifications
+        stack = []
+        node = self.__root
+        
+        while stack or node is not None:
+            # Go down as far as possible towards the first interval
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            
+            node = stack.pop()
+            for _ in range(node.count):
+                yield node.interval
+                if self.__modifications != modifications:
+                    raise RuntimeError("interval tree changed size during iteration")
+            
+            node = node.right
+    
+    
+    def __str__(self):
+        '''
+        Return a string to print the intervals
+        of the interval tree in order, O(n).
+        '''
+        strings = []
+        for start, end in self:
+            strings.append(f"[{start}, {end}]")
+        
+        return '[' + ', '.join(strings) + ']'
\ No newline at end of file
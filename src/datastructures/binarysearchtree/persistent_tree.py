@@ -0,0 +1,248 @@
+'''
+ * A persistent binary search tree implementation, where every update
+ * returns a new version of the tree sharing the untouched nodes.
+ *
+ * Main inspiration: Purely Functional Data Structures (Okasaki), chapter 2
+ *
+ * @author Cosimo Giovanni Negri
+ * @date   18 Oct 2026
+'''
+
+from .abstract_binary_search_tree import AbstractBinarySearchTree
+
+
+class Node:
+    '''
+    Node class to represent an element of the persistent tree.
+    NOTE: a node never changes after its creation, since it may be
+    shared by many versions of the tree.
+    '''
+    __slots__ = ('value', 'left', 'right', 'height', 'size')
+    
+    def __init__(self, value, left=None, right=None):
+        self.value = value
+        self.left = left
+        self.right = right
+        left_height = 0 if left is None else left.height
+        right_height = 0 if right is None else right.height
+        self.height = (left_height if left_height > right_height else right_height) + 1
+        self.size = (0 if left is None else left.size) + (0 if right is None else right.size) + 1
+    
+    def __str__(self):
+        return str(self.value)
+
+
+class PersistentTree(AbstractBinarySearchTree):
+    '''
+    A persistent binary search tree implementation, kept balanced as an AVL tree.
+    NOTE: add, remove and discard never change the tree, but return
+    a new version of it: only the O(log(n)) nodes on the path of the value
+    are copied, and all the other ones are shared with the previous version.
+    NOTE: a snapshot is just a reference to a version, O(1), which stays
+    the same forever and can be read from many threads while
+    new versions are created from it.
+    '''
+    @classmethod
+    def __from_root(cls, root):
+        '''
+        Return a new version of the tree with the given root.
+        '''
+        tree = cls()
+        tree._root = root
+        return tree
+    
+    
+    def __build(self, values, start, stop):
+        '''
+        Return the root of a perfectly balanced subtree containing
+        the sorted values between the start and the stop indexes.
+        '''
+        if start >= stop:
+            return None
+        
+        middle = (start + stop) // 2
+        left = self.__build(values, start, middle)
+        right = self.__build(values, middle + 1, stop)
+        return Node(values[middle], left, right)
+    
+    
+    def _build(self, values):
+        '''
+        Fill the empty tree with a perfectly balanced tree
+        containing the sorted values.
+        NOTE: it is only called on a new tree, before it is shared.
+        '''
+        self._root = self.__build(values, 0, len(values))
+    
+    
+    def clear(self):
+        '''
+        Return a new empty version of the tree, O(1).
+        '''
+        return type(self)()
+    
+    
+    def _search(self, value):
+        '''
+        Return the node with the given value if it exists
+        in the tree, otherwise return None.
+        NOTE: the same two-way descent of the other trees, but without
+        counting the comparisons, since a version is shared and never changes.
+        '''
+        candidate = None
+        node = self._root
+        while node is not None:
+            if value < node.value:
+                node = node.left
+            else:
+                candidate = node
+                node = node.right
+        
+        if candidate is None or candidate.value < value:
+            return None
+        return candidate
+    
+    
+    @property
+    def comparison_count(self):
+        '''
+        Return 0, since the persistent tree does not count comparisons, O(1).
+        NOTE: a counter in a version would be written by the membership test
+        of every thread reading it, and every new version would start again
+        from 0 anyway.
+        '''
+        return 0
+    
+    
+    def __node_height(self, node):
+        '''
+        Return the height of the given node, or 0 if there is no node.
+        '''
+        return 0 if node is None else node.height
+    
+    
+    def __balance(self, value, left, right):
+        '''
+        Return the root of a new balanced subtree with the given value
+        and subtrees, whose heights differ at most by two.
+        NOTE: a rotation creates new nodes instead of relinking
+        the old ones, which may be shared with other versions.
+        '''
+        left_height = self.__node_height(left)
+        right_height = self.__node_height(right)
+        
+        if left_height > right_height + 1:  # left heavy
+            if self.__node_height(left.left) < self.__node_height(left.right):
+                pivot = left.right
+                return Node(pivot.value, Node(left.value, left.left, pivot.left), Node(value, pivot.right, right))
+            return Node(left.value, left.left, Node(value, left.right, right))
+        
+        if right_height > left_height + 1:  # right heavy
+            if self.__node_height(right.right) < self.__node_height(right.left):
+                pivot = right.left
+                return Node(pivot.value, Node(value, left, pivot.left), Node(right.value, pivot.right, right.right))
+            return Node(right.value, Node(value, left, right.left), right.right)
+        
+        return Node(value, left, right)
+    
+    
+    def __recursive_add(self, node, value):
+        '''
+        Return the root of a copy of the given subtree with the value added.
+        NOTE: If the value already exists, return the same subtree.
+        '''
+        if node is None:
+            return Node(value)
+        
+        if value < node.value:
+            left = self.__recursive_add(node.left, value)
+            if left is node.left:
+                return node
+            return self.__balance(node.value, left, node.right)
+        
+        if value > node.value:
+            right = self.__recursive_add(node.right, value)
+            if right is node.right:
+                return node
+            return self.__balance(node.value, node.left, right)
+        
+        return node
+    
+    
+    def add(self, value):
+        '''
+        Return a new version of the tree with the value added,
+        or the same tree if the value already exists, O(log(n)).
+        NOTE: If the value type is not valid, raise an error.
+        '''
+        self._check_new_value(value)
+        try:
+            root = self.__recursive_add(self._root, value)
+        except TypeError:
+            raise self._uncomparable(value) from None
+        
+        return self if root is self._root else type(self).__from_root(root)
+    
+    
+    def __remove_rightmost(self, node):
+        '''
+        Return the root of a copy of the given subtree without
+        its rightmost node, together with the value of it.
+        '''
+        if node.right is None:
+            return node.left, node.value
+        
+        right, rightmost = self.__remove_rightmost(node.right)
+        return self.__balance(node.value, node.left, right), rightmost
+    
+    
+    def __recursive_remove(self, node, value):
+        '''
+        Return the root of a copy of the given subtree with the value removed.
+        NOTE: If the value does not exist, raise an error.
+        '''
+        if node is None:
+            raise ValueError(f"{value} not in tree")
+        
+        if value < node.value:
+            return self.__balance(node.value, self.__recursive_remove(node.left, value), node.right)
+        if value > node.value:
+            return self.__balance(node.value, node.left, self.__recursive_remove(node.right, value))
+        
+        # here value == node.value
+        
+        if node.left is None:  # zero children or only right child
+            return node.right
+        if node.right is None:  # only left child
+            return node.left
+        
+        # two children, the predecessor takes the place of the node
+        left, predecessor = self.__remove_rightmost(node.left)
+        return self.__balance(predecessor, left, node.right)
+    
+    
+    def remove(self, value):
+        '''
+        Return a new version of the tree with the value removed if it
+        exists in the tree, otherwise raise an error, O(log(n)).
+        NOTE: If the value type is not valid, raise an error.
+        '''
+        self._check_new_value(value)
+        try:
+            root = self.__recursive_remove(self._root, value)
+        except TypeError:
+            raise self._uncomparable(value) from None
+        
+        return type(self).__from_root(root)
+    
+    
+    def discard(self, value):
+        '''
+        Return a new version of the tree with the value removed if it
+        exists in the tree, otherwise return the same tree, O(log(n)).
+        NOTE: If the value type is not valid, raise an error.
+        '''
+        try:
+            return self.remove(value)
+        except ValueError:
+            return self
\ No newline at end of file
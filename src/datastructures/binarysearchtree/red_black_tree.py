@@ -0,0 +1,405 @@
+'''
+ * A red-black tree implementation, where every operation is iterative.
+ *
+ * Main inspiration: Introduction to Algorithms (Cormen et al.), chapter 13
+ *
+ * @author Cosimo Giovanni Negri
+ * @date   18 Oct 2026
+'''
+
+from .abstract_binary_search_tree import AbstractBinarySearchTree
+
+
+RED = True
+BLACK = False
+
+
+class Node:
+    '''
+    Node class to represent an element of the red-black tree.
+    '''
+    __slots__ = ('value', 'left', 'right', 'parent', 'color', 'height', 'size')
+    
+    def __init__(self, value, parent=None):
+        self.value = value
+        self.left = None
+        self.right = None
+        self.parent = parent
+        self.color = RED
+        self.height = 1
+        self.size = 1  # number of nodes in the subtree
+    
+    def __str__(self):
+        return str(self.value)
+
+
+class RedBlackTree(AbstractBinarySearchTree):
+    '''
+    A red-black tree implementation, with the same API of the binary search tree.
+    NOTE: every path from a node to its leaves has the same number of black nodes
+    and no red node has a red child, so the height of the tree is O(log(n)).
+    NOTE: no operation uses recursion, and at most three rotations
+    are needed to restore the properties after an addition or a removal.
+    '''
+    def _build(self, values):
+        '''
+        Fill the empty red-black tree with a perfectly balanced tree
+        containing the sorted values, without using recursion.
+        '''
+        # the deepest level may be incomplete, so its nodes are red
+        # and every path from the root has the same number of black nodes
+        red_depth = len(values).bit_length()
+        nodes = [(0, len(values), None, False, 1)]
+        
+        while nodes:
+            start, stop, parent, is_left, depth = nodes.pop()
+            if start >= stop: continue
+            
+            middle = (start + stop) // 2
+            node = Node(values[middle], parent)
+            node.size = stop - start
+            node.height = node.size.bit_length()
+            node.color = RED if depth == red_depth and depth > 1 else BLACK
+            
+            if parent is None:
+                self._root = node
+            elif is_left:
+                parent.left = node
+            else:
+                parent.right = node
+            
+            nodes.append((start, middle, node, True, depth + 1))
+            nodes.append((middle + 1, stop, node, False, depth + 1))
+    
+    
+    def clear(self):
+        '''
+        Empty the red-black tree, O(n).
+        '''
+        nodes = [] if self._root is None else [self._root]
+        while nodes:
+            node = nodes.pop()
+            if node.left is not None: nodes.append(node.left)
+            if node.right is not None: nodes.append(node.right)
+            node.value = None
+            node.left = node.right = node.parent = None
+        
+        self._modifications += 1
+        self._root = None
+    
+    
+    def __color(self, node):
+        '''
+        Return the color of the given node, where missing leaves are black.
+        '''
+        return BLACK if node is None else node.color
+    
+    
+    def __update_node(self, node):
+        '''
+        Compute again the height and the size of
+        the subtree of the given node from its children.
+        '''
+        left, right = node.left, node.right
+        left_height = 0 if left is None else left.height
+        right_height = 0 if right is None else right.height
+        node.height = (left_height if left_height > right_height else right_height) + 1
+        node.size = (0 if left is None else left.size) + (0 if right is None else right.size) + 1
+    
+    
+    def __update_path(self, node, delta):
+        '''
+        Add delta to the size of the subtree of the given node and of all
+        its ancestors, and compute again their heights until one does not change.
+        '''
+        changed = True
+        while node is not None:
+            node.size += delta
+            if changed:
+                left_height = 0 if node.left is None else node.left.height
+                right_height = 0 if node.right is None else node.right.height
+                height = (left_height if left_height > right_height else right_height) + 1
+                changed = height != node.height
+                node.height = height
+            node = node.parent
+    
+    
+    def __update_heights(self, node):
+        '''
+        Compute again the height of the subtree of the given node and of its
+        ancestors, whose sizes have not changed, until one height does not change.
+        '''
+        while node is not None:
+            left_height = 0 if node.left is None else node.left.height
+            right_height = 0 if node.right is None else node.right.height
+            height = (left_height if left_height > right_height else right_height) + 1
+            if height == node.height:
+                return
+            node.height = height
+            node = node.parent
+    
+    
+    def __replace_child(self, parent, old_child, new_child):
+        '''
+        Put the new child of the given parent in place of the old one.
+        '''
+        if parent is None:
+            self._root = new_child
+        elif parent.left is old_child:
+            parent.left = new_child
+        else:
+            parent.right = new_child
+        
+        if new_child is not None:
+            new_child.parent = parent
+    
+    
+    def __rotate_left(self, node):
+        '''
+        Make the right child of the given node the root of the subtree.
+        '''
+        height = node.height  # of the subtree before the rotation
+        pivot = node.right
+        node.right = pivot.left
+        if pivot.left is not None:
+            pivot.left.parent = node
+        
+        self.__replace_child(node.parent, node, pivot)
+        pivot.left = node
+        node.parent = pivot
+        
+        self.__update_node(node)
+        self.__update_node(pivot)
+        if pivot.height != height:
+            self.__update_heights(pivot.parent)
+    
+    
+    def __rotate_right(self, node):
+        '''
+        Make the left child of the given node the root of the subtree.
+        '''
+        height = node.height  # of the subtree before the rotation
+        pivot = node.left
+        node.left = pivot.right
+        if pivot.right is not None:
+            pivot.right.parent = node
+        
+        self.__replace_child(node.parent, node, pivot)
+        pivot.right = node
+        node.parent = pivot
+        
+        self.__update_node(node)
+        self.__update_node(pivot)
+        if pivot.height != height:
+            self.__update_heights(pivot.parent)
+    
+    
+    def __fix_after_add(self, node):
+        '''
+        Restore the red-black properties after the given red node
+        has been added, going up towards the root.
+        '''
+        while node.parent is not None and node.parent.color == RED:
+            parent = node.parent
+            grandparent = parent.parent  # it exists, since the root is black
+            
+            if parent is grandparent.left:
+                uncle = grandparent.right
+                if self.__color(uncle) == RED:
+                    # Push the black color down from the grandparent
+                    parent.color = uncle.color = BLACK
+                    grandparent.color = RED
+                    node = grandparent
+                    continue
+                
+                if node is parent.right:
+                    self.__rotate_left(parent)
+                    parent = node
+                parent.color = BLACK
+                grandparent.color = RED
+                self.__rotate_right(grandparent)
+                break  # the root of the subtree is now black
+            
+            else:
+                uncle = grandparent.left
+                if self.__color(uncle) == RED:
+                    # Push the black color down from the grandparent
+                    parent.color = uncle.color = BLACK
+                    grandparent.color = RED
+                    node = grandparent
+                    continue
+                
+                if node is parent.left:
+                    self.__rotate_right(parent)
+                    parent = node
+                parent.color = BLACK
+                grandparent.color = RED
+                self.__rotate_left(grandparent)
+                break  # the root of the subtree is now black
+        
+        self._root.color = BLACK
+    
+    
+    def add(self, value):
+        '''
+        Add a node in the right place if the value does not exist
+        in the red-black tree, otherwise do nothing, O(log(n)).
+        Return whether or not the value has been added.
+        NOTE: If the value type is not valid, raise an error.
+        '''
+        self._check_new_value(value)
+        
+        parent = None
+        is_left = False
+        candidate = None  # the last node where the descent went right
+        node = self._root
+        try:
+            while node is not None:
+                parent = node
+                self._comparisons += 1
+                is_left = value < node.value
+                if is_left:
+                    node = node.left
+                else:
+                    candidate = node
+                    node = node.right
+            
+            if candidate is not None:
+                self._comparisons += 1
+                if not candidate.value < value:
+                    return False  # the value already exists
+        except TypeError:
+            raise self._uncomparable(value) from None
+        
+        node = Node(value, parent)
+        if parent is None:
+            self._root = node
+        elif is_left:
+            parent.left = node
+        else:
+            parent.right = node
+        
+        self.__update_path(parent, 1)
+        self._modifications += 1
+        self.__fix_after_add(node)
+        return True
+    
+    
+    def __get_rightmost_child(self, node):
+        '''
+        Return the rightmost child of the given node.
+        '''
+        while node.right is not None:
+            node = node.right
+        return node
+    
+    
+    def __fix_before_remove(self, node):
+        '''
+        Restore the red-black properties before the given black leaf
+        is removed, pushing its missing black color up towards the root.
+        '''
+        while node is not self._root and node.color == BLACK:
+            parent = node.parent
+            
+            if node is parent.left:
+                sibling = parent.right  # it exists, since node is black
+                if sibling.color == RED:
+                    sibling.color = BLACK
+                    parent.color = RED
+                    self.__rotate_left(parent)
+                    sibling = parent.right
+                
+                if self.__color(sibling.left) == BLACK and self.__color(sibling.right) == BLACK:
+                    sibling.color = RED
+                    node = parent
+                    continue
+                
+                if self.__color(sibling.right) == BLACK:
+                    sibling.left.color = BLACK
+                    sibling.color = RED
+                    self.__rotate_right(sibling)
+                    sibling = parent.right
+                sibling.color = parent.color
+                parent.color = sibling.right.color = BLACK
+                self.__rotate_left(parent)
+                node = self._root
+            
+            else:
+                sibling = parent.left  # it exists, since node is black
+                if sibling.color == RED:
+                    sibling.color = BLACK
+                    parent.color = RED
+                    self.__rotate_right(parent)
+                    sibling = parent.left
+                
+                if self.__color(sibling.left) == BLACK and self.__color(sibling.right) == BLACK:
+                    sibling.color = RED
+                    node = parent
+                    continue
+                
+                if self.__color(sibling.left) == BLACK:
+                    sibling.right.color = BLACK
+                    sibling.color = RED
+                    self.__rotate_left(sibling)
+                    sibling = parent.left
+                sibling.color = parent.color
+                parent.color = sibling.left.color = BLACK
+                self.__rotate_right(parent)
+                node = self._root
+        
+        node.color = BLACK
+    
+    
+    def remove(self, value):
+        '''
+        Remove the node with a specific value if it exists in the
+        red-black tree, otherwise raise an error, O(log(n)).
+        NOTE: If the value type is not valid, raise an error.
+        '''
+        self._check_new_value(value)
+        try:
+            node = self._search(value)
+        except TypeError:
+            raise self._uncomparable(value) from None
+        
+        if node is None:
+            raise ValueError(f"{value} not in tree")
+        
+        if node.left is not None and node.right is not None:  # two children
+            temp = self.__get_rightmost_child(node.left)
+            node.value = temp.value
+            node = temp
+        
+        # here node has at most one child
+        
+        child = node.left if node.left is not None else node.right
+        if child is not None:
+            # node is black and child is a red leaf
+            self.__replace_child(node.parent, node, child)
+            child.color = BLACK
+        else:
+            if node.color == BLACK:
+                self.__fix_before_remove(node)
+            self.__replace_child(node.parent, node, None)
+        
+        # only the ancestors of the removed node still count it
+        self.__update_path(node.parent, -1)
+        
+        node.value = None
+        node.left = node.right = node.parent = None
+        self._modifications += 1
+    
+    
+    def discard(self, value):
+        '''
+        Remove the node with a specific value if it exists in the
+        red-black tree, otherwise do nothing, O(log(n)).
+        Return whether or not the value has been removed.
+        NOTE: If the value type is not valid, raise an error.
+        '''
+        try:
+            self.remove(value)
+        except ValueError:
+            return False
+        return True
\ No newline at end of file
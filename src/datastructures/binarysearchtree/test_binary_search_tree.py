@@ -12,6 +12,7 @@ import unittest
 import sys
 import os
 import random
+import math
 
 if __name__ == "__main__":
     sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
@@ -36,6 +37,23 @@ class ComparableObject:
         return self.compare > other.compare
 
 
+class CountingObject(ComparableObject):
+
+    comparisons = 0
+    
+    def __eq__(self, other):
+        CountingObject.comparisons += 1
+        return super().__eq__(other)
+    
+    def __lt__(self, other):
+        CountingObject.comparisons += 1
+        return super().__lt__(other)
+    
+    def __gt__(self, other):
+        CountingObject.comparisons += 1
+        return super().__gt__(other)
+
+
 class NonComparableObject:
     
     def __init__(self, data):
@@ -306,6 +324,56 @@ class BinarySearchTreeTest(unittest.TestCase):
             next(iter_obj)
     
     
+    def test_nested_iteration(self):
+        self.tree.add(1)
+        self.tree.add(2)
+        self.tree.add(3)
+        
+        pairs = [(a, b) for a in self.tree for b in self.tree]
+        self.assertEqual(pairs, [(a, b) for a in [1, 2, 3] for b in [1, 2, 3]])
+    
+    
+    def test_change_during_iteration(self):
+        self.tree.add(1)
+        self.tree.add(2)
+        self.tree.add(3)
+        
+        with self.assertRaises(RuntimeError):
+            for _ in self.tree:
+                self.tree.add(4)
+        with self.assertRaises(RuntimeError):
+            for _ in self.tree:
+                self.tree.remove(1)
+    
+    
+    def test_reversed(self):
+        self.assertEqual(list(reversed(self.tree)), [])
+        
+        for _ in range(self.LOOPS // 10):
+            rand_nums = self.get_rand_list()
+            for num in rand_nums:
+                self.tree.add(num)
+            
+            self.assertEqual(list(self.tree), sorted(rand_nums))
+            self.assertEqual(list(reversed(self.tree)), sorted(rand_nums, reverse=True))
+            self.tree.clear()
+    
+    
+    def test_lazy_iteration(self):
+        # a degenerate tree, where every node is a left child
+        for num in range(self.MAX_RANDOM_NUM):
+            self.tree.add(-num)
+        
+        iter_obj = iter(self.tree)
+        self.assertEqual(next(iter_obj), -(self.MAX_RANDOM_NUM - 1))
+        self.assertEqual(next(iter_obj), -(self.MAX_RANDOM_NUM - 2))
+        self.assertEqual(next(reversed(self.tree)), 0)
+        
+        for value in self.tree:
+            break
+        self.assertEqual(value, -(self.MAX_RANDOM_NUM - 1))
+    
+    
     def test_to_string(self):
         self.assertEqual(str(self.tree), "[]")
         self.tree.add("H")
@@ -322,6 +390,336 @@ class BinarySearchTreeTest(unittest.TestCase):
         self.assertEqual(str(self.tree), "[D, F, N, X]")
     
     
+    def test_rank_select(self):
+        with self.assertRaises(IndexError):
+            self.tree.select(0)
+        self.assertEqual(self.tree.rank(5), 0)
+        
+        for _ in range(self.LOOPS // 10):
+            rand_nums = self.get_rand_list()
+            for num in rand_nums:
+                self.tree.add(num)
+            # the sizes must follow the removals and the rotations too
+            for num in rand_nums[:self.SIZE // 4]:
+                self.tree.remove(num)
+            
+            values = sorted(rand_nums[self.SIZE // 4:])
+            for index, value in enumerate(values):
+                self.assertEqual(self.tree.select(index), value)
+                self.assertEqual(self.tree.select(index - len(values)), value)
+                self.assertEqual(self.tree.rank(value), index)
+                self.assertEqual(self.tree.rank(value + 0.5), index + 1)
+            
+            with self.assertRaises(IndexError):
+                self.tree.select(len(values))
+            with self.assertRaises(IndexError):
+                self.tree.select(-len(values) - 1)
+            self.tree.clear()
+    
+    
+    def test_count_range(self):
+        self.assertEqual(self.tree.count_range(1, 10), 0)
+        
+        for num in range(0, 100, 10):
+            self.tree.add(num)
+        
+        self.assertEqual(self.tree.count_range(0, 90), 10)
+        self.assertEqual(self.tree.count_range(10, 30), 3)
+        self.assertEqual(self.tree.count_range(5, 35), 3)
+        self.assertEqual(self.tree.count_range(-100, 5), 1)
+        self.assertEqual(self.tree.count_range(91, 200), 0)
+        self.assertEqual(self.tree.count_range(30, 30), 1)
+        self.assertEqual(self.tree.count_range(30, 10), 0)
+        
+        with self.assertRaises(TypeError):
+            self.tree.count_range("A", "B")
+    
+    
+    def test_nth_smallest(self):
+        for num in [5, 1, 4, 2, 3]:
+            self.tree.add(num)
+        
+        for n in range(1, 6):
+            self.assertEqual(self.tree.nth_smallest(n), n)
+        with self.assertRaises(IndexError):
+            self.tree.nth_smallest(0)
+        with self.assertRaises(IndexError):
+            self.tree.nth_smallest(6)
+    
+    
+    def test_percentile(self):
+        with self.assertRaises(IndexError):
+            self.tree.percentile(50)
+        
+        for num in range(1, 101):
+            self.tree.add(num)
+        
+        self.assertEqual(self.tree.percentile(0), 1)
+        self.assertEqual(self.tree.percentile(50), 50)
+        self.assertEqual(self.tree.percentile(99), 99)
+        self.assertEqual(self.tree.percentile(99.5), 100)
+        self.assertEqual(self.tree.percentile(100), 100)
+        
+        with self.assertRaises(ValueError):
+            self.tree.percentile(101)
+        with self.assertRaises(ValueError):
+            self.tree.percentile(-1)
+    
+    
+    def test_navigation(self):
+        self.assertIsNone(self.tree.floor(5))
+        self.assertIsNone(self.tree.higher(5))
+        
+        for num in range(0, 100, 10):
+            self.tree.add(num)
+        
+        self.assertEqual(self.tree.floor(30), 30)
+        self.assertEqual(self.tree.floor(35), 30)
+        self.assertIsNone(self.tree.floor(-1))
+        self.assertEqual(self.tree.ceiling(30), 30)
+        self.assertEqual(self.tree.ceiling(35), 40)
+        self.assertIsNone(self.tree.ceiling(91))
+        
+        self.assertEqual(self.tree.lower(30), 20)
+        self.assertEqual(self.tree.lower(35), 30)
+        self.assertIsNone(self.tree.lower(0))
+        self.assertEqual(self.tree.higher(30), 40)
+        self.assertEqual(self.tree.higher(25), 30)
+        self.assertIsNone(self.tree.higher(90))
+        
+        with self.assertRaises(TypeError):
+            self.tree.floor("A")
+    
+    
+    def test_random_navigation(self):
+        for _ in range(self.LOOPS // 10):
+            rand_nums = self.get_rand_list()
+            for num in rand_nums:
+                self.tree.add(num)
+            
+            for value in range(-1, self.MAX_RANDOM_NUM + 1):
+                below = [num for num in rand_nums if num < value]
+                above = [num for num in rand_nums if num > value]
+                self.assertEqual(self.tree.lower(value), max(below, default=None))
+                self.assertEqual(self.tree.higher(value), min(above, default=None))
+                if value in rand_nums:
+                    self.assertEqual(self.tree.floor(value), value)
+                    self.assertEqual(self.tree.ceiling(value), value)
+            self.tree.clear()
+    
+    
+    def test_irange(self):
+        self.assertEqual(list(self.tree.irange(1, 10)), [])
+        
+        for num in range(0, 100, 10):
+            self.tree.add(num)
+        
+        self.assertEqual(list(self.tree.irange(20, 50)), [20, 30, 40, 50])
+        self.assertEqual(list(self.tree.irange(15, 55)), [20, 30, 40, 50])
+        self.assertEqual(list(self.tree.irange(20, 50, inclusive=(False, True))), [30, 40, 50])
+        self.assertEqual(list(self.tree.irange(20, 50, inclusive=(True, False))), [20, 30, 40])
+        self.assertEqual(list(self.tree.irange(20, 50, inclusive=(False, False))), [30, 40])
+        self.assertEqual(list(self.tree.irange(hi=20)), [0, 10, 20])
+        self.assertEqual(list(self.tree.irange(lo=70)), [70, 80, 90])
+        self.assertEqual(list(self.tree.irange()), list(self.tree))
+        self.assertEqual(list(self.tree.irange(50, 20)), [])
+        self.assertEqual(list(self.tree.irange(91, 200)), [])
+        
+        with self.assertRaises(TypeError):
+            self.tree.irange("A", "B")
+    
+    
+    def test_lazy_irange(self):
+        for num in range(self.MAX_RANDOM_NUM):
+            self.tree.add(num)
+        
+        iter_obj = self.tree.irange(100)
+        self.assertEqual(next(iter_obj), 100)
+        self.assertEqual(next(iter_obj), 101)
+        
+        with self.assertRaises(RuntimeError):
+            for _ in self.tree.irange(10, 20):
+                self.tree.remove(15)
+    
+    
+    def test_from_sorted(self):
+        tree_class = type(self.tree)
+        self.assertEqual(len(tree_class.from_sorted([])), 0)
+        
+        for size in [1, 2, 3, 7, 8, 100, 2 ** 12]:
+            tree = tree_class.from_sorted(range(size))
+            self.assertEqual(len(tree), size)
+            self.assertEqual(list(tree), list(range(size)))
+            self.assertEqual(tree.height(), size.bit_length())
+            self.assertEqual(tree.select(size // 3), size // 3)
+        
+        # the tree must keep working as usual
+        tree = tree_class.from_sorted([1, 1, 2, 3, 3, 3, 5])
+        self.assertEqual(list(tree), [1, 2, 3, 5])
+        tree.add(4)
+        tree.remove(1)
+        self.assertEqual(list(tree), [2, 3, 4, 5])
+        self.assertEqual(tree.rank(5), 3)
+    
+    
+    def test_from_sorted_invalid(self):
+        tree_class = type(self.tree)
+        with self.assertRaises(ValueError):
+            tree_class.from_sorted([1, 3, 2])
+        with self.assertRaises(TypeError):
+            tree_class.from_sorted([1, "A"])
+        with self.assertRaises(TypeError):
+            tree_class.from_sorted([1, True])
+        with self.assertRaises(TypeError):
+            tree_class.from_sorted([None])
+    
+    
+    def test_from_iterable(self):
+        tree_class = type(self.tree)
+        rand_nums = self.get_rand_list()
+        
+        tree = tree_class.from_iterable(rand_nums + rand_nums)
+        self.assertEqual(list(tree), sorted(rand_nums))
+        self.assertEqual(tree.height(), len(rand_nums).bit_length())
+        
+        with self.assertRaises(TypeError):
+            tree_class.from_iterable([1, "A"])
+    
+    
+    def test_stats(self):
+        self.assertEqual(self.tree.stats(), {'size': 0, 'height': 0, 'optimal_height': 0, 'height_ratio': 1.0})
+        
+        for num in [4, 2, 6, 1, 3, 5, 7]:
+            self.tree.add(num)
+        self.assertEqual(self.tree.stats(), {'size': 7, 'height': 3, 'optimal_height': 3, 'height_ratio': 1.0})
+        
+        self.tree.add(8)
+        self.tree.add(9)
+        stats = self.tree.stats()
+        self.assertEqual(stats['size'], 9)
+        self.assertEqual(stats['optimal_height'], 4)
+        self.assertEqual(stats['height_ratio'], stats['height'] / 4)
+    
+    
+    def test_random_height(self):
+        for _ in range(self.LOOPS // 10):
+            rand_nums = self.get_rand_list()
+            for num in rand_nums:
+                self.tree.add(num)
+                self.assertEqual(self.tree.height(), self.preorder_height())
+            for num in rand_nums[:self.SIZE // 2]:
+                self.tree.remove(num)
+                self.assertEqual(self.tree.height(), self.preorder_height())
+            self.tree.clear()
+            self.assertEqual(self.tree.height(), 0)
+    
+    
+    def test_sorted_values(self):
+        # far deeper than the recursion limit if the tree is not balanced
+        size = 3000
+        for num in range(size):
+            self.tree.add(num)
+        self.assertEqual(len(self.tree), size)
+        if isinstance(self.tree, BinarySearchTree) and not self.tree.balanced:
+            self.assertEqual(self.tree.height(), size)
+        else:
+            self.assertLessEqual(self.tree.height(), 2 * 12)
+        self.assertFalse(self.tree.add(size - 1))
+        
+        for num in range(0, size, 2):
+            self.tree.remove(num)
+        self.assertEqual(list(self.tree), list(range(1, size, 2)))
+        
+        self.tree.clear()
+        self.assertEqual(len(self.tree), 0)
+        self.assertEqual(self.tree.height(), 0)
+    
+    
+    def preorder_height(self):
+        '''
+        Compute the height of the tree from scratch, rebuilding
+        the subtrees from the pre-order list of values.
+        '''
+        values = self.tree.preorder()
+        
+        def height(lo, hi):
+            if lo >= hi:
+                return 0
+            split = lo + 1
+            while split < hi and values[split] < values[lo]:
+                split += 1
+            return max(height(lo + 1, split), height(split, hi)) + 1
+        
+        return height(0, len(values))
+    
+    
+    def test_add_discard(self):
+        self.assertTrue(self.tree.add(1))
+        self.assertFalse(self.tree.add(1))
+        self.assertTrue(self.tree.add(2))
+        self.assertEqual(len(self.tree), 2)
+        
+        self.assertTrue(self.tree.discard(1))
+        self.assertFalse(self.tree.discard(1))
+        self.assertEqual(len(self.tree), 1)
+        with self.assertRaises(ValueError):
+            self.tree.remove(1)
+        with self.assertRaises(TypeError):
+            self.tree.discard("A")
+        
+        self.assertTrue(self.tree.discard(2))
+        self.assertTrue(self.tree.isempty())
+    
+    
+    def test_failed_operations(self):
+        # a failed operation must leave the tree untouched
+        for num in range(self.SIZE):
+            self.tree.add(num)
+        stats = self.tree.stats()
+        
+        with self.assertRaises(TypeError):
+            self.tree.add("A")
+        with self.assertRaises(TypeError):
+            self.tree.remove("A")
+        with self.assertRaises(ValueError):
+            self.tree.remove(self.SIZE)
+        
+        self.assertEqual(self.tree.stats(), stats)
+        self.assertEqual(list(self.tree), list(range(self.SIZE)))
+    
+    
+    def test_comparison_count(self):
+        size = 2 ** 10 - 1
+        objects = [CountingObject(i, i) for i in range(size)]
+        self.tree = type(self.tree).from_sorted(objects)
+        self.assertEqual(self.tree.height(), 10)
+        
+        for object in objects[::10]:
+            for operation in (self.tree.__contains__, self.tree.discard, self.tree.add):
+                height = self.tree.height()
+                count = self.tree.comparison_count
+                CountingObject.comparisons = 0
+                operation(object)
+                
+                # the hook counts every comparison, one per level and one for equality
+                self.assertEqual(self.tree.comparison_count - count, CountingObject.comparisons)
+                self.assertLessEqual(CountingObject.comparisons, height + 1)
+    
+    
+    def test_comparison_count_balanced(self):
+        size = 2 ** 12
+        self.tree = type(self.tree).from_sorted(CountingObject(i, i) for i in range(size))
+        lookups = [CountingObject(i, i) for i in range(-1, size + 1)]
+        
+        count = self.tree.comparison_count
+        for object in lookups:
+            self.assertEqual(object in self.tree, 0 <= object.compare < size)
+        
+        # about log2(n) + 1, instead of about 2 * log2(n) with < and > at every node
+        average = (self.tree.comparison_count - count) / len(lookups)
+        self.assertLessEqual(average, math.log2(size) + 2)
+    
+    
     def get_rand_list(self):
         '''
         Generate a list of random numbers.
@@ -331,5 +729,132 @@ class BinarySearchTreeTest(unittest.TestCase):
         return list
 
 
+class BalancedBinarySearchTreeTest(BinarySearchTreeTest):
+
+    def setUp(self):
+        super().setUp()
+        self.tree = BinarySearchTree(balanced=True)
+    
+    
+    def test_balanced(self):
+        self.assertTrue(self.tree.balanced)
+        self.assertFalse(BinarySearchTree().balanced)
+    
+    
+    def test_height(self):
+        # Tree should look like:
+        #        M
+        #      B   S
+        #     A J N Z
+        
+        self.assertEqual(self.tree.height(), 0)
+        
+        for value in ["M", "J", "S", "B", "N", "Z"]:
+            self.tree.add(value)
+        self.assertEqual(self.tree.height(), 3)
+        
+        # J would be left heavy, so it is rotated
+        self.tree.add("A")
+        self.assertEqual(self.tree.height(), 3)
+        self.assertEqual(self.tree.levelorder(), ["M", "B", "S", "A", "J", "N", "Z"])
+    
+    
+    def test_traversal(self):
+        self.assertEqual(self.tree.inorder(), [])
+        self.assertEqual(self.tree.preorder(), [])
+        self.assertEqual(self.tree.postorder(), [])
+        self.assertEqual(self.tree.levelorder(), [])
+        
+        # Tree should look like:
+        #        5
+        #      2   10
+        #    1  3 7  13
+        
+        self.tree.add(5)
+        self.tree.add(3)
+        self.tree.add(10)
+        self.tree.add(2)
+        self.tree.add(1)
+        self.tree.add(7)
+        self.tree.add(13)
+        
+        self.assertEqual(self.tree.inorder(), [1, 2, 3, 5, 7, 10, 13])
+        self.assertEqual(self.tree.preorder(), [5, 2, 1, 3, 10, 7, 13])
+        self.assertEqual(self.tree.postorder(), [1, 3, 2, 7, 13, 10, 5])
+        self.assertEqual(self.tree.levelorder(), [5, 2, 10, 1, 3, 7, 13])
+    
+    
+    def test_rotations(self):
+        # left-left, right-right, left-right and right-left cases
+        for values in ([3, 2, 1], [1, 2, 3], [3, 1, 2], [1, 3, 2]):
+            self.tree.clear()
+            for value in values:
+                self.tree.add(value)
+            self.assertEqual(self.tree.preorder(), [2, 1, 3])
+            self.assertEqual(self.tree.height(), 2)
+    
+    
+    def test_sorted_add(self):
+        # far more values than the recursion limit allows without balancing
+        size = 2 ** 12
+        for num in range(size):
+            self.tree.add(num)
+        
+        self.assertEqual(len(self.tree), size)
+        self.assertEqual(list(self.tree), list(range(size)))
+        # an AVL tree is at most about 1.44 times as high as a perfect one
+        self.assertLessEqual(self.tree.height(), 1.44 * 12 + 1)
+        
+        for num in range(0, size, 2):
+            self.tree.remove(num)
+        self.assertEqual(list(self.tree), list(range(1, size, 2)))
+        self.assertLessEqual(self.tree.height(), 1.44 * 11 + 1)
+    
+    
+    def test_from_sorted_balanced(self):
+        self.tree = BinarySearchTree.from_sorted(range(self.MAX_RANDOM_NUM), balanced=True)
+        self.assertTrue(self.tree.balanced)
+        self.assert_balanced()
+        
+        for num in range(self.MAX_RANDOM_NUM, self.MAX_RANDOM_NUM * 2):
+            self.tree.add(num)
+        self.assert_balanced()
+    
+    
+    def test_random_balance(self):
+        for _ in range(self.LOOPS // 10):
+            rand_nums = self.get_rand_list()
+            for num in rand_nums:
+                self.tree.add(num)
+            for num in rand_nums[:self.SIZE // 2]:
+                self.tree.remove(num)
+            
+            self.assert_balanced()
+            self.tree.clear()
+    
+    
+    def assert_balanced(self):
+        '''
+        Check that the heights of the two subtrees
+        of every node differ at most by one.
+        '''
+        values = self.tree.preorder()
+        
+        def height(lo, hi):
+            # rebuild the subtrees from the pre-order list
+            if lo >= hi:
+                return 0
+            root = values[lo]
+            split = lo + 1
+            while split < hi and values[split] < root:
+                split += 1
+            left = height(lo + 1, split)
+            right = height(split, hi)
+            self.assertLessEqual(abs(left - right), 1)
+            return max(left, right) + 1
+        
+        self.assertEqual(height(0, len(values)), self.tree.height())
+
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,180 @@
+'''
+ * An interval tree unit test.
+ *
+ * @author Cosimo Giovanni Negri
+ * @date   18 Oct 2026
+'''
+
+import unittest
+import sys
+import os
+import math
+import random
+
+if __name__ == "__main__":
+    sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+    from datastructures.binarysearchtree.interval_tree import IntervalTree
+    from datastructures.binarysearchtree.test_binary_search_tree import NonComparableObject
+else:
+    from .interval_tree import IntervalTree
+    from .test_binary_search_tree import NonComparableObject
+
+
+class IntervalTreeTest(unittest.TestCase):
+
+    def setUp(self):
+        self.LOOPS = 200
+        self.SIZE = 40
+        self.MAX_RANDOM_NUM = 250
+        
+        self.tree = IntervalTree()
+    
+    
+    def test_empty_tree(self):
+        self.assertTrue(self.tree.isempty())
+        self.assertEqual(len(self.tree), 0)
+        self.assertEqual(self.tree.height(), 0)
+        self.assertEqual(list(self.tree), [])
+        self.assertEqual(self.tree.overlap(1, 5), [])
+        self.assertEqual(self.tree.stab(1), [])
+        
+        self.tree.add(1, 5)
+        self.assertFalse(self.tree.isempty())
+        self.tree.clear()
+        self.assertTrue(self.tree.isempty())
+    
+    
+    def test_add(self):
+        self.tree.add(5, 8)
+        self.tree.add(1, 3)
+        self.tree.add(1, 2)
+        self.tree.add(4, 4)
+        
+        self.assertEqual(len(self.tree), 4)
+        self.assertEqual(list(self.tree), [(1, 2), (1, 3), (4, 4), (5, 8)])
+        self.assertTrue((4, 4) in self.tree)
+        self.assertFalse((4, 5) in self.tree)
+    
+    
+    def test_duplicates(self):
+        # two bookings of the same window are both kept
+        self.tree.add(1, 3)
+        self.tree.add(2, 6)
+        self.tree.add(1, 3)
+        self.assertEqual(len(self.tree), 3)
+        self.assertEqual(self.tree.count(1, 3), 2)
+        self.assertEqual(self.tree.count(4, 5), 0)
+        self.assertEqual(list(self.tree), [(1, 3), (1, 3), (2, 6)])
+        self.assertEqual(self.tree.stab(2), [(1, 3), (1, 3), (2, 6)])
+        self.assertEqual(str(self.tree), "[[1, 3], [1, 3], [2, 6]]")
+        
+        self.tree.remove(1, 3)
+        self.assertEqual(self.tree.count(1, 3), 1)
+        self.assertEqual(self.tree.overlap(0, 1), [(1, 3)])
+        self.assertTrue(self.tree.discard(1, 3))
+        self.assertFalse(self.tree.discard(1, 3))
+        self.assertFalse((1, 3) in self.tree)
+        self.assertEqual(len(self.tree), 1)
+    
+    
+    def test_remove(self):
+        self.tree.add(1, 3)
+        with self.assertRaises(ValueError):
+            self.tree.remove(1, 4)
+        self.assertFalse(self.tree.discard(2, 3))
+        
+        self.tree.add(2, 6)
+        self.tree.remove(1, 3)
+        self.assertEqual(list(self.tree), [(2, 6)])
+        self.assertTrue(self.tree.discard(2, 6))
+        self.assertEqual(len(self.tree), 0)
+    
+    
+    def test_invalid_intervals(self):
+        with self.assertRaises(ValueError):
+            self.tree.add(5, 1)
+        with self.assertRaises(TypeError):
+            self.tree.add(True, 3)
+        with self.assertRaises(TypeError):
+            self.tree.add(None, 3)
+        with self.assertRaises(TypeError):
+            self.tree.add(NonComparableObject(1), NonComparableObject(2))
+        
+        self.tree.add(1, 3)
+        with self.assertRaises(TypeError):
+            self.tree.add("A", "B")
+        with self.assertRaises(TypeError):
+            self.tree.stab("A")
+        with self.assertRaises(ValueError):
+            self.tree.overlap(3, 1)
+        self.assertEqual(list(self.tree), [(1, 3)])
+    
+    
+    def test_overlap(self):
+        for start, end in [(1, 3), (2, 6), (5, 5), (7, 10), (8, 9), (12, 15)]:
+            self.tree.add(start, end)
+        
+        self.assertEqual(self.tree.overlap(4, 7), [(2, 6), (5, 5), (7, 10)])
+        self.assertEqual(self.tree.overlap(3, 3), [(1, 3), (2, 6)])
+        self.assertEqual(self.tree.overlap(10, 12), [(7, 10), (12, 15)])
+        self.assertEqual(self.tree.overlap(11, 11), [])
+        self.assertEqual(self.tree.overlap(0, 100), list(self.tree))
+        self.assertEqual(self.tree.overlap(16, 20), [])
+    
+    
+    def test_stab(self):
+        for start, end in [(1, 3), (2, 6), (5, 5), (7, 10), (8, 9)]:
+            self.tree.add(start, end)
+        
+        self.assertEqual(self.tree.stab(5), [(2, 6), (5, 5)])
+        self.assertEqual(self.tree.stab(8), [(7, 10), (8, 9)])
+        self.assertEqual(self.tree.stab(1), [(1, 3)])
+        self.assertEqual(self.tree.stab(0), [])
+        self.assertEqual(self.tree.stab(6.5), [])
+    
+    
+    def test_random_operations(self):
+        python_list = []
+        
+        for _ in range(self.LOOPS * 5):
+            start = random.randrange(self.MAX_RANDOM_NUM)
+            end = start + random.randrange(self.SIZE)
+            if random.random() < 0.6:
+                self.tree.add(start, end)
+                python_list.append((start, end))
+            else:
+                self.assertEqual(self.tree.discard(start, end), (start, end) in python_list)
+                if (start, end) in python_list:
+                    python_list.remove((start, end))
+            
+            self.assertEqual(len(self.tree), len(python_list))
+            self.assertEqual(self.tree.count(start, end), python_list.count((start, end)))
+            
+            # the greatest ends of the subtrees must be updated by every rotation
+            lo = random.randrange(self.MAX_RANDOM_NUM)
+            hi = lo + random.randrange(self.SIZE // 4)
+            expected = sorted(interval for interval in python_list if interval[0] <= hi and interval[1] >= lo)
+            self.assertEqual(self.tree.overlap(lo, hi), expected)
+        
+        self.assertEqual(list(self.tree), sorted(python_list))
+        self.assertLess(self.tree.height(), 1.45 * math.log2(len(self.tree) + 2))
+    
+    
+    def test_change_during_iteration(self):
+        for start in range(self.SIZE):
+            self.tree.add(start, start + 1)
+        
+        with self.assertRaises(RuntimeError):
+            for start, end in self.tree:
+                self.tree.remove(start, end)
+    
+    
+    def test_to_string(self):
+        self.assertEqual(str(self.tree), "[]")
+        self.tree.add(4, 6)
+        self.tree.add(1, 2)
+        self.assertEqual(str(self.tree), "[[1, 2], [4, 6]]")
+
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,259 @@
+'''
+ * A persistent tree unit test.
+ *
+ * @author Cosimo Giovanni Negri
+ * @date   18 Oct 2026
+'''
+
+import unittest
+import sys
+import os
+import math
+import random
+import threading
+
+if __name__ == "__main__":
+    sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+    from datastructures.binarysearchtree.persistent_tree import PersistentTree
+    from datastructures.binarysearchtree.test_binary_search_tree import NonComparableObject
+else:
+    from .persistent_tree import PersistentTree
+    from .test_binary_search_tree import NonComparableObject
+
+
+class PersistentTreeTest(unittest.TestCase):
+
+    def setUp(self):
+        self.LOOPS = 200
+        self.SIZE = 40
+        self.MAX_RANDOM_NUM = 250
+        
+        self.tree = PersistentTree()
+    
+    
+    def test_empty_tree(self):
+        self.assertTrue(self.tree.isempty())
+        self.assertEqual(len(self.tree), 0)
+        self.assertEqual(self.tree.height(), 0)
+        self.assertEqual(self.tree.inorder(), [])
+        self.assertFalse(3 in self.tree)
+        with self.assertRaises(ValueError):
+            self.tree.getmin()
+        with self.assertRaises(ValueError):
+            self.tree.getmax()
+        
+        tree = self.tree.add(3)
+        self.assertFalse(tree.isempty())
+        self.assertTrue(tree.clear().isempty())
+        self.assertEqual(tree.inorder(), [3])
+    
+    
+    def test_add(self):
+        first = self.tree.add("B")
+        second = first.add("A")
+        third = second.add("C")
+        
+        self.assertEqual(self.tree.inorder(), [])
+        self.assertEqual(first.inorder(), ["B"])
+        self.assertEqual(second.inorder(), ["A", "B"])
+        self.assertEqual(third.inorder(), ["A", "B", "C"])
+        self.assertEqual(len(third), 3)
+        
+        # adding an existing value gives back the same version
+        self.assertIs(third.add("A"), third)
+    
+    
+    def test_remove(self):
+        tree = PersistentTree.from_iterable(["A", "B", "C"])
+        with self.assertRaises(ValueError):
+            tree.remove("D")
+        self.assertIs(tree.discard("D"), tree)
+        
+        removed = tree.remove("B")
+        self.assertEqual(removed.inorder(), ["A", "C"])
+        self.assertEqual(tree.inorder(), ["A", "B", "C"])
+        self.assertEqual(removed.discard("A").discard("C").inorder(), [])
+    
+    
+    def test_invalid_values(self):
+        with self.assertRaises(TypeError):
+            self.tree.add(True)
+        with self.assertRaises(TypeError):
+            self.tree.add(None)
+        with self.assertRaises(TypeError):
+            self.tree.add(NonComparableObject("data"))
+        
+        tree = self.tree.add(1)
+        with self.assertRaises(TypeError):
+            tree.add("A")
+        with self.assertRaises(TypeError):
+            tree.remove("A")
+        with self.assertRaises(TypeError):
+            tree.floor("A")
+        self.assertEqual(tree.inorder(), [1])
+    
+    
+    def test_versions(self):
+        versions = [self.tree]
+        python_sets = [set()]
+        
+        for _ in range(self.LOOPS):
+            num = random.randrange(self.MAX_RANDOM_NUM)
+            python_set = set(python_sets[-1])
+            if random.random() < 0.6:
+                versions.append(versions[-1].add(num))
+                python_set.add(num)
+            else:
+                versions.append(versions[-1].discard(num))
+                python_set.discard(num)
+            python_sets.append(python_set)
+        
+        # every old version is still the same
+        for tree, python_set in zip(versions, python_sets):
+            self.assertEqual(tree.inorder(), sorted(python_set))
+            self.assertEqual(list(reversed(tree)), sorted(python_set, reverse=True))
+            self.assertEqual(len(tree), len(python_set))
+    
+    
+    def test_random_balance(self):
+        for _ in range(self.LOOPS // 10):
+            tree = self.tree
+            python_set = set()
+            for _ in range(self.SIZE * 5):
+                num = random.randrange(self.MAX_RANDOM_NUM)
+                if random.random() < 0.7:
+                    tree = tree.add(num)
+                    python_set.add(num)
+                else:
+                    tree = tree.discard(num)
+                    python_set.discard(num)
+            
+            # the height of an AVL tree is less than 1.45 * log2(n + 2)
+            self.assertEqual(tree.inorder(), sorted(python_set))
+            self.assertLess(tree.height(), 1.45 * math.log2(len(tree) + 2))
+        
+        for num in range(self.SIZE * 10):
+            tree = tree.add(self.MAX_RANDOM_NUM + num)
+        self.assertLess(tree.height(), 1.45 * math.log2(len(tree) + 2))
+    
+    
+    def test_rank_select(self):
+        rand_nums = self.get_rand_list()
+        tree = PersistentTree.from_iterable(rand_nums)
+        values = sorted(rand_nums)
+        
+        for index, value in enumerate(values):
+            self.assertEqual(tree.select(index), value)
+            self.assertEqual(tree.select(index - len(values)), value)
+            self.assertEqual(tree.rank(value), index)
+            self.assertEqual(tree.nth_smallest(index + 1), value)
+        
+        with self.assertRaises(IndexError):
+            tree.select(len(values))
+        self.assertEqual(tree.count_range(values[2], values[9]), 8)
+        self.assertEqual(tree.percentile(100), values[-1])
+        self.assertEqual(tree.percentile(0), values[0])
+    
+    
+    def test_navigation(self):
+        tree = PersistentTree.from_sorted(range(0, 100, 10))
+        
+        self.assertEqual(tree.floor(35), 30)
+        self.assertIsNone(tree.floor(-1))
+        self.assertEqual(tree.ceiling(30), 30)
+        self.assertIsNone(tree.ceiling(91))
+        self.assertEqual(tree.lower(30), 20)
+        self.assertEqual(tree.higher(30), 40)
+        self.assertEqual(tree.getmin(), 0)
+        self.assertEqual(tree.getmax(), 90)
+    
+    
+    def test_irange(self):
+        tree = PersistentTree.from_sorted(range(0, 100, 10))
+        
+        self.assertEqual(list(tree.irange(15, 55)), [20, 30, 40, 50])
+        self.assertEqual(list(tree.irange(20, 50, inclusive=(False, False))), [30, 40])
+        self.assertEqual(list(tree.irange(hi=20)), [0, 10, 20])
+        self.assertEqual(list(tree.irange(50, 20)), [])
+    
+    
+    def test_iteration_during_changes(self):
+        tree = PersistentTree.from_sorted(range(self.SIZE))
+        
+        # the iterator keeps seeing its version, so no error is raised
+        values = []
+        for num in tree:
+            values.append(num)
+            tree = tree.remove(num).add(num + self.SIZE)
+        self.assertEqual(values, list(range(self.SIZE)))
+        self.assertEqual(tree.inorder(), list(range(self.SIZE, self.SIZE * 2)))
+    
+    
+    def test_snapshot_threads(self):
+        shared = {'tree': PersistentTree()}
+        errors = []
+        done = threading.Event()
+        
+        def writer():
+            tree = shared['tree']
+            for num in range(self.SIZE * 50):
+                tree = tree.add(num)
+                if num % 2:
+                    tree = tree.remove(num - 1)
+                shared['tree'] = tree
+            done.set()
+        
+        def reader():
+            while not done.is_set():
+                snapshot = shared['tree']
+                values = list(snapshot)
+                if len(values) != len(snapshot) or values != sorted(values):
+                    errors.append(values)
+        
+        threads = [threading.Thread(target=writer)] + [threading.Thread(target=reader) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        self.assertEqual(errors, [])
+        self.assertEqual(len(shared['tree']), self.SIZE * 25)
+    
+    
+    def test_comparison_count(self):
+        tree = self.tree.add(2).add(1).add(3)
+        self.assertTrue(2 in tree)
+        self.assertFalse(4 in tree)
+        self.assertEqual(tree.comparison_count, 0)
+        self.assertEqual(tree.remove(2).comparison_count, 0)
+    
+    
+    def test_to_string(self):
+        self.assertEqual(str(self.tree), "[]")
+        self.assertEqual(str(PersistentTree.from_iterable("HDOF")), "[D, F, H, O]")
+    
+    
+    def test_subclass(self):
+        class TaggedTree(PersistentTree):
+            pass
+        
+        tree = TaggedTree.from_iterable([3, 1, 2])
+        versions = [tree, tree.add(4), tree.add(2), tree.remove(1), tree.discard(1), tree.discard(5), tree.clear()]
+        for version in versions:
+            self.assertIsInstance(version, TaggedTree)
+        self.assertEqual(versions[1].inorder(), [1, 2, 3, 4])
+        self.assertEqual(versions[3].inorder(), [2, 3])
+        self.assertTrue(versions[-1].isempty())
+    
+    
+    def get_rand_list(self):
+        '''
+        Generate a list of random numbers.
+        '''
+        list = random.sample(range(0, self.MAX_RANDOM_NUM), self.SIZE)
+        random.shuffle(list)
+        return list
+
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,128 @@
+'''
+ * A red-black tree unit test.
+ *
+ * NOTE: all the tests of the binary search tree are inherited,
+ * since the two trees must expose the same public API.
+ *
+ * @author Cosimo Giovanni Negri
+ * @date   18 Oct 2026
+'''
+
+import unittest
+import sys
+import os
+import math
+import random
+
+if __name__ == "__main__":
+    sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+    from datastructures.binarysearchtree.red_black_tree import RedBlackTree
+    from datastructures.binarysearchtree.test_binary_search_tree import BinarySearchTreeTest
+else:
+    from .red_black_tree import RedBlackTree
+    from .test_binary_search_tree import BinarySearchTreeTest
+
+
+class RedBlackTreeTest(BinarySearchTreeTest):
+
+    def setUp(self):
+        super().setUp()
+        self.tree = RedBlackTree()
+    
+    
+    def test_height(self):
+        # Tree should look like:
+        #        M
+        #      B   S
+        #     A J N Z
+        
+        self.assertEqual(self.tree.height(), 0)
+        
+        for value in ["M", "J", "S", "B", "N", "Z"]:
+            self.tree.add(value)
+        self.assertEqual(self.tree.height(), 3)
+        
+        # B and A would be two red nodes in a row, so J is rotated
+        self.tree.add("A")
+        self.assertEqual(self.tree.height(), 3)
+        self.assertEqual(self.tree.levelorder(), ["M", "B", "S", "A", "J", "N", "Z"])
+    
+    
+    def test_traversal(self):
+        self.assertEqual(self.tree.inorder(), [])
+        self.assertEqual(self.tree.preorder(), [])
+        self.assertEqual(self.tree.postorder(), [])
+        self.assertEqual(self.tree.levelorder(), [])
+        
+        # Tree should look like:
+        #        5
+        #      2   10
+        #    1  3 7  13
+        
+        self.tree.add(5)
+        self.tree.add(3)
+        self.tree.add(10)
+        self.tree.add(2)
+        self.tree.add(1)
+        self.tree.add(7)
+        self.tree.add(13)
+        
+        self.assertEqual(self.tree.inorder(), [1, 2, 3, 5, 7, 10, 13])
+        self.assertEqual(self.tree.preorder(), [5, 2, 1, 3, 10, 7, 13])
+        self.assertEqual(self.tree.postorder(), [1, 3, 2, 7, 13, 10, 5])
+        self.assertEqual(self.tree.levelorder(), [5, 2, 10, 1, 3, 7, 13])
+    
+    
+    def test_rotations(self):
+        # left-left, right-right, left-right and right-left cases
+        for values in ([3, 2, 1], [1, 2, 3], [3, 1, 2], [1, 3, 2]):
+            self.tree.clear()
+            for value in values:
+                self.tree.add(value)
+            self.assertEqual(self.tree.preorder(), [2, 1, 3])
+    
+    
+    def test_sorted_add(self):
+        # far more values than the recursion limit would allow
+        size = 2 ** 12
+        for num in range(size):
+            self.tree.add(num)
+        
+        self.assertEqual(len(self.tree), size)
+        self.assertEqual(list(self.tree), list(range(size)))
+        self.assert_height_bound()
+        
+        for num in range(0, size, 2):
+            self.tree.remove(num)
+        self.assertEqual(list(self.tree), list(range(1, size, 2)))
+        self.assert_height_bound()
+    
+    
+    def test_random_operations(self):
+        python_set = set()
+        
+        for _ in range(self.LOOPS * 10):
+            num = random.randrange(self.MAX_RANDOM_NUM)
+            if random.random() < 0.6:
+                self.tree.add(num)
+                python_set.add(num)
+            elif num in python_set:
+                self.tree.remove(num)
+                python_set.remove(num)
+            
+            self.assertEqual(len(self.tree), len(python_set))
+        
+        self.assertEqual(list(self.tree), sorted(python_set))
+        self.assert_height_bound()
+    
+    
+    def assert_height_bound(self):
+        '''
+        Check that the height of the red-black tree
+        is at most 2 * log2(n + 1).
+        '''
+        self.assertLessEqual(self.tree.height(), 2 * math.log2(len(self.tree) + 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,248 @@
+'''
+ * A tree map unit test.
+ *
+ * @author Cosimo Giovanni Negri
+ * @date   18 Oct 2026
+'''
+
+import unittest
+import sys
+import os
+import random
+
+if __name__ == "__main__":
+    sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+    from datastructures.binarysearchtree.tree_map import TreeMap
+    from datastructures.binarysearchtree.test_binary_search_tree import NonComparableObject
+else:
+    from .tree_map import TreeMap
+    from .test_binary_search_tree import NonComparableObject
+
+
+class TreeMapTest(unittest.TestCase):
+
+    def setUp(self):
+        self.LOOPS = 200
+        self.SIZE = 40
+        self.MAX_RANDOM_NUM = 250
+        
+        self.map = TreeMap()
+    
+    
+    def test_empty_map(self):
+        self.assertTrue(self.map.isempty())
+        self.assertEqual(len(self.map), 0)
+        self.map[1] = "A"
+        self.assertFalse(self.map.isempty())
+        self.map.clear()
+        self.assertTrue(self.map.isempty())
+    
+    
+    def test_set_get(self):
+        self.map[3] = "C"
+        self.map[1] = "A"
+        self.map.add(2, "B")
+        self.assertEqual(len(self.map), 3)
+        self.assertEqual(self.map[1], "A")
+        self.assertEqual(self.map.get(2), "B")
+        self.assertIsNone(self.map.get(4))
+        self.assertEqual(self.map.get(4, "D"), "D")
+        
+        # updating a key does not change the size
+        self.map[1] = "Z"
+        self.assertEqual(len(self.map), 3)
+        self.assertEqual(self.map[1], "Z")
+        
+        with self.assertRaises(KeyError):
+            self.map[4]
+    
+    
+    def test_remove(self):
+        self.map[1] = "A"
+        self.map[2] = "B"
+        
+        self.assertEqual(self.map.remove(1), "A")
+        self.assertIsNone(self.map.remove(1))
+        self.assertEqual(self.map.remove(1, "X"), "X")
+        self.assertEqual(len(self.map), 1)
+        
+        del self.map[2]
+        self.assertEqual(len(self.map), 0)
+        with self.assertRaises(KeyError):
+            del self.map[2]
+    
+    
+    def test_pop(self):
+        self.map[1] = "A"
+        self.map[2] = None
+        
+        self.assertEqual(self.map.pop(1), "A")
+        self.assertIsNone(self.map.pop(2))
+        self.assertEqual(self.map.pop(3, "X"), "X")
+        self.assertIsNone(self.map.pop(3, None))
+        with self.assertRaises(KeyError):
+            self.map.pop(3)
+        self.assertEqual(len(self.map), 0)
+    
+    
+    def test_invalid_keys(self):
+        with self.assertRaises(TypeError):
+            self.map[True] = 1
+        with self.assertRaises(TypeError):
+            self.map[None] = 1
+        with self.assertRaises(TypeError):
+            self.map[NonComparableObject("data")] = 1
+        
+        self.map[1] = "A"
+        with self.assertRaises(TypeError):
+            self.map["A"] = 1
+        with self.assertRaises(TypeError):
+            self.map.get("A")
+        with self.assertRaises(TypeError):
+            self.map.pop("A")
+        
+        self.assertFalse("A" in self.map)
+        self.assertFalse(None in self.map)
+        
+        # True == 1, but booleans are rejected by the lookups
+        with self.assertRaises(TypeError):
+            self.map[True]
+        self.assertFalse(True in self.map)
+        self.assertFalse(False in TreeMap())
+    
+    
+    def test_invalid_keys_below_root(self):
+        for key in range(100):
+            self.map[key] = str(key)
+        
+        with self.assertRaises(TypeError):
+            self.map["A"] = 1
+        with self.assertRaises(TypeError):
+            self.map["A"]
+        with self.assertRaises(TypeError):
+            self.map.remove("A")
+        with self.assertRaises(TypeError):
+            del self.map[(1,)]
+        with self.assertRaises(TypeError):
+            self.map[True] = 1
+        
+        self.assertEqual(len(self.map), 100)
+        self.assertEqual(self.map.items(), [(key, str(key)) for key in range(100)])
+    
+    
+    def test_sorted_order(self):
+        rand_nums = self.get_rand_list()
+        for num in rand_nums:
+            self.map[num] = num * 2
+        
+        self.assertEqual(list(self.map), sorted(rand_nums))
+        self.assertEqual(self.map.keys(), sorted(rand_nums))
+        self.assertEqual(self.map.values(), [num * 2 for num in sorted(rand_nums)])
+        self.assertEqual(self.map.items(), [(num, num * 2) for num in sorted(rand_nums)])
+    
+    
+    def test_range_items(self):
+        for num in range(0, 100, 10):
+            self.map[num] = str(num)
+        
+        self.assertEqual(self.map.items(20, 40), [(20, "20"), (30, "30"), (40, "40")])
+        self.assertEqual(self.map.items(15, 35), [(20, "20"), (30, "30")])
+        self.assertEqual(self.map.items(hi=10), [(0, "0"), (10, "10")])
+        self.assertEqual(self.map.items(lo=85), [(90, "90")])
+        self.assertEqual(self.map.items(40, 20), [])
+        self.assertEqual(self.map.keys(20, 40), [20, 30, 40])
+        self.assertEqual(self.map.values(20, 40), ["20", "30", "40"])
+        
+        with self.assertRaises(TypeError):
+            self.map.items("A", "B")
+    
+    
+    def test_peekitem(self):
+        with self.assertRaises(IndexError):
+            self.map.peekitem()
+        
+        for num in [5, 1, 4, 2, 3]:
+            self.map[num] = str(num)
+        
+        self.assertEqual(self.map.peekitem(), (5, "5"))
+        self.assertEqual(self.map.peekitem(-1), (5, "5"))
+        self.assertEqual(self.map.peekitem(0), (1, "1"))
+        self.assertEqual(self.map.peekitem(2), (3, "3"))
+        self.assertEqual(self.map.peekitem(-2), (4, "4"))
+        with self.assertRaises(IndexError):
+            self.map.peekitem(5)
+        self.assertEqual(len(self.map), 5)
+    
+    
+    def test_popitem(self):
+        with self.assertRaises(IndexError):
+            self.map.popitem()
+        
+        for num in [5, 1, 4, 2, 3]:
+            self.map[num] = str(num)
+        
+        self.assertEqual(self.map.popitem(), (5, "5"))
+        self.assertEqual(self.map.popitem(0), (1, "1"))
+        self.assertEqual(self.map.popitem(1), (3, "3"))
+        self.assertEqual(self.map.items(), [(2, "2"), (4, "4")])
+        self.assertEqual(len(self.map), 2)
+    
+    
+    def test_random_operations(self):
+        python_dict = {}
+        
+        for _ in range(self.LOOPS * 10):
+            key = random.randrange(self.MAX_RANDOM_NUM)
+            if random.random() < 0.6:
+                self.map[key] = key * 2
+                python_dict[key] = key * 2
+            else:
+                self.assertEqual(self.map.remove(key), python_dict.pop(key, None))
+            
+            self.assertEqual(len(self.map), len(python_dict))
+        
+        self.assertEqual(self.map.items(), sorted(python_dict.items()))
+        for index, key in enumerate(sorted(python_dict)):
+            self.assertEqual(self.map.peekitem(index), (key, python_dict[key]))
+    
+    
+    def test_sorted_keys(self):
+        # far more keys than the recursion limit would allow without balancing
+        for num in range(2 ** 12):
+            self.map[num] = num
+        self.assertEqual(len(self.map), 2 ** 12)
+        self.assertEqual(self.map.peekitem(0), (0, 0))
+    
+    
+    def test_change_during_iteration(self):
+        self.map[1] = "A"
+        self.map[2] = "B"
+        
+        # updating a value is allowed
+        for key in self.map:
+            self.map[key] = "C"
+        self.assertEqual(self.map.values(), ["C", "C"])
+        
+        with self.assertRaises(RuntimeError):
+            for key in self.map:
+                self.map[3] = "C"
+    
+    
+    def test_to_string(self):
+        self.assertEqual(str(self.map), "{}")
+        self.map[2] = "B"
+        self.map[1] = "A"
+        self.assertEqual(str(self.map), "{1: A, 2: B}")
+    
+    
+    def get_rand_list(self):
+        '''
+        Generate a list of random numbers.
+        '''
+        list = random.sample(range(0, self.MAX_RANDOM_NUM), self.SIZE)
+        random.shuffle(list)
+        return list
+
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
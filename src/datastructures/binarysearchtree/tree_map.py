@@ -0,0 +1,450 @@
+'''
+ * A sorted map implementation, where the key-value pairs
+ * are stored in the nodes of an AVL balanced binary search tree.
+ *
+ * @author Cosimo Giovanni Negri
+ * @date   18 Oct 2026
+'''
+
+from .avl_balancing import AVLBalancing
+
+_MISSING = object()  # default of pop, since None is a valid default
+
+
+class Node:
+    '''
+    Node class to represent a key-value pair of the tree map.
+    '''
+    __slots__ = ('key', 'value', 'left', 'right', 'height', 'size')
+    
+    def __init__(self, key, value):
+        self.key = key
+        self.value = value
+        self.left = None
+        self.right = None
+        self.height = 1
+        self.size = 1  # number of nodes in the subtree
+    
+    def __str__(self):
+        return f"{str(self.key)}: {str(self.value)}"
+
+
+class TreeMap(AVLBalancing):
+    '''
+    A sorted map implementation, where the key-value pairs
+    are stored in the nodes of an AVL balanced binary search tree.
+    NOTE: every lookup, addition and removal finds the key and its value
+    with a single descent of the tree, O(log(n)).
+    '''
+    def __init__(self):
+        self.__size = 0
+        self.__root = None
+        self.__modifications = 0  # to detect changes during an iteration
+    
+    
+    def __check_key_type(self, key):
+        '''
+        Raise an error if the key type is not valid, O(1).
+        '''
+        if isinstance(key, bool):
+            raise TypeError("key must not be a boolean")
+        
+        if self.__root is None:
+            try:
+                key == key
+                key > key
+                key < key
+            except:
+                raise TypeError(f"uncomparable key: {type(key)}")
+        
+        else:
+            root_key = self.__root.key
+            try:
+                key == root_key
+                key > root_key
+                key < root_key
+            except:
+                raise TypeError(f"{type(key)} not comparable with {type(root_key)}")
+    
+    
+    def __check_new_key(self, key):
+        '''
+        Raise an error if the key type is not valid, O(1).
+        NOTE: unless the tree map is empty, the key is not compared with
+        the root, since it is compared with the keys on its path anyway.
+        '''
+        if isinstance(key, bool):
+            raise TypeError("key must not be a boolean")
+        if self.__root is None:
+            self.__check_key_type(key)
+    
+    
+    def __uncomparable(self, key):
+        '''
+        Return the error to raise when a key is
+        not comparable with the keys in the tree map.
+        '''
+        return TypeError(f"{type(key)} not comparable with {type(self.__root.key)}")
+    
+    
+    def clear(self):
+        '''
+        Empty the tree map, O(1).
+        '''
+        self.__size = 0
+        self.__modifications += 1
+        self.__root = None
+    
+    
+    def isempty(self):
+        '''
+        Return whether or not the tree map is empty, O(1).
+        '''
+        return self.__size == 0
+    
+    
+    def __node_size(self, node):
+        '''
+        Return the size of the subtree of the given node,
+        or 0 if there is no node.
+        '''
+        return 0 if node is None else node.size
+    
+    
+    def __search(self, key):
+        '''
+        Return the node with the given key if it exists
+        in the tree map, otherwise return None.
+        '''
+        node = self.__root
+        while node is not None:
+            if key == node.key:
+                return node
+            node = node.left if key < node.key else node.right
+        return None
+    
+    
+    def __find(self, key):
+        '''
+        Return the node with the given key if it exists
+        in the tree map, otherwise return None.
+        NOTE: If the key type is not valid, raise an error.
+        '''
+        self.__check_new_key(key)
+        try:
+            return self.__search(key)
+        except TypeError:
+            raise self.__uncomparable(key) from None
+    
+    
+    def get(self, key, default=None):
+        '''
+        Return the key's value if the key exists in the tree map,
+        otherwise return the default value, O(log(n)).
+        NOTE: If the key type is not valid, raise an error.
+        '''
+        node = self.__find(key)
+        return default if node is None else node.value
+    
+    
+    def __recursive_add(self, node, key, value):
+        '''
+        Add a node in the right place if the key does not exist
+        in the tree map, otherwise update the key's value.
+        '''
+        if node is None:
+            self.__size += 1
+            self.__modifications += 1
+            return Node(key, value)
+        
+        if key < node.key:
+            node.left = self.__recursive_add(node.left, key, value)
+        elif key > node.key:
+            node.right = self.__recursive_add(node.right, key, value)
+        else:
+            node.value = value
+            return node
+        
+        return self._rebalance(node)
+    
+    
+    def add(self, key, value):
+        '''
+        Add a key-value pair if the key does not exist in the
+        tree map, otherwise update the key's value, O(log(n)).
+        NOTE: If the key type is not valid, raise an error.
+        '''
+        self.__check_new_key(key)
+        try:
+            self.__root = self.__recursive_add(self.__root, key, value)
+        except TypeError:
+            # nothing has changed, since nodes change only on the way back
+            raise self.__uncomparable(key) from None
+    
+    
+    def __recursive_remove(self, node, key):
+        '''
+        Remove the node with the given key from the tree map, and return
+        the new root of the subtree together with the key's value.
+        NOTE: If the key does not exist, raise an error
+        before changing anything.
+        '''
+        if node is None:
+            raise KeyError(f"{key} not in tree map")
+        
+        if key < node.key:
+            node.left, value = self.__recursive_remove(node.left, key)
+            return self._rebalance(node), value
+        if key > node.key:
+            node.right, value = self.__recursive_remove(node.right, key)
+            return self._rebalance(node), value
+        
+        # here key == node.key
+        
+        value = node.value
+        if node.left is None:  # zero children or only right child
+            return node.right, value
+        if node.right is None:  # only left child
+            return node.left, value
+        
+        # two children
+        temp = node.left
+        while temp.right is not None:
+            temp = temp.right
+        node.key, node.value = temp.key, temp.value
+        node.left, _ = self.__recursive_remove(node.left, temp.key)
+        return self._rebalance(node), value
+    
+    
+    def __remove(self, key):
+        '''
+        Remove the key-value pair with the given key and return
+        the key's value, or raise an error if the key does not exist.
+        NOTE: If the key type is not valid, raise an error.
+        '''
+        self.__check_new_key(key)
+        try:
+            self.__root, value = self.__recursive_remove(self.__root, key)
+        except TypeError:
+            # nothing has changed, since nodes change only on the way back
+            raise self.__uncomparable(key) from None
+        self.__size -= 1
+        self.__modifications += 1
+        return value
+    
+    
+    def remove(self, key, default=None):
+        '''
+        Remove a key-value pair and return the key's value
+        if the key exists in the tree map,
+        otherwise return the default value, O(log(n)).
+        NOTE: If the key type is not valid, raise an error.
+        '''
+        try:
+            return self.__remove(key)
+        except KeyError:
+            return default
+    
+    
+    def pop(self, key, default=_MISSING):
+        '''
+        Remove a key-value pair and return the key's value
+        if the key exists in the tree map, otherwise return
+        the default value or raise an error if it is not given, O(log(n)).
+        NOTE: If the key type is not valid, raise an error.
+        '''
+        try:
+            return self.__remove(key)
+        except KeyError:
+            if default is _MISSING:
+                raise
+            return default
+    
+    
+    def __select(self, index):
+        '''
+        Return the node at the given index in the sorted order of the keys.
+        NOTE: negative indexes count from the maximum key, as in a list.
+        '''
+        if index < 0:
+            index += self.__size
+        if not 0 <= index < self.__size:
+            raise IndexError("index out of range")
+        
+        node = self.__root
+        while True:
+            left_size = self.__node_size(node.left)
+            if index < left_size:
+                node = node.left
+            elif index > left_size:
+                index -= left_size + 1
+                node = node.right
+            else:
+                return node
+    
+    
+    def peekitem(self, index=-1):
+        '''
+        Return the key-value tuple pair at the given index
+        in the sorted order of the keys, O(log(n)).
+        NOTE: by default the pair with the maximum key is returned,
+        and 0 returns the pair with the minimum key.
+        NOTE: If the index is out of range, raise an error.
+        '''
+        node = self.__select(index)
+        return (node.key, node.value)
+    
+    
+    def popitem(self, index=-1):
+        '''
+        Remove and return the key-value tuple pair at the given
+        index in the sorted order of the keys, O(log(n)).
+        NOTE: by default the pair with the maximum key is removed.
+        NOTE: If the index is out of range, raise an error.
+        '''
+        key = self.__select(index).key
+        return (key, self.__remove(key))
+    
+    
+    def __lazy_range(self, lo, hi):
+        '''
+        Yield the nodes of the tree map with a key between lo and hi,
+        both included, in order, using an explicit stack of the nodes
+        in the range that have not been yielded yet.
+        '''
+        modifications = self.__modifications
+        stack = []
+        node = self.__root
+        
+        while True:
+            # Go down towards the first key not below lo
+            while node is not None:
+                if lo is not None and node.key < lo:
+                    node = node.right
+                else:
+                    stack.append(node)
+                    node = node.left
+            
+            if not stack:
+                return
+            node = stack.pop()
+            if hi is not None and node.key > hi:
+                return
+            
+            yield node
+            if self.__modifications != modifications:
+                raise RuntimeError("tree map changed size during iteration")
+            
+            node = node.right
+    
+    
+    def __check_range(self, lo, hi):
+        '''
+        Raise an error if the type of a given bound is not valid.
+        '''
+        if lo is not None:
+            self.__check_key_type(lo)
+        if hi is not None:
+            self.__check_key_type(hi)
+    
+    
+    def keys(self, lo=None, hi=None):
+        '''
+        Return a copy of the sorted list of keys between lo and hi,
+        both included, found within the tree map, O(log(n) + k).
+        NOTE: a missing lo or hi means that the range is unbounded on that side.
+        '''
+        self.__check_range(lo, hi)
+        return [node.key for node in self.__lazy_range(lo, hi)]
+    
+    
+    def values(self, lo=None, hi=None):
+        '''
+        Return a copy of the list of values whose keys are between lo
+        and hi, both included, found within the tree map, O(log(n) + k).
+        NOTE: the values are sorted by their keys.
+        '''
+        self.__check_range(lo, hi)
+        return [node.value for node in self.__lazy_range(lo, hi)]
+    
+    
+    def items(self, lo=None, hi=None):
+        '''
+        Return a copy of the sorted list of key-value tuple pairs whose keys
+        are between lo and hi, both included, found within the tree map, O(log(n) + k).
+        NOTE: a missing lo or hi means that the range is unbounded on that side.
+        '''
+        self.__check_range(lo, hi)
+        return [(node.key, node.value) for node in self.__lazy_range(lo, hi)]
+    
+    
+    def __len__(self):
+        '''
+        Return the size of the tree map, O(1).
+        '''
+        return self.__size
+    
+    
+    def __getitem__(self, key):
+        '''
+        Return the key's value if the key exists in the tree map,
+        otherwise raise an error, O(log(n)).
+        NOTE: If the key type is not valid, raise an error.
+        '''
+        node = self.__find(key)
+        
+        if node is None:
+            raise KeyError(f"{key} not in tree map")
+        else:
+            return node.value
+    
+    
+    def __setitem__(self, key, value):
+        '''
+        Add a key-value pair if the key does not exist in the
+        tree map, otherwise update the key's value, O(log(n)).
+        NOTE: If the key type is not valid, raise an error.
+        '''
+        self.add(key, value)
+    
+    
+    def __delitem__(self, key):
+        '''
+        Remove a key-value pair if the key exists in the tree map,
+        otherwise raise an error, O(log(n)).
+        NOTE: If the key type is not valid, raise an error.
+        '''
+        self.__remove(key)
+    
+    
+    def __contains__(self, key):
+        '''
+        Return whether or not a key is in the tree map, O(log(n)).
+        NOTE: keys with a type that is not valid, for which the other
+        lookups raise an error, are never in the tree map.
+        '''
+        try:
+            return self.__find(key) is not None
+        except TypeError:
+            return False
+    
+    
+    def __iter__(self):
+        '''
+        Return a new lazy iterator over the keys
+        of the tree map in order, O(1).
+        NOTE: adding or removing keys while iterating raises an error.
+        '''
+        return (node.key for node in self.__lazy_range(None, None))
+    
+    
+    def __str__(self):
+        '''
+        Return a string to print the key-value pairs
+        of the tree map in order, O(n).
+        '''
+        strings = []
+        for node in self.__lazy_range(None, None):
+            strings.append(str(node))
+        
+        return '{' + ', '.join(strings) + '}'
\ No newline at end of file
@@ -0,0 +1,558 @@
+'''
+ * A B+ tree implementation, used as an ordered set.
+ *
+ * Main inspiration: Database System Concepts (Silberschatz et al.), chapter 14
+ *
+ * @author Cosimo Giovanni Negri
+ * @date   18 Oct 2026
+'''
+
+import math
+from bisect import bisect_left, bisect_right
+
+from ..set.abstract_ordered_set import AbstractOrderedSet
+
+
+class Leaf:
+    '''
+    Leaf class to represent a sorted block of values of the B+ tree,
+    linked to the previous and the next leaves.
+    '''
+    __slots__ = ('values', 'prev', 'next')
+    
+    def __init__(self, values):
+        self.values = values
+        self.prev = None
+        self.next = None
+    
+    def __str__(self):
+        return str(self.values)
+
+
+class Internal:
+    '''
+    Internal class to represent a node of the B+ tree, where the values
+    in children[i] are less than keys[i], the values in children[i + 1]
+    are greater or equal, and counts[i] is the number of values in children[i].
+    '''
+    __slots__ = ('keys', 'children', 'counts')
+    
+    def __init__(self, keys, children, counts):
+        self.keys = keys
+        self.children = children
+        self.counts = counts
+    
+    def __str__(self):
+        return str(self.keys)
+
+
+class BPlusTree(AbstractOrderedSet):
+    '''
+    A B+ tree implementation, used as an ordered set.
+    NOTE: every node holds up to order values or children in sorted lists,
+    so there are about n / order nodes and the height is O(log(n) / log(order)).
+    NOTE: the leaves are linked, so that a range of k values is visited
+    in O(log(n) + k) without going back up the tree.
+    '''
+    def __init__(self, order=64):
+        if not isinstance(order, int) or isinstance(order, bool) or order < 3:
+            raise ValueError("order must be an integer greater or equal than 3")
+        
+        self.__order = order
+        self.__min_values = order // 2  # in every leaf but the root
+        self.__min_children = (order + 1) // 2  # in every internal node but the root
+        self.__modifications = 0  # to detect changes during an iteration
+        self.__init_tree()
+    
+    
+    def __init_tree(self):
+        '''
+        Make the B+ tree empty, with a single empty leaf as root.
+        '''
+        self.__root = self.__first = self.__last = Leaf([])
+        self.__levels = 1
+        self.__size = 0
+    
+    
+    @property
+    def order(self):
+        '''
+        Return the maximum number of values in a leaf,
+        and of children in an internal node, O(1).
+        '''
+        return self.__order
+    
+    
+    def _reference_value(self):
+        '''
+        Return the minimum value of the B+ tree,
+        or None if it is empty, O(1).
+        '''
+        return self.__first.values[0] if self.__size else None
+    
+    
+    def __group_sizes(self, total):
+        '''
+        Return the sizes of the fewest groups of at most order
+        elements among which total elements can be split evenly.
+        NOTE: every group gets at least the minimum number
+        of values of a leaf or of children of an internal node.
+        '''
+        groups = math.ceil(total / self.__order)
+        size, extra = divmod(total, groups)
+        return [size + 1] * extra + [size] * (groups - extra)
+    
+    
+    def _build(self, values):
+        '''
+        Fill the empty B+ tree with the sorted values, building
+        the leaves first and then the internal nodes level by level.
+        '''
+        nodes = []
+        start = 0
+        for size in self.__group_sizes(len(values)):
+            leaf = Leaf(values[start:start + size])
+            if nodes:
+                nodes[-1].next = leaf
+                leaf.prev = nodes[-1]
+            nodes.append(leaf)
+            start += size
+        
+        self.__first, self.__last = nodes[0], nodes[-1]
+        minimums = [leaf.values[0] for leaf in nodes]
+        counts = [len(leaf.values) for leaf in nodes]
+        
+        while len(nodes) > 1:
+            parents, parent_minimums, parent_counts = [], [], []
+            start = 0
+            for size in self.__group_sizes(len(nodes)):
+                stop = start + size
+                parents.append(Internal(minimums[start + 1:stop], nodes[start:stop], counts[start:stop]))
+                parent_minimums.append(minimums[start])
+                parent_counts.append(sum(counts[start:stop]))
+                start = stop
+            
+            nodes, minimums, counts = parents, parent_minimums, parent_counts
+            self.__levels += 1
+        
+        self.__root = nodes[0]
+        self.__size = len(values)
+    
+    
+    def clear(self):
+        '''
+        Empty the B+ tree, O(1).
+        '''
+        self.__init_tree()
+        self.__modifications += 1
+    
+    
+    def isempty(self):
+        '''
+        Return whether or not the B+ tree is empty, O(1).
+        '''
+        return self.__size == 0
+    
+    
+    def __find_leaf(self, value, path=None):
+        '''
+        Return the leaf where the given value is, or should be,
+        appending to path every internal node on the way together
+        with the index of the chosen child.
+        '''
+        node = self.__root
+        for _ in range(self.__levels - 1):
+            index = bisect_right(node.keys, value)
+            if path is not None:
+                path.append((node, index))
+            node = node.children[index]
+        return node
+    
+    
+    def add(self, value):
+        '''
+        Add the value in the right leaf if it does not exist
+        in the B+ tree, otherwise do nothing, O(order * log(n) / log(order)).
+        Return whether or not the value has been added.
+        NOTE: If the value type is not valid, raise an error.
+        '''
+        self._check_new_value(value)
+        path = []
+        try:
+            leaf = self.__find_leaf(value, path)
+            index = bisect_left(leaf.values, value)
+            if index < len(leaf.values) and leaf.values[index] == value:
+                return False
+        except TypeError:
+            raise self._uncomparable(value) from None
+        
+        leaf.values.insert(index, value)
+        for node, child_index in path:
+            node.counts[child_index] += 1
+        self.__size += 1
+        self.__modifications += 1
+        
+        if len(leaf.values) > self.__order:
+            self.__split(leaf, path)
+        return True
+    
+    
+    def __split(self, node, path):
+        '''
+        Split the given overflowing node in two halves, and add the second
+        one to its parent, splitting it too if needed, going up towards the root.
+        '''
+        while True:
+            if isinstance(node, Leaf):
+                middle = len(node.values) // 2
+                sibling = Leaf(node.values[middle:])
+                del node.values[middle:]
+                
+                sibling.prev, sibling.next = node, node.next
+                if node.next is None:
+                    self.__last = sibling
+                else:
+                    node.next.prev = sibling
+                node.next = sibling
+                
+                separator = sibling.values[0]
+                node_count, sibling_count = len(node.values), len(sibling.values)
+            
+            else:
+                # the middle key moves up, instead of being copied
+                middle = len(node.keys) // 2
+                separator = node.keys[middle]
+                sibling = Internal(node.keys[middle + 1:], node.children[middle + 1:], node.counts[middle + 1:])
+                del node.keys[middle:]
+                del node.children[middle + 1:]
+                del node.counts[middle + 1:]
+                node_count, sibling_count = sum(node.counts), sum(sibling.counts)
+            
+            if not path:  # the root has been split
+                self.__root = Internal([separator], [node, sibling], [node_count, sibling_count])
+                self.__levels += 1
+                return
+            
+            parent, index = path.pop()
+            parent.keys.insert(index, separator)
+            parent.children.insert(index + 1, sibling)
+            parent.counts[index] = node_count
+            parent.counts.insert(index + 1, sibling_count)
+            
+            if len(parent.children) <= self.__order:
+                return
+            node = parent
+    
+    
+    def remove(self, value):
+        '''
+        Remove the value if it exists in the B+ tree,
+        otherwise raise an error, O(order * log(n) / log(order)).
+        NOTE: If the value type is not valid, raise an error.
+        '''
+        self._check_new_value(value)
+        path = []
+        try:
+            leaf = self.__find_leaf(value, path)
+            index = bisect_left(leaf.values, value)
+            found = index < len(leaf.values) and leaf.values[index] == value
+        except TypeError:
+            raise self._uncomparable(value) from None
+        
+        if not found:
+            raise ValueError(f"{value} not in tree")
+        
+        del leaf.values[index]
+        for node, child_index in path:
+            node.counts[child_index] -= 1
+        self.__size -= 1
+        self.__modifications += 1
+        
+        if path and len(leaf.values) < self.__min_values:
+            self.__fix_underflow(leaf, path)
+    
+    
+    def discard(self, value):
+        '''
+        Remove the value if it exists in the B+ tree, otherwise
+        do nothing, O(order * log(n) / log(order)).
+        Return whether or not the value has been removed.
+        NOTE: If the value type is not valid, raise an error.
+        '''
+        try:
+            self.remove(value)
+        except ValueError:
+            return False
+        return True
+    
+    
+    def __fix_underflow(self, node, path):
+        '''
+        Refill the given node, which has too few values or children,
+        borrowing from a sibling or merging with it, going up towards the root.
+        '''
+        while path:
+            parent, index = path.pop()
+            left = parent.children[index - 1] if index > 0 else None
+            right = parent.children[index + 1] if index + 1 < len(parent.children) else None
+            
+            if isinstance(node, Leaf):
+                if left is not None and len(left.values) > self.__min_values:
+                    node.values.insert(0, left.values.pop())
+                    parent.keys[index - 1] = node.values[0]
+                    self.__move_count(parent, index - 1, index, 1)
+                    return
+                if right is not None and len(right.values) > self.__min_values:
+                    node.values.append(right.values.pop(0))
+                    parent.keys[index] = right.values[0]
+                    self.__move_count(parent, index + 1, index, 1)
+                    return
+            
+            else:
+                if left is not None and len(left.children) > self.__min_children:
+                    # the separator goes down and the last key of left goes up
+                    node.keys.insert(0, parent.keys[index - 1])
+                    parent.keys[index - 1] = left.keys.pop()
+                    node.children.insert(0, left.children.pop())
+                    node.counts.insert(0, left.counts.pop())
+                    self.__move_count(parent, index - 1, index, node.counts[0])
+                    return
+                if right is not None and len(right.children) > self.__min_children:
+                    # the separator goes down and the first key of right goes up
+                    node.keys.append(parent.keys[index])
+                    parent.keys[index] = right.keys.pop(0)
+                    node.children.append(right.children.pop(0))
+                    node.counts.append(right.counts.pop(0))
+                    self.__move_count(parent, index + 1, index, node.counts[-1])
+                    return
+            
+            # no sibling can lend anything, so merge with one of them
+            self.__merge(parent, index - 1 if left is not None else index)
+            
+            if not path:
+                if len(parent.children) == 1:  # the root has a single child
+                    self.__root = parent.children[0]
+                    self.__levels -= 1
+                return
+            if len(parent.children) >= self.__min_children:
+                return
+            node = parent
+    
+    
+    def __move_count(self, parent, source, target, count):
+        '''
+        Move count values from the child at the source index
+        to the child at the target index in the counts of the parent.
+        '''
+        parent.counts[source] -= count
+        parent.counts[target] += count
+    
+    
+    def __merge(self, parent, index):
+        '''
+        Merge the child of the parent after the given index
+        into the child at the given index.
+        '''
+        left, right = parent.children[index], parent.children[index + 1]
+        
+        if isinstance(left, Leaf):
+            left.values.extend(right.values)
+            left.next = right.next
+            if right.next is None:
+                self.__last = left
+            else:
+                right.next.prev = left
+        else:
+            # the separator goes down between the keys of the two nodes
+            left.keys.append(parent.keys[index])
+            left.keys.extend(right.keys)
+            left.children.extend(right.children)
+            left.counts.extend(right.counts)
+        
+        parent.counts[index] += parent.counts[index + 1]
+        del parent.keys[index]
+        del parent.children[index + 1]
+        del parent.counts[index + 1]
+    
+    
+    def getmin(self):
+        '''
+        Return the minimum value in the B+ tree, O(1).
+        NOTE: If the B+ tree is empty, raise an error.
+        '''
+        if self.__size == 0:
+            raise ValueError("tree is empty")
+        return self.__first.values[0]
+    
+    
+    def getmax(self):
+        '''
+        Return the maximum value in the B+ tree, O(1).
+        NOTE: If the B+ tree is empty, raise an error.
+        '''
+        if self.__size == 0:
+            raise ValueError("tree is empty")
+        return self.__last.values[-1]
+    
+    
+    def height(self):
+        '''
+        Return the number of levels of the B+ tree, O(1).
+        '''
+        return 0 if self.__size == 0 else self.__levels
+    
+    
+    def inorder(self):
+        '''
+        Traverse the B+ tree in order and
+        return a copy of the list of values, O(n).
+        '''
+        values = []
+        leaf = self.__first
+        while leaf is not None:
+            values.extend(leaf.values)
+            leaf = leaf.next
+        return values
+    
+    
+    def _navigate(self, value, below, inclusive):
+        '''
+        Return the closest value in the B+ tree below or above
+        the given one, which is included if inclusive, or None.
+        NOTE: the closest value may be in the previous or in the next leaf.
+        '''
+        leaf = self.__find_leaf(value)
+        
+        if below:
+            index = (bisect_right if inclusive else bisect_left)(leaf.values, value)
+            if index > 0:
+                return leaf.values[index - 1]
+            return None if leaf.prev is None else leaf.prev.values[-1]
+        
+        index = (bisect_left if inclusive else bisect_right)(leaf.values, value)
+        if index < len(leaf.values):
+            return leaf.values[index]
+        return None if leaf.next is None else leaf.next.values[0]
+    
+    
+    def _lazy_range(self, lo, hi, lo_inclusive, hi_inclusive):
+        '''
+        Yield the values of the B+ tree between lo and hi in order,
+        going from each leaf to the next one.
+        NOTE: after the first leaf, the next ones are reached through their links.
+        '''
+        modifications = self.__modifications
+        
+        if lo is None:
+            leaf, start = self.__first, 0
+        else:
+            leaf = self.__find_leaf(lo)
+            start = (bisect_left if lo_inclusive else bisect_right)(leaf.values, lo)
+        
+        while leaf is not None:
+            values = leaf.values
+            stop = len(values)
+            if hi is not None and stop > 0 and not values[-1] < hi:
+                # the range ends in this leaf
+                stop = (bisect_right if hi_inclusive else bisect_left)(values, hi)
+            
+            for index in range(start, stop):
+                yield values[index]
+                if self.__modifications != modifications:
+                    raise RuntimeError("B+ tree changed size during iteration")
+            
+            if stop < len(values):
+                return
+            leaf, start = leaf.next, 0
+    
+    
+    def _count_less(self, value, inclusive):
+        '''
+        Return the number of values in the B+ tree
+        less than the given value, or less or equal if inclusive.
+        '''
+        count = 0
+        node = self.__root
+        for _ in range(self.__levels - 1):
+            index = bisect_right(node.keys, value)
+            count += sum(node.counts[:index])
+            node = node.children[index]
+        
+        return count + (bisect_right if inclusive else bisect_left)(node.values, value)
+    
+    
+    def _select(self, index):
+        '''
+        Return the value at the given index in the sorted order,
+        skipping the children whose values all come before it.
+        '''
+        node = self.__root
+        for _ in range(self.__levels - 1):
+            child_index = 0
+            while index >= node.counts[child_index]:
+                index -= node.counts[child_index]
+                child_index += 1
+            node = node.children[child_index]
+        
+        return node.values[index]
+    
+    
+    def __len__(self):
+        '''
+        Return the size of the B+ tree, O(1).
+        '''
+        return self.__size
+    
+    
+    def __contains__(self, value):
+        '''
+        Return whether or not a value is in the B+ tree, O(log(n)).
+        '''
+        leaf = self.__find_leaf(value)
+        index = bisect_left(leaf.values, value)
+        return index < len(leaf.values) and leaf.values[index] == value
+    
+    
+    def __iter__(self):
+        '''
+        Return a new lazy iterator over the values
+        of the B+ tree in order, O(1).
+        NOTE: adding or removing values while iterating raises an error.
+        '''
+        return self.__lazy_inorder(reverse=False)
+    
+    
+    def __reversed__(self):
+        '''
+        Return a new lazy iterator over the values
+        of the B+ tree in reverse order, O(1).
+        NOTE: adding or removing values while iterating raises an error.
+        '''
+        return self.__lazy_inorder(reverse=True)
+    
+    
+    def __lazy_inorder(self, reverse):
+        '''
+        Yield the values of the B+ tree in order, or in reverse
+        order, going from each leaf to the next or the previous one.
+        '''
+        modifications = self.__modifications
+        leaf = self.__last if reverse else self.__first
+        
+        while leaf is not None:
+            for value in (reversed(leaf.values) if reverse else leaf.values):
+                yield value
+                if self.__modifications != modifications:
+                    raise RuntimeError("B+ tree changed size during iteration")
+            leaf = leaf.prev if reverse else leaf.next
+    
+    
+    def __str__(self):
+        '''
+        Return a string to print the B+ tree, O(n).
+        '''
+        strings = []
+        for value in self.inorder():
+            strings.append(str(value))
+        
+        return '[' + ', '.join(strings) + ']'
\ No newline at end of file
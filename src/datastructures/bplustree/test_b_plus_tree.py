@@ -0,0 +1,269 @@
+'''
+ * A B+ tree unit test.
+ *
+ * @author Cosimo Giovanni Negri
+ * @date   18 Oct 2026
+'''
+
+import unittest
+import sys
+import os
+import math
+import random
+
+if __name__ == "__main__":
+    sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+    from datastructures.bplustree.b_plus_tree import BPlusTree
+else:
+    from .b_plus_tree import BPlusTree
+
+
+class NonComparableObject:
+
+    def __init__(self, data):
+        self.data = data
+
+
+class BPlusTreeTest(unittest.TestCase):
+
+    def setUp(self):
+        self.LOOPS = 200
+        self.SIZE = 40
+        self.MAX_RANDOM_NUM = 250
+        
+        # a small order, so that nodes are split and merged often
+        self.tree = BPlusTree(order=4)
+    
+    
+    def test_invalid_order(self):
+        with self.assertRaises(ValueError):
+            BPlusTree(order=2)
+        with self.assertRaises(ValueError):
+            BPlusTree(order=4.5)
+        self.assertEqual(BPlusTree().order, 64)
+    
+    
+    def test_empty_tree(self):
+        self.assertTrue(self.tree.isempty())
+        self.assertEqual(len(self.tree), 0)
+        self.assertEqual(self.tree.height(), 0)
+        self.assertEqual(self.tree.inorder(), [])
+        self.assertFalse(3 in self.tree)
+        with self.assertRaises(ValueError):
+            self.tree.getmin()
+        with self.assertRaises(ValueError):
+            self.tree.getmax()
+        
+        self.tree.add(3)
+        self.assertFalse(self.tree.isempty())
+        self.assertEqual(self.tree.height(), 1)
+    
+    
+    def test_add(self):
+        self.assertTrue(self.tree.add("A"))
+        self.assertTrue(self.tree.add("B"))
+        self.assertFalse(self.tree.add("A"))
+        self.assertEqual(len(self.tree), 2)
+    
+    
+    def test_remove(self):
+        self.tree.add("A")
+        with self.assertRaises(ValueError):
+            self.tree.remove("B")
+        self.assertFalse(self.tree.discard("B"))
+        self.assertEqual(len(self.tree), 1)
+        
+        self.tree.add("B")
+        self.tree.remove("B")
+        self.assertTrue(self.tree.discard("A"))
+        self.assertEqual(len(self.tree), 0)
+    
+    
+    def test_clear(self):
+        for num in range(self.SIZE):
+            self.tree.add(num)
+        self.tree.clear()
+        self.assertEqual(len(self.tree), 0)
+        self.assertEqual(self.tree.inorder(), [])
+        
+        self.tree.add(8)
+        self.assertEqual(self.tree.inorder(), [8])
+    
+    
+    def test_invalid_values(self):
+        with self.assertRaises(TypeError):
+            self.tree.add(True)
+        with self.assertRaises(TypeError):
+            self.tree.add(None)
+        with self.assertRaises(TypeError):
+            self.tree.add(NonComparableObject("data"))
+        
+        self.tree.add(1)
+        with self.assertRaises(TypeError):
+            self.tree.add("A")
+        with self.assertRaises(TypeError):
+            self.tree.remove("A")
+        with self.assertRaises(TypeError):
+            self.tree.floor("A")
+        self.assertEqual(self.tree.inorder(), [1])
+    
+    
+    def test_height(self):
+        for num in range(4):
+            self.tree.add(num)
+        self.assertEqual(self.tree.height(), 1)
+        
+        # the only leaf overflows and is split
+        self.tree.add(4)
+        self.assertEqual(self.tree.height(), 2)
+        
+        for num in range(5, 4 ** 4):
+            self.tree.add(num)
+        # every node but the root is at least half full
+        self.assertLessEqual(self.tree.height(), 1 + math.log(4 ** 4 / 2, 2))
+        
+        for num in range(1, 4 ** 4):
+            self.tree.remove(num)
+        self.assertEqual(self.tree.height(), 1)
+        self.assertEqual(self.tree.inorder(), [0])
+    
+    
+    def test_random_operations(self):
+        for order in [3, 4, 5, 16]:
+            self.tree = BPlusTree(order=order)
+            python_set = set()
+            
+            for _ in range(self.LOOPS * 10):
+                num = random.randrange(self.MAX_RANDOM_NUM)
+                if random.random() < 0.6:
+                    self.assertEqual(self.tree.add(num), num not in python_set)
+                    python_set.add(num)
+                else:
+                    self.assertEqual(self.tree.discard(num), num in python_set)
+                    python_set.discard(num)
+                
+                self.assertEqual(len(self.tree), len(python_set))
+            
+            values = sorted(python_set)
+            self.assertEqual(self.tree.inorder(), values)
+            self.assertEqual(list(reversed(self.tree)), values[::-1])
+            if values:
+                self.assertEqual(self.tree.getmin(), values[0])
+                self.assertEqual(self.tree.getmax(), values[-1])
+            for num in range(self.MAX_RANDOM_NUM):
+                self.assertEqual(num in self.tree, num in python_set)
+    
+    
+    def test_rank_select(self):
+        rand_nums = self.get_rand_list()
+        for num in rand_nums:
+            self.tree.add(num)
+        for num in rand_nums[:self.SIZE // 4]:
+            self.tree.remove(num)
+        
+        values = sorted(rand_nums[self.SIZE // 4:])
+        for index, value in enumerate(values):
+            self.assertEqual(self.tree.select(index), value)
+            self.assertEqual(self.tree.select(index - len(values)), value)
+            self.assertEqual(self.tree.rank(value), index)
+            self.assertEqual(self.tree.rank(value + 0.5), index + 1)
+            self.assertEqual(self.tree.nth_smallest(index + 1), value)
+        
+        with self.assertRaises(IndexError):
+            self.tree.select(len(values))
+        self.assertEqual(self.tree.percentile(100), values[-1])
+        self.assertEqual(self.tree.percentile(0), values[0])
+    
+    
+    def test_count_range(self):
+        for num in range(0, 100, 10):
+            self.tree.add(num)
+        
+        self.assertEqual(self.tree.count_range(0, 90), 10)
+        self.assertEqual(self.tree.count_range(5, 35), 3)
+        self.assertEqual(self.tree.count_range(30, 30), 1)
+        self.assertEqual(self.tree.count_range(30, 10), 0)
+    
+    
+    def test_navigation(self):
+        self.assertIsNone(self.tree.floor(5))
+        
+        for num in range(0, 100, 10):
+            self.tree.add(num)
+        
+        self.assertEqual(self.tree.floor(30), 30)
+        self.assertEqual(self.tree.floor(35), 30)
+        self.assertIsNone(self.tree.floor(-1))
+        self.assertEqual(self.tree.ceiling(35), 40)
+        self.assertIsNone(self.tree.ceiling(91))
+        self.assertEqual(self.tree.lower(30), 20)
+        self.assertIsNone(self.tree.lower(0))
+        self.assertEqual(self.tree.higher(30), 40)
+        self.assertIsNone(self.tree.higher(90))
+    
+    
+    def test_irange(self):
+        self.assertEqual(list(self.tree.irange(1, 10)), [])
+        
+        for num in range(0, 100, 10):
+            self.tree.add(num)
+        
+        self.assertEqual(list(self.tree.irange(20, 50)), [20, 30, 40, 50])
+        self.assertEqual(list(self.tree.irange(15, 55)), [20, 30, 40, 50])
+        self.assertEqual(list(self.tree.irange(20, 50, inclusive=(False, False))), [30, 40])
+        self.assertEqual(list(self.tree.irange(hi=20)), [0, 10, 20])
+        self.assertEqual(list(self.tree.irange(lo=70)), [70, 80, 90])
+        self.assertEqual(list(self.tree.irange(50, 20)), [])
+        
+        with self.assertRaises(RuntimeError):
+            for _ in self.tree.irange(10, 80):
+                self.tree.add(15)
+    
+    
+    def test_from_sorted(self):
+        for size in [0, 1, 4, 5, 17, 100, 1000]:
+            tree = BPlusTree.from_sorted(range(size), order=4)
+            self.assertEqual(len(tree), size)
+            self.assertEqual(tree.inorder(), list(range(size)))
+            self.assertEqual(tree.select(size // 2) if size else None, size // 2 if size else None)
+            
+            # the tree must keep working as usual
+            for num in range(0, size, 3):
+                tree.remove(num)
+            tree.add(size)
+            self.assertEqual(tree.inorder(), [num for num in range(size + 1) if num % 3 or num == size])
+        
+        with self.assertRaises(ValueError):
+            BPlusTree.from_sorted([1, 3, 2])
+        self.assertEqual(BPlusTree.from_iterable([3, 1, 2, 1]).inorder(), [1, 2, 3])
+    
+    
+    def test_change_during_iteration(self):
+        for num in range(self.SIZE):
+            self.tree.add(num)
+        
+        pairs = [(a, b) for a in self.tree.irange(0, 2) for b in self.tree.irange(0, 2)]
+        self.assertEqual(len(pairs), 9)
+        with self.assertRaises(RuntimeError):
+            for num in self.tree:
+                self.tree.remove(num)
+    
+    
+    def test_to_string(self):
+        self.assertEqual(str(self.tree), "[]")
+        for value in ["H", "D", "O", "F"]:
+            self.tree.add(value)
+        self.assertEqual(str(self.tree), "[D, F, H, O]")
+    
+    
+    def get_rand_list(self):
+        '''
+        Generate a list of random numbers.
+        '''
+        list = random.sample(range(0, self.MAX_RANDOM_NUM), self.SIZE)
+        random.shuffle(list)
+        return list
+
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
@@ -0,0 +1,95 @@
+'''
+ * An abstract base class for a hash table.
+ *
+ * @author Cosimo Giovanni Negri
+ * @date   18 Oct 2026
+'''
+
+from abc import ABC, abstractmethod
+
+
+class AbstractHashTable(ABC):
+
+    @classmethod
+    def from_items(cls, items, **options):
+        '''
+        Return a new hash table containing all the key-value pairs
+        of a mapping or of an iterable of pairs, sized only once, O(k).
+        NOTE: every other keyword argument is forwarded to the constructor.
+        '''
+        if hasattr(items, 'items'):
+            items = items.items()
+        if not hasattr(items, '__len__'):
+            items = list(items)
+        
+        table = cls(capacity=len(items), **options)
+        table.update(items)
+        return table
+    
+    @abstractmethod
+    def clear(self):
+        pass
+    
+    @abstractmethod
+    def isempty(self):
+        pass
+    
+    @abstractmethod
+    def get(self, key, default=None):
+        pass
+    
+    @abstractmethod
+    def add(self, key, value):
+        pass
+    
+    @abstractmethod
+    def remove(self, key, default=None):
+        pass
+    
+    @abstractmethod
+    def reserve(self, size):
+        pass
+    
+    @abstractmethod
+    def update(self, items):
+        pass
+    
+    @abstractmethod
+    def keys(self):
+        pass
+    
+    @abstractmethod
+    def values(self):
+        pass
+    
+    @abstractmethod
+    def items(self):
+        pass
+    
+    @abstractmethod
+    def __len__(self):
+        pass
+    
+    @abstractmethod
+    def __getitem__(self, key):
+        pass
+    
+    @abstractmethod
+    def __setitem__(self, key, value):
+        pass
+    
+    @abstractmethod
+    def __delitem__(self, key):
+        pass
+    
+    @abstractmethod
+    def __contains__(self, key):
+        pass
+    
+    @abstractmethod
+    def __iter__(self):
+        pass
+    
+    @abstractmethod
+    def __str__(self):
+        pass
\ No newline at end of file
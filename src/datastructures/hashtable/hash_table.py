@@ -0,0 +1,187 @@
+'''
+ * A hash table whose storage engine is chosen at construction time.
+ *
+ * @author Cosimo Giovanni Negri
+ * @date   18 Oct 2026
+'''
+
+from .abstract_hash_table import AbstractHashTable
+from .hash_table_separate_chaining import HashTableSeparateChaining
+from .hash_table_open_addressing import HashTableOpenAddressing
+
+
+class HashTable(AbstractHashTable):
+    '''
+    A hash table whose storage engine is chosen at construction time.
+    NOTE: every operation is forwarded to an instance of the selected engine,
+    built with every other keyword argument, so that the table is still
+    an instance of HashTable and of its subclasses.
+    NOTE: the methods only some engines have, like compact or
+    max_probe_length, are forwarded as well.
+    '''
+    
+    ENGINES = {
+        'chaining': HashTableSeparateChaining,
+        'open_addressing': HashTableOpenAddressing,
+    }
+    
+    def __init__(self, engine='chaining', **options):
+        if engine not in self.ENGINES:
+            raise ValueError(f"engine must be one of {tuple(self.ENGINES)}, not {engine!r}")
+        self.__table = self.ENGINES[engine](**options)
+    
+    
+    def __getattr__(self, name):
+        '''
+        Return the attribute of the engine not defined by the hash table.
+        '''
+        if name.startswith('_'):
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        return getattr(self.__table, name)
+    
+    
+    @property
+    def engine(self):
+        '''
+        Return the instance of the selected engine, O(1).
+        '''
+        return self.__table
+    
+    
+    @property
+    def capacity(self):
+        '''
+        Return the number of buckets of the table, O(1).
+        '''
+        return self.__table.capacity
+    
+    
+    def clear(self):
+        '''
+        Empty the hash table, O(capacity).
+        '''
+        self.__table.clear()
+    
+    
+    def isempty(self):
+        '''
+        Return whether or not the hash table is empty, O(1).
+        '''
+        return self.__table.isempty()
+    
+    
+    def get(self, key, default=None):
+        '''
+        Return the value associated with the key if it exists,
+        otherwise return the default value, O(1)*.
+        '''
+        return self.__table.get(key, default)
+    
+    
+    def add(self, key, value):
+        '''
+        Add a key-value pair to the hash table,
+        or update the value if the key already exists, O(1)*.
+        '''
+        self.__table.add(key, value)
+    
+    
+    def remove(self, key, default=None):
+        '''
+        Remove the key-value pair and return the value if the key exists,
+        otherwise return the default value, O(1)*.
+        '''
+        return self.__table.remove(key, default)
+    
+    
+    def reserve(self, size):
+        '''
+        Grow the table so that it can hold size entries
+        without being resized again, O(n).
+        '''
+        self.__table.reserve(size)
+    
+    
+    def update(self, items):
+        '''
+        Add all the key-value pairs of a mapping
+        or of an iterable of pairs, O(k)*.
+        '''
+        self.__table.update(items)
+    
+    
+    def keys(self):
+        '''
+        Return a copy of the list of keys
+        found within the hash table, O(n).
+        '''
+        return self.__table.keys()
+    
+    
+    def values(self):
+        '''
+        Return a copy of the list of values
+        found within the hash table, O(n).
+        '''
+        return self.__table.values()
+    
+    
+    def items(self):
+        '''
+        Return a copy of the list of key-value tuple pairs
+        found within the hash table, O(n).
+        '''
+        return self.__table.items()
+    
+    
+    def __len__(self):
+        '''
+        Return the size of the hash table, O(1).
+        '''
+        return len(self.__table)
+    
+    
+    def __getitem__(self, key):
+        '''
+        Return the value associated with the key if it exists,
+        otherwise raise an error, O(1)*.
+        '''
+        return self.__table[key]
+    
+    
+    def __setitem__(self, key, value):
+        '''
+        Add a key-value pair to the hash table,
+        or update the value if the key already exists, O(1)*.
+        '''
+        self.__table[key] = value
+    
+    
+    def __delitem__(self, key):
+        '''
+        Remove the key-value pair if the key exists,
+        otherwise raise an error, O(1)*.
+        '''
+        del self.__table[key]
+    
+    
+    def __contains__(self, key):
+        '''
+        Return whether or not the key is in the hash table, O(1)*.
+        '''
+        return key in self.__table
+    
+    
+    def __iter__(self):
+        '''
+        Return a new iterator over the keys of the hash table, O(1).
+        NOTE: adding or removing keys while iterating raises an error.
+        '''
+        return iter(self.__table)
+    
+    
+    def __str__(self):
+        '''
+        Return a string to print the hash table, O(n).
+        '''
+        return str(self.__table)
\ No newline at end of file
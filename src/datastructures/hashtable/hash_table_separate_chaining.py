@@ -8,6 +8,7 @@
  * @date   27 Aug 2022
 '''
 
+from .abstract_hash_table import AbstractHashTable
 from ..linkedlist.doubly_linked_list import DoublyLinkedList
 
 
@@ -15,10 +16,12 @@ class Entry:
     '''
     Entry class to represent the key-value pair of the hash table.
     '''
-    def __init__(self, key, value):
+    __slots__ = ('key', 'value', 'hash')
+    
+    def __init__(self, key, value, key_hash=None):
         self.key = key
         self.value = value
-        self.hash = hash(key)
+        self.hash = hash(key) if key_hash is None else key_hash
     
     def __eq__(self, other):
         if self.hash != other.hash:
@@ -29,21 +32,34 @@ class Entry:
         return f"{str(self.key)}: {str(self.value)}"
 
 
-class HashTableSeparateChaining:
+class HashTableSeparateChaining(AbstractHashTable):
     '''
     A hash table implementation using separate chaining with a doubly linked list.
+    NOTE: if incremental is set to True, the table is resized incrementally:
+    the old and the new table coexist, and every operation migrates only
+    a bounded number of buckets, so that no single operation is O(n).
+    NOTE: capacity is the number of entries the table is expected to hold,
+    so that it is allocated once instead of being doubled many times.
+    NOTE: the table is halved when it becomes a quarter full compared to
+    the load factor, and never shrinks below its initial capacity.
     '''
     
-    def __init__(self):
+    def __init__(self, capacity=None, incremental=False):
         self.__INITIAL_CAPACITY = 4
         self.__LOAD_FACTOR = 0.75
+        # Buckets migrated by every operation, enough to complete a migration
+        # before the table can need to grow or to shrink again
+        self.__REHASH_STEP = 16
+        
+        self.__incremental = incremental
+        self.__old_table = None
+        self.__rehash_index = 0
         
-        self.__capacity = self.__INITIAL_CAPACITY
-        self.__threshold = int(self.__INITIAL_CAPACITY * self.__LOAD_FACTOR)
+        self.__min_capacity = self.__capacity_for(capacity or 0)
+        self.__set_capacity(self.__min_capacity)
         self.__size = 0
-        self.__table = [None for _ in range(self.__INITIAL_CAPACITY)]
-        self.__iter_index = None
-        self.__iterator = None
+        self.__table = [None] * self.__capacity
+        self.__modifications = 0  # to detect changes during an iteration
     
     
     def __check_key_type(self, key):
@@ -61,18 +77,63 @@ class HashTableSeparateChaining:
             raise TypeError(f"unhashable key: {type(key)}")
     
     
+    def __hash_key(self, key):
+        '''
+        Return the hash of the key, raising an error
+        if the key type is not valid, O(1).
+        '''
+        if key is None or key is True or key is False:
+            self.__check_key_type(key)
+        try:
+            return hash(key)
+        except TypeError:
+            raise TypeError(f"unhashable key: {type(key)}")
+    
+    
+    def __set_capacity(self, capacity):
+        '''
+        Set the capacity of the table, and the sizes over and under
+        which the table has to grow or to shrink, O(1).
+        NOTE: the gap between the two thresholds avoids
+        growing and shrinking over and over again.
+        '''
+        self.__capacity = capacity
+        self.__threshold = int(capacity * self.__LOAD_FACTOR)
+        self.__low_threshold = int(capacity * self.__LOAD_FACTOR / 4)
+    
+    
+    def __capacity_for(self, size):
+        '''
+        Return the smallest capacity that can hold the given
+        number of entries without being resized, O(log(size)).
+        '''
+        capacity = self.__INITIAL_CAPACITY
+        while int(capacity * self.__LOAD_FACTOR) < size:
+            capacity *= 2
+        return capacity
+            
+    
+    @property
+    def capacity(self):
+        '''
+        Return the number of buckets of the table, O(1).
+        '''
+        return self.__capacity
+    
+    
     def clear(self):
         '''
         Empty the hash table, O(n).
         '''
-        for bucket in self.__table:
-            if bucket is not None:
-                bucket.clear()
-            
-        self.__capacity = self.__INITIAL_CAPACITY
-        self.__threshold = int(self.__INITIAL_CAPACITY * self.__LOAD_FACTOR)
+        for bucket in self.__all_buckets():
+            bucket.clear()
+        
+        self.__old_table = None
+        self.__rehash_index = 0
+        self.__set_capacity(self.__min_capacity)
         self.__size = 0
-        self.__table = [None for _ in range(self.__INITIAL_CAPACITY)]
+        self.__modifications += 1
+        self.__table = [None] * self.__capacity
     
     
     def isempty(self):
@@ -90,15 +151,89 @@ class HashTableSeparateChaining:
         return (~hash + 1) % self.__capacity
     
     
-    def __resize_table(self):
+    def __all_buckets(self):
+        '''
+        Return a generator over all the non empty buckets,
+        including the ones of the table being migrated, O(n).
+        '''
+        for bucket in self.__table:
+            if bucket is not None:
+                yield bucket
+        
+        if self.__old_table is not None:
+            for bucket in self.__old_table:
+                if bucket is not None:
+                    yield bucket
+    
+    
+    def __rehash_step(self, buckets):
+        '''
+        Migrate up to the given number of buckets from the old table
+        to the new one, O(buckets)*.
+        '''
+        old_table = self.__old_table
+        old_capacity = len(old_table)
+        stop = min(self.__rehash_index + buckets, old_capacity)
+        
+        for index in range(self.__rehash_index, stop):
+            bucket = old_table[index]
+            if bucket is None: continue
+            
+            for entry in bucket:
+                self.__table_append(entry)
+            
+            # Memory cleanup of the migrated bucket
+            bucket.clear()
+            old_table[index] = None
+        
+        self.__rehash_index = stop
+        if stop == old_capacity:
+            self.__old_table = None
+            self.__rehash_index = 0
+    
+    
+    def __table_append(self, entry):
+        '''
+        Append an entry whose key does not exist
+        to the right bucket of the table, O(1).
+        '''
+        bucket_index = self.__get_index(entry.hash)
+        bucket = self.__table[bucket_index]
+        if bucket is None:
+            bucket = self.__table[bucket_index] = DoublyLinkedList()
+        bucket.append(entry)
+    
+    
+    def __resize_table(self, capacity):
         '''
         Resize the table holding buckets of entries, O(n).
+        NOTE: in incremental mode only a new empty table is allocated, O(capacity),
+        and the entries are migrated a few buckets at a time by the next operations.
         '''
-        self.__capacity *= 2
-        self.__threshold = int(self.__capacity * self.__LOAD_FACTOR)
+        if self.__incremental:
+            # A migration still in progress must be completed first
+            if self.__old_table is not None:
+                self.__rehash_step(len(self.__old_table))
+            
+            self.__old_table = self.__table
+            self.__rehash_index = 0
+            self.__set_capacity(capacity)
+            self.__table = [None] * self.__capacity
+            return
         
-        new_table = [None for _ in range(self.__capacity)]
+        self.__rehash_table(capacity)
+    
+    
+    def __rehash_table(self, capacity):
+        '''
+        Move all the entries to a new table with the given capacity, O(n).
+        NOTE: empty buckets are not copied, so their memory is freed.
+        '''
+        self.__modifications += 1
+        self.__set_capacity(capacity)
         
+        new_table = [None] * self.__capacity
+                
         for bucket in self.__table:
             if bucket is None: continue
             
@@ -118,21 +253,76 @@ class HashTableSeparateChaining:
         self.__table = new_table
     
     
-    def __bucket_search_entry(self, bucket_index, key):
+    def reserve(self, size):
+        '''
+        Resize the table once so that it can hold the given
+        number of entries without being resized again, O(n).
+        NOTE: the table is never shrunk by this method.
+        '''
+        if self.__old_table is not None:
+            self.__rehash_step(len(self.__old_table))
+        
+        capacity = self.__capacity_for(size)
+        if capacity > self.__capacity:
+            self.__rehash_table(capacity)
+    
+    
+    def compact(self):
+        '''
+        Rebuild the table with the smallest capacity that can hold
+        its entries, freeing all the empty buckets, O(n).
+        NOTE: the table never shrinks below its initial capacity.
+        '''
+        if self.__old_table is not None:
+            self.__rehash_step(len(self.__old_table))
+        
+        capacity = max(self.__min_capacity, self.__capacity_for(self.__size))
+        self.__rehash_table(capacity)
+    
+    
+    def __bucket_search_entry(self, bucket, key, key_hash):
         '''
         Return the key's entry if the key exists in the given bucket
         of the hash table, otherwise return None, O(1).
+        NOTE: the cached hash is compared before the key itself.
         '''
-        bucket = self.__table[bucket_index]
         if bucket is None: return None
         
         for entry in bucket:
-            if type(entry.key) == type(key) and entry.key == key:
-                return entry
+            if entry.hash == key_hash:
+                entry_key = entry.key
+                if entry_key is key or \
+                        (type(entry_key) == type(key) and entry_key == key):
+                    return entry
         
         return None
     
     
+    def __search_entry(self, key, key_hash):
+        '''
+        Return the bucket holding the key's entry and the entry itself
+        if the key exists in the hash table, otherwise return (None, None), O(1).
+        NOTE: during an incremental resize a few buckets are migrated first,
+        and the old table is consulted too if the key is not in the new one.
+        NOTE: the lookups which do not change the table search the bucket
+        inline instead, and call this method only during an incremental resize.
+        '''
+        if self.__old_table is not None:
+            self.__rehash_step(self.__REHASH_STEP)
+        
+        bucket = self.__table[self.__get_index(key_hash)]
+        entry = self.__bucket_search_entry(bucket, key, key_hash)
+        
+        if entry is None and self.__old_table is not None:
+            old_table = self.__old_table
+            bucket = old_table[(~key_hash + 1) % len(old_table)]
+            entry = self.__bucket_search_entry(bucket, key, key_hash)
+        
+        if entry is None:
+            return None, None
+        return bucket, entry
+    
+    
     def get(self, key, default=None):
         '''
         Return the key's value if the key exists in the hash table,
@@ -142,57 +332,114 @@ class HashTableSeparateChaining:
         a key's value is None, so watch out...
         NOTE: If the key type is not valid, raise an error.
         '''
-        self.__check_key_type(key)
-        bucket_index = self.__get_index(hash(key))
-        entry = self.__bucket_search_entry(bucket_index, key)
+        if key is None or key is True or key is False:
+            self.__check_key_type(key)
+        try:
+            key_hash = hash(key)
+        except TypeError:
+            raise TypeError(f"unhashable key: {type(key)}") from None
         
-        if entry is None:
-            return default
-        else:
-            return entry.value
+        if self.__old_table is not None:
+            entry = self.__search_entry(key, key_hash)[1]
+            return default if entry is None else entry.value
+        
+        bucket = self.__table[(~key_hash + 1) % self.__capacity]
+        if bucket is not None:
+            for entry in bucket:
+                if entry.hash == key_hash:
+                    entry_key = entry.key
+                    if entry_key is key or (type(entry_key) == type(key) and entry_key == key):
+                        return entry.value
+        return default
     
     
-    def __bucket_add_entry(self, bucket_index, entry):
+    def add(self, key, value):
         '''
-        Add an entry if the key does not exist in the given bucket
-        of the hash table, otherwise update the key's value, O(1).
+        Add a key-value pair if the key does not exist in the
+        hash table, otherwise update the key's value, O(1).
+        NOTE: If the key type is not valid, raise an error.
         '''
-        bucket = self.__table[bucket_index]
-        if bucket is None:
-            bucket = self.__table[bucket_index] = DoublyLinkedList()
+        key_hash = self.__hash_key(key)
+        bucket, existent_entry = self.__search_entry(key, key_hash)
         
-        existent_entry = self.__bucket_search_entry(bucket_index, entry.key)
         if existent_entry is None:
-            bucket.append(entry)
+            self.__table_append(Entry(key, value, key_hash))
             self.__size += 1
-            if self.__size > self.__threshold: self.__resize_table()
+            self.__modifications += 1
+            if self.__size > self.__threshold: self.__resize_table(self.__capacity * 2)
         else:
-            existent_entry.value = entry.value
+            existent_entry.value = value
     
     
-    def add(self, key, value):
+    def update(self, items):
         '''
-        Add a key-value pair if the key does not exist in the
-        hash table, otherwise update the key's value, O(1).
-        NOTE: If the key type is not valid, raise an error.
+        Add all the key-value pairs of a mapping or of an iterable
+        of pairs, updating the values of the existing keys, O(k).
+        NOTE: the table is resized at most once, and every key
+        is validated and hashed only once.
+        NOTE: If a key type is not valid, raise an error.
         '''
-        self.__check_key_type(key)
+        if hasattr(items, 'items'):
+            items = items.items()
+        if not hasattr(items, '__len__'):
+            items = list(items)
+        self.reserve(self.__size + len(items))
         
-        new_entry = Entry(key, value)
-        bucket_index = self.__get_index(new_entry.hash)
-        self.__bucket_add_entry(bucket_index, new_entry)
-    
+        table = self.__table
+        capacity = self.__capacity
+        for key, value in items:
+            key_hash = self.__hash_key(key)
+            bucket_index = (~key_hash + 1) % capacity
+            bucket = table[bucket_index]
+            
+            if bucket is None:
+                bucket = table[bucket_index] = DoublyLinkedList()
+            else:
+                entry = self.__bucket_search_entry(bucket, key, key_hash)
+                if entry is not None:
+                    entry.value = value
+                    continue
+            
+            bucket.append(Entry(key, value, key_hash))
+            self.__size += 1
+            self.__modifications += 1
+                
     
-    def __bucket_remove_entry(self, bucket_index, entry):
+    def __bucket_remove_entry(self, bucket, entry):
         '''
-        Remove an entry and return the key's value, O(1)*.
+        Remove an entry from its bucket and return the key's value, O(1)*.
+        NOTE: an emptied bucket is dropped from its table, and the table
+        is halved if it went under the low threshold.
         '''
-        bucket = self.__table[bucket_index]
         bucket.remove(entry)
         self.__size -= 1
+        self.__modifications += 1
+        
+        if bucket.isempty():
+            self.__drop_bucket(bucket, entry.hash)
+        
+        if self.__size < self.__low_threshold and \
+                self.__capacity > self.__min_capacity and \
+                self.__old_table is None:
+            self.__resize_table(self.__capacity // 2)
+        
         return entry.value
     
     
+    def __drop_bucket(self, bucket, key_hash):
+        '''
+        Remove an empty bucket from the table holding it, O(1).
+        '''
+        bucket_index = self.__get_index(key_hash)
+        if self.__table[bucket_index] is bucket:
+            self.__table[bucket_index] = None
+            return
+        
+        old_table = self.__old_table
+        old_bucket_index = (~key_hash + 1) % len(old_table)
+        old_table[old_bucket_index] = None
+    
+    
     def remove(self, key, default=None):
         '''
         Remove a key-value pair and return the key's value
@@ -203,14 +450,12 @@ class HashTableSeparateChaining:
         a key's value is None, so watch out...
         NOTE: If the key type is not valid, raise an error.
         '''
-        self.__check_key_type(key)
-        bucket_index = self.__get_index(hash(key))
-        entry = self.__bucket_search_entry(bucket_index, key)
+        bucket, entry = self.__search_entry(key, self.__hash_key(key))
         
         if entry is None:
             return default
         else:
-            return self.__bucket_remove_entry(bucket_index, entry)
+            return self.__bucket_remove_entry(bucket, entry)
     
     
     def keys(self):
@@ -219,9 +464,7 @@ class HashTableSeparateChaining:
         found within the hash table, O(n).
         '''
         keys = []
-        for bucket in self.__table:
-            if bucket is None: continue
-            
+        for bucket in self.__all_buckets():
             for entry in bucket:
                 keys.append(entry.key)
         
@@ -234,9 +477,7 @@ class HashTableSeparateChaining:
         found within the hash table, O(n).
         '''
         values = []
-        for bucket in self.__table:
-            if bucket is None: continue
-            
+        for bucket in self.__all_buckets():
             for entry in bucket:
                 values.append(entry.value)
         
@@ -249,9 +490,7 @@ class HashTableSeparateChaining:
         found within the hash table, O(n).
         '''
         items = []
-        for bucket in self.__table:
-            if bucket is None: continue
-            
+        for bucket in self.__all_buckets():
             for entry in bucket:
                 items.append((entry.key, entry.value))
         
@@ -271,14 +510,27 @@ class HashTableSeparateChaining:
         otherwise raise an error, O(1)*.
         NOTE: If the key type is not valid, raise an error.
         '''
-        self.__check_key_type(key)
-        bucket_index = self.__get_index(hash(key))
-        entry = self.__bucket_search_entry(bucket_index, key)
+        if key is None or key is True or key is False:
+            self.__check_key_type(key)
+        try:
+            key_hash = hash(key)
+        except TypeError:
+            raise TypeError(f"unhashable key: {type(key)}") from None
         
-        if entry is None:
-            raise KeyError(f"{key} not in hash table")
-        else:
+        if self.__old_table is not None:
+            entry = self.__search_entry(key, key_hash)[1]
+            if entry is None:
+                raise KeyError(f"{key} not in hash table")
             return entry.value
+        
+        bucket = self.__table[(~key_hash + 1) % self.__capacity]
+        if bucket is not None:
+            for entry in bucket:
+                if entry.hash == key_hash:
+                    entry_key = entry.key
+                    if entry_key is key or (type(entry_key) == type(key) and entry_key == key):
+                        return entry.value
+        raise KeyError(f"{key} not in hash table")
     
     
     def __setitem__(self, key, value):
@@ -296,56 +548,57 @@ class HashTableSeparateChaining:
         otherwise raise an error, O(1).
         NOTE: If the key type is not valid, raise an error.
         '''
-        self.__check_key_type(key)
-        bucket_index = self.__get_index(hash(key))
-        entry = self.__bucket_search_entry(bucket_index, key)
+        bucket, entry = self.__search_entry(key, self.__hash_key(key))
         
         if entry is None:
             raise KeyError(f"{key} not in hash table")
         else:
-            self.__bucket_remove_entry(bucket_index, entry)
+            self.__bucket_remove_entry(bucket, entry)
     
     
     def __contains__(self, key):
         '''
         Return whether or not a key is in the hash table, O(1).
+        NOTE: keys with a type that is not valid are never in the hash table.
         '''
+        if key is None or key is True or key is False:
+            return False
         try:
-            self.__getitem__(key)
-            return True
-        except:
+            key_hash = hash(key)
+        except TypeError:
             return False
+        
+        if self.__old_table is not None:
+            return self.__search_entry(key, key_hash)[1] is not None
+        
+        bucket = self.__table[(~key_hash + 1) % self.__capacity]
+        if bucket is not None:
+            for entry in bucket:
+                if entry.hash == key_hash:
+                    entry_key = entry.key
+                    if entry_key is key or (type(entry_key) == type(key) and entry_key == key):
+                        return True
+        return False
     
     
     def __iter__(self):
         '''
-        Called when iteration is initialized, O(1).
-        '''
-        self.__iter_index = 0
-        return self 
-    
-    
-    def __next__(self):
+        Return a new iterator over the keys of the hash table, O(1).
+        NOTE: an incremental resize in progress is completed first, O(n),
+        so that the entries do not move while they are being iterated.
+        NOTE: adding or removing keys while iterating raises an error.
         '''
-        To move to the next entry, O(1).
-        '''
-        while self.__iter_index < self.__capacity:
-            
-            if self.__iterator is None:
-                bucket = self.__table[self.__iter_index]
-                if bucket is None:
-                    self.__iter_index += 1
-                    continue
-                
-                self.__iterator = iter(bucket)
-            
-            try:
-                return next(self.__iterator).key
-            except Exception:
-                self.__iter_index += 1
-                self.__iterator = None
+        if self.__old_table is not None:
+            self.__rehash_step(len(self.__old_table))
+        modifications = self.__modifications
         
-        raise StopIteration
+        for bucket in self.__table:
+            if bucket is None: continue
+            
+            for entry in bucket:
+                yield entry.key
+                if self.__modifications != modifications:
+                    raise RuntimeError("hash table changed size during iteration")
     
     
     def __str__(self):
@@ -355,9 +608,7 @@ class HashTableSeparateChaining:
         NOTE: inorder exploration is used to find the list of values
         '''
         strings = []
-        for bucket in self.__table:
-            if bucket is None: continue
-            
+        for bucket in self.__all_buckets():
             for entry in bucket:
                 strings.append(str(entry))
         
@@ -277,6 +277,21 @@ class HashTableTest(unittest.TestCase):
         self.assertEqual(len(self.dict), 1)
     
     
+    def test_contains_invalid_key(self):
+        for i in range(self.SIZE):
+            self.dict.add(i, i)
+        self.dict.add("a", 10)
+        
+        # Keys that are not valid are never in the hash table, and raise nothing
+        for key in ([], {}, set(), ([1],), NonHashableObject(3), None, True, False):
+            self.assertFalse(key in self.dict)
+        
+        # Keys of another type are never equal to the keys in the hash table
+        for key in ("1", "3", (3,), "b", b"a"):
+            self.assertFalse(key in self.dict)
+        self.assertEqual(len(self.dict), self.SIZE + 1)
+    
+    
     def test_iteration(self):
         with self.assertRaises(StopIteration):
             iter_obj = iter(self.dict)
@@ -297,6 +312,33 @@ class HashTableTest(unittest.TestCase):
             next(iter_obj)
     
     
+    def test_nested_iteration(self):
+        self.dict.add(1, 10)
+        self.dict.add(2, 20)
+        self.dict.add(3, 30)
+        
+        pairs = [(a, b) for a in self.dict for b in self.dict]
+        self.assertEqual(sorted(pairs), [(a, b) for a in [1, 2, 3] for b in [1, 2, 3]])
+    
+    
+    def test_change_during_iteration(self):
+        self.dict.add(1, 10)
+        self.dict.add(2, 20)
+        self.dict.add(3, 30)
+        
+        # updating the values does not change the keys
+        for key in self.dict:
+            self.dict[key] = -1
+        self.assertEqual(self.dict.values(), [-1, -1, -1])
+        
+        with self.assertRaises(RuntimeError):
+            for key in self.dict:
+                self.dict.add(4, 40)
+        with self.assertRaises(RuntimeError):
+            for key in self.dict:
+                self.dict.remove(key)
+    
+    
     def test_to_string(self):
         self.assertEqual(str(self.dict), "{}")
         self.dict.add('a', 1)
@@ -321,6 +363,65 @@ class HashTableTest(unittest.TestCase):
         )
     
     
+    def test_capacity(self):
+        table = type(self.dict)(capacity=1000)
+        self.assertTrue(table.isempty())
+        for key in range(1000):
+            table[key] = key
+        self.assertEqual(len(table), 1000)
+        self.assertEqual(table[999], 999)
+        
+        table.clear()
+        self.assertEqual(len(table), 0)
+        self.assertEqual(table.get(999), None)
+    
+    
+    def test_reserve(self):
+        self.dict.add(1, 10)
+        self.dict.reserve(500)
+        self.assertEqual(self.dict.get(1), 10)
+        
+        # reserving less space than needed does nothing
+        self.dict.reserve(0)
+        self.assertEqual(len(self.dict), 1)
+        self.assertEqual(self.dict.get(1), 10)
+    
+    
+    def test_update(self):
+        self.dict.add(1, 10)
+        self.dict.update({1: 11, 2: 20})
+        self.dict.update([(3, 30), (4, 40), (3, 33)])
+        self.dict.update((key, key * 10) for key in range(5, 8))
+        self.assertEqual(
+            sorted(self.dict.items()),
+            [(1, 11), (2, 20), (3, 33), (4, 40), (5, 50), (6, 60), (7, 70)]
+        )
+        
+        other = type(self.dict)()
+        other.update(self.dict)
+        self.assertEqual(sorted(other.items()), sorted(self.dict.items()))
+        
+        with self.assertRaises(TypeError):
+            self.dict.update([(None, 1)])
+        with self.assertRaises(TypeError):
+            self.dict.update([(True, 1)])
+        with self.assertRaises(TypeError):
+            self.dict.update([([], 1)])
+    
+    
+    def test_from_items(self):
+        python_dict = {}
+        for key, value in zip(self.get_rand_list(), self.get_rand_list()):
+            python_dict[key] = value
+        
+        table = type(self.dict).from_items(python_dict)
+        self.assertEqual(len(table), len(python_dict))
+        self.assertEqual(sorted(table.items()), sorted(python_dict.items()))
+        
+        table = type(self.dict).from_items(iter(python_dict.items()))
+        self.assertEqual(sorted(table.items()), sorted(python_dict.items()))
+    
+    
     def get_rand_list(self):
         '''
         Generate a list of random numbers.
@@ -328,7 +429,123 @@ class HashTableTest(unittest.TestCase):
         list = random.sample(range(0, self.MAX_RANDOM_NUM), self.SIZE)
         random.shuffle(list)
         return list
+
+
+class HashTableIncrementalTest(HashTableTest):
+
+    def setUp(self):
+        super().setUp()
+        self.dict = HashTableSeparateChaining(incremental=True)
+    
+    
+    def test_lookup_during_migration(self):
+        python_dict = {}
+        
+        for key in range(self.MAX_RANDOM_NUM * 4):
+            self.dict[key] = key * 2
+            python_dict[key] = key * 2
+            
+            # every lookup also migrates some buckets from the old table
+            for _ in range(3):
+                other = random.randrange(key + 1)
+                self.assertEqual(self.dict[other], python_dict[other])
+                self.assertTrue(other in self.dict)
+            self.assertEqual(len(self.dict), len(python_dict))
+        
+        self.assertEqual(sorted(self.dict.items()), sorted(python_dict.items()))
+    
     
+    def test_remove_during_migration(self):
+        python_dict = {}
+        
+        for _ in range(self.LOOPS * 10):
+            key = random.randrange(self.MAX_RANDOM_NUM)
+            if random.random() < 0.7:
+                self.dict[key] = key
+                python_dict[key] = key
+            else:
+                self.assertEqual(self.dict.remove(key), python_dict.pop(key, None))
+            self.assertEqual(len(self.dict), len(python_dict))
+        
+        self.assertEqual(sorted(self.dict.keys()), sorted(python_dict.keys()))
+        self.assertEqual(sorted(self.dict), sorted(python_dict))
+
+
+
+class HashTableShrinkTest(unittest.TestCase):
+
+    def setUp(self):
+        self.SIZE = 1000
+    
+    
+    def check_shrink(self, dict):
+        initial_capacity = dict.capacity
+        for key in range(self.SIZE):
+            dict[key] = key
+        full_capacity = dict.capacity
+        self.assertGreater(full_capacity, initial_capacity)
+        
+        for key in range(self.SIZE - 10):
+            del dict[key]
+        self.assertLess(dict.capacity, full_capacity)
+        self.assertEqual(sorted(dict.keys()), list(range(self.SIZE - 10, self.SIZE)))
+        
+        for key in range(self.SIZE - 10, self.SIZE):
+            del dict[key]
+        self.assertEqual(len(dict), 0)
+        self.assertEqual(dict.capacity, initial_capacity)
+    
+    
+    def test_shrink(self):
+        self.check_shrink(HashTableSeparateChaining())
+    
+    
+    def test_incremental_shrink(self):
+        self.check_shrink(HashTableSeparateChaining(incremental=True))
+    
+    
+    def test_no_shrink_below_capacity_hint(self):
+        dict = HashTableSeparateChaining(capacity=self.SIZE)
+        capacity = dict.capacity
+        for key in range(self.SIZE):
+            dict[key] = key
+        for key in range(self.SIZE):
+            del dict[key]
+        self.assertEqual(dict.capacity, capacity)
+    
+    
+    def test_hysteresis(self):
+        dict = HashTableSeparateChaining()
+        for key in range(self.SIZE):
+            dict[key] = key
+        for key in range(self.SIZE // 2, self.SIZE):
+            del dict[key]
+        
+        # adding and removing around the same size does not resize the table
+        capacity = dict.capacity
+        for _ in range(100):
+            dict[self.SIZE] = 0
+            del dict[self.SIZE]
+        self.assertEqual(dict.capacity, capacity)
+    
+    
+    def test_compact(self):
+        dict = HashTableSeparateChaining()
+        for key in range(self.SIZE):
+            dict[key] = key
+        capacity = dict.capacity
+        
+        # removing half of the keys does not reach the low threshold
+        for key in range(0, self.SIZE, 2):
+            del dict[key]
+        self.assertEqual(dict.capacity, capacity)
+        
+        dict.compact()
+        self.assertLess(dict.capacity, capacity)
+        self.assertEqual(sorted(dict.keys()), list(range(1, self.SIZE, 2)))
+        for key in range(1, self.SIZE, 2):
+            self.assertEqual(dict[key], key)
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,211 @@
+'''
+ * An open addressing hash table unit test.
+ *
+ * NOTE: all the tests of the separate chaining hash table are inherited,
+ * since the two engines must expose the same public API.
+ *
+ * @author Cosimo Giovanni Negri
+ * @date   18 Oct 2026
+'''
+
+import unittest
+import sys
+import os
+import random
+
+if __name__ == "__main__":
+    sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+    from datastructures.hashtable.hash_table_open_addressing import HashTableOpenAddressing
+    from datastructures.hashtable.hash_table_separate_chaining import HashTableSeparateChaining
+    from datastructures.hashtable.hash_table import HashTable
+    from datastructures.hashtable.test_hash_table import HashTableTest, HashableObject
+else:
+    from .hash_table_open_addressing import HashTableOpenAddressing
+    from .hash_table_separate_chaining import HashTableSeparateChaining
+    from .hash_table import HashTable
+    from .test_hash_table import HashTableTest, HashableObject
+
+
+class HashTableOpenAddressingTest(HashTableTest):
+
+    def setUp(self):
+        super().setUp()
+        self.dict = HashTableOpenAddressing()
+    
+    
+    def test_invalid_probing(self):
+        with self.assertRaises(ValueError):
+            HashTableOpenAddressing(probing='cubic')
+    
+    
+    def test_colliding_keys(self):
+        objects = [HashableObject(i, 42) for i in range(self.SIZE)]
+        
+        for i, object in enumerate(objects):
+            self.dict.add(object, i)
+        self.assertEqual(len(self.dict), self.SIZE)
+        
+        for i, object in enumerate(objects):
+            self.assertEqual(self.dict.get(object), i)
+        
+        # Removing from the middle of the probing chain leaves tombstones behind
+        for object in objects[::2]:
+            self.dict.remove(object)
+        for i, object in enumerate(objects):
+            if i % 2 == 0:
+                self.assertFalse(object in self.dict)
+            else:
+                self.assertEqual(self.dict[object], i)
+    
+    
+    def test_tombstone_reuse(self):
+        for _ in range(self.LOOPS):
+            self.dict.add(1, 10)
+            self.dict.remove(1)
+        
+        self.assertEqual(len(self.dict), 0)
+        self.assertEqual(self.dict.keys(), [])
+        self.dict.add(1, 10)
+        self.assertEqual(self.dict.items(), [(1, 10)])
+    
+    
+    def test_random_operations(self):
+        python_dict = {}
+        
+        for _ in range(self.LOOPS * 10):
+            key = random.randrange(self.MAX_RANDOM_NUM)
+            if random.random() < 0.6:
+                self.dict[key] = key * 2
+                python_dict[key] = key * 2
+            else:
+                self.assertEqual(self.dict.remove(key), python_dict.pop(key, None))
+            
+            self.assertEqual(len(self.dict), len(python_dict))
+        
+        self.assertEqual(sorted(self.dict.items()), sorted(python_dict.items()))
+
+
+class HashTableQuadraticProbingTest(HashTableOpenAddressingTest):
+
+    def setUp(self):
+        super().setUp()
+        self.dict = HashTableOpenAddressing(probing='quadratic')
+
+
+class HashTableRobinHoodTest(HashTableOpenAddressingTest):
+
+    def setUp(self):
+        super().setUp()
+        self.dict = HashTableOpenAddressing(probing='robin_hood')
+    
+    
+    def test_probe_length(self):
+        self.assertEqual(self.dict.max_probe_length(), 0)
+        self.assertEqual(self.dict.mean_probe_length(), 0.0)
+        
+        objects = [HashableObject(i, 64) for i in range(3)]
+        for object in objects:
+            self.dict.add(object, None)
+        self.assertEqual(self.dict.max_probe_length(), 2)
+        self.assertEqual(self.dict.mean_probe_length(), 1.0)
+        
+        # The following entries are shifted back, so every distance decreases
+        self.dict.remove(objects[0])
+        self.assertEqual(self.dict.max_probe_length(), 1)
+        self.assertEqual(self.dict.mean_probe_length(), 0.5)
+        self.assertTrue(objects[1] in self.dict)
+        self.assertTrue(objects[2] in self.dict)
+    
+    
+    def test_probe_length_bound(self):
+        keys = random.sample(range(self.MAX_RANDOM_NUM * 100), self.SIZE * 10)
+        linear = HashTableOpenAddressing(probing='linear')
+        for key in keys:
+            linear.add(key, None)
+            self.dict.add(key, None)
+        
+        # Robin Hood only reorders the linear probing sequences
+        self.assertEqual(self.dict.mean_probe_length(), linear.mean_probe_length())
+        self.assertLessEqual(self.dict.max_probe_length(), linear.max_probe_length())
+
+
+class HashTableSelectorTest(HashTableTest):
+
+    def setUp(self):
+        super().setUp()
+        self.dict = HashTable(engine='open_addressing', probing='robin_hood')
+
+
+class HashTableEngineTest(unittest.TestCase):
+
+    def test_default_engine(self):
+        table = HashTable()
+        self.assertIsInstance(table, HashTable)
+        self.assertIsInstance(table.engine, HashTableSeparateChaining)
+    
+    
+    def test_engine_selector(self):
+        self.assertIsInstance(HashTable(engine='chaining').engine, HashTableSeparateChaining)
+        
+        table = HashTable(engine='open_addressing', probing='quadratic')
+        self.assertIsInstance(table, HashTable)
+        self.assertIsInstance(table.engine, HashTableOpenAddressing)
+        self.assertEqual(table.probing, 'quadratic')
+    
+    
+    def test_invalid_engine(self):
+        with self.assertRaises(ValueError):
+            HashTable(engine='cuckoo')
+        with self.assertRaises(ValueError):
+            HashTable.from_items({}, engine='cuckoo')
+    
+    
+    def test_subclass(self):
+        class CountingHashTable(HashTable):
+            def __init__(self, **options):
+                super().__init__(**options)
+                self.adds = 0
+            
+            def add(self, key, value):
+                self.adds += 1
+                super().add(key, value)
+        
+        table = CountingHashTable(engine='open_addressing')
+        self.assertIsInstance(table, CountingHashTable)
+        self.assertIsInstance(table, HashTable)
+        table.add(1, 10)
+        table.add(2, 20)
+        self.assertEqual(table.adds, 2)
+        self.assertEqual(table[2], 20)
+        self.assertIsInstance(CountingHashTable.from_items({1: 10}), CountingHashTable)
+    
+    
+    def test_engine_methods(self):
+        table = HashTable(engine='chaining')
+        table.update((i, i) for i in range(100))
+        for i in range(90):
+            del table[i]
+        capacity = table.capacity
+        table.compact()
+        self.assertLessEqual(table.capacity, capacity)
+        
+        with self.assertRaises(AttributeError):
+            table.max_probe_length()
+        with self.assertRaises(AttributeError):
+            table._HashTable__missing
+    
+    
+    def test_from_items(self):
+        table = HashTable.from_items({1: 10, 2: 20})
+        self.assertIsInstance(table, HashTable)
+        self.assertIsInstance(table.engine, HashTableSeparateChaining)
+        self.assertEqual(sorted(table.items()), [(1, 10), (2, 20)])
+        
+        table = HashTable.from_items([(1, 10), (2, 20)], engine='open_addressing', probing='robin_hood')
+        self.assertIsInstance(table.engine, HashTableOpenAddressing)
+        self.assertEqual(table.probing, 'robin_hood')
+        self.assertEqual(sorted(table.items()), [(1, 10), (2, 20)])
+
+
+if __name__ == '__main__':
+    unittest.main()
\ No newline at end of file
@@ -12,6 +12,8 @@ class Node:
     '''
     Node class to represent an element of the linked list.
     '''
+    __slots__ = ('value', 'prev', 'next')
+    
     def __init__(self, value, prev=None, next=None):
         self.value = value
         self.prev = prev
@@ -29,7 +31,7 @@ class DoublyLinkedList:
         self.__size = 0
         self.__head = None
         self.__tail = None
-        self.__trav = None
+        self.__modifications = 0  # to detect changes during an iteration
 
 
     def clear(self):
@@ -45,6 +47,7 @@ class DoublyLinkedList:
             trav = temp
         
         self.__size = 0
+        self.__modifications += 1
         self.__head = self.__tail = None
     
     
@@ -67,6 +70,7 @@ class DoublyLinkedList:
             self.__tail = new_node
             
         self.__size += 1
+        self.__modifications += 1
     
     
     def appendleft(self, value):
@@ -81,6 +85,7 @@ class DoublyLinkedList:
             self.__head = new_node
         
         self.__size += 1
+        self.__modifications += 1
     
     
     def insert(self, index, value):
@@ -118,6 +123,7 @@ class DoublyLinkedList:
         trav.next.prev = new_node
         trav.next = new_node
         self.__size += 1
+        self.__modifications += 1
     
     
     def peek(self):
@@ -152,6 +158,7 @@ class DoublyLinkedList:
         node.prev.next = node.next
         node.next.prev = node.prev
         self.__size -= 1
+        self.__modifications += 1
         
         # Memory cleanup of the node that was just removed
         node.prev = node.next = None
@@ -171,6 +178,7 @@ class DoublyLinkedList:
         value = self.__tail.value
         self.__tail = self.__tail.prev
         self.__size -= 1
+        self.__modifications += 1
         
         if (self.isempty()):
             self.__head = None
@@ -192,6 +200,7 @@ class DoublyLinkedList:
         value = self.__head.value
         self.__head = self.__head.next
         self.__size -= 1
+        self.__modifications += 1
         
         if self.isempty():
             self.__tail = None
@@ -278,22 +287,17 @@ class DoublyLinkedList:
     
     def __iter__(self):
         '''
-        Called when iteration is initialized, O(1).
-        '''
-        self.__trav = self.__head
-        return self
-    
-    
-    def __next__(self):
-        '''
-        To move to the next node, O(1).
+        Return a new iterator over the values of the linked list, O(1).
+        NOTE: adding or removing nodes while iterating raises an error.
         '''
-        if self.__trav is None:
-            raise StopIteration
+        modifications = self.__modifications
+        trav = self.__head
         
-        value = self.__trav.value
-        self.__trav = self.__trav.next
-        return value
+        while trav is not None:
+            yield trav.value
+            if self.__modifications != modifications:
+                raise RuntimeError("linked list changed size during iteration")
+            trav = trav.next
     
     
     def __str__(self):
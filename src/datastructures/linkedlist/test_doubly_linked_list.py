@@ -345,6 +345,28 @@ class DoublyLinkedListTest(unittest.TestCase):
             next(iter_obj)
     
     
+    def test_nested_iteration(self):
+        self.list.append(1)
+        self.list.append(2)
+        self.list.append(3)
+        
+        pairs = [(a, b) for a in self.list for b in self.list]
+        self.assertEqual(pairs, [(a, b) for a in [1, 2, 3] for b in [1, 2, 3]])
+    
+    
+    def test_change_during_iteration(self):
+        self.list.append(1)
+        self.list.append(2)
+        self.list.append(3)
+        
+        with self.assertRaises(RuntimeError):
+            for _ in self.list:
+                self.list.append(4)
+        with self.assertRaises(RuntimeError):
+            for _ in self.list:
+                self.list.popleft()
+    
+    
     def test_to_string(self):
         self.assertEqual(str(self.list), "[]")
         self.list.append('a')
@@ -0,0 +1,184 @@
+'''
+ * A queue implementation using a circular buffer.
+ *
+ * Main inspiration: William Fiset
+ * https://github.com/williamfiset/Algorithms/blob/master/src/main/java/com/williamfiset/algorithms/datastructures/queue/ArrayQueue.java
+ *
+ * @author Cosimo Giovanni Negri
+ * @date   18 Oct 2026
+'''
+
+from .abstract_queue import AbstractQueue
+
+
+class ArrayQueue(AbstractQueue):
+    '''
+    A queue implementation using a circular buffer.
+    NOTE: the values are kept in a list used as a ring, where the front
+    moves forward on every dequeue, so that no memory is allocated
+    for a single value as in a linked queue.
+    NOTE: if capacity is None the buffer is doubled when it is full and
+    halved when it is a quarter full, otherwise the queue holds
+    at most capacity values and the buffer is allocated once.
+    '''
+    def __init__(self, capacity=None):
+        if capacity is not None:
+            if not isinstance(capacity, int) or isinstance(capacity, bool) or capacity < 1:
+                raise ValueError("capacity must be None or an integer greater or equal than 1")
+        
+        self.__INITIAL_CAPACITY = 8
+        
+        self.__capacity = capacity
+        self.__modifications = 0  # to detect changes during an iteration
+        self.__init_buffer()
+    
+    
+    def __init_buffer(self):
+        '''
+        Allocate an empty buffer, O(capacity).
+        '''
+        length = self.__INITIAL_CAPACITY if self.__capacity is None else self.__capacity
+        self.__buffer = [None] * length
+        self.__front = 0  # index of the value at the front of the queue
+        self.__size = 0
+    
+    
+    @property
+    def capacity(self):
+        '''
+        Return the maximum number of values in the queue,
+        or None if it grows without limits, O(1).
+        '''
+        return self.__capacity
+    
+    
+    def clear(self):
+        '''
+        Empty the queue, O(capacity).
+        '''
+        self.__init_buffer()
+        self.__modifications += 1
+    
+    
+    def isempty(self):
+        '''
+        Return whether or not the queue is empty, O(1).
+        '''
+        return self.__size == 0
+    
+    
+    def isfull(self):
+        '''
+        Return whether or not the queue holds as many
+        values as its capacity, O(1).
+        NOTE: a queue without a capacity is never full.
+        '''
+        return self.__capacity is not None and self.__size == self.__capacity
+    
+    
+    def __resize(self, length):
+        '''
+        Move the values to a new buffer with the given length,
+        starting from its first slot, O(n).
+        '''
+        buffer = self.__buffer
+        end = self.__front + self.__size
+        if end <= len(buffer):
+            values = buffer[self.__front:end]
+        else:  # the values wrap around the end of the buffer
+            values = buffer[self.__front:] + buffer[:end - len(buffer)]
+        
+        self.__buffer = values + [None] * (length - self.__size)
+        self.__front = 0
+    
+    
+    def enqueue(self, value):
+        '''
+        Add a value to the back of the queue, O(1) amortized.
+        NOTE: If the queue is full, raise an error.
+        '''
+        buffer = self.__buffer
+        if self.__size == len(buffer):
+            if self.__capacity is not None:
+                raise IndexError("enqueue to full queue")
+            self.__resize(2 * len(buffer))
+            buffer = self.__buffer
+        
+        index = self.__front + self.__size
+        if index >= len(buffer):
+            index -= len(buffer)
+        buffer[index] = value
+        self.__size += 1
+        self.__modifications += 1
+    
+    
+    def dequeue(self):
+        '''
+        Remove the value at the front of the queue
+        and return it, O(1) amortized.
+        '''
+        if self.__size == 0:
+            raise IndexError("dequeue from empty queue")
+        
+        buffer = self.__buffer
+        value = buffer[self.__front]
+        buffer[self.__front] = None  # do not keep a reference to the value
+        self.__front += 1
+        if self.__front == len(buffer):
+            self.__front = 0
+        self.__size -= 1
+        self.__modifications += 1
+        
+        if self.__capacity is None and len(buffer) > self.__INITIAL_CAPACITY and self.__size <= len(buffer) // 4:
+            self.__resize(len(buffer) // 2)
+        return value
+    
+    
+    def peek(self, index=0):
+        '''
+        Return the value at the given index from the front
+        of the queue, by default the front one, O(1).
+        NOTE: negative indexes count from the back, as in a list.
+        NOTE: If the index is out of range, raise an error.
+        '''
+        if self.__size == 0:
+            raise IndexError("peek of empty queue")
+        if index < 0:
+            index += self.__size
+        if not 0 <= index < self.__size:
+            raise IndexError("peek index out of range")
+        
+        return self.__buffer[(self.__front + index) % len(self.__buffer)]
+    
+    
+    def __len__(self):
+        '''
+        Return the size of the queue, O(1).
+        '''
+        return self.__size
+    
+    
+    def __iter__(self):
+        '''
+        Return a new iterator over the values of the queue
+        from the front to the back, O(1).
+        NOTE: enqueuing or dequeuing while iterating raises an error.
+        '''
+        modifications = self.__modifications
+        buffer = self.__buffer
+        
+        for offset in range(self.__size):
+            yield buffer[(self.__front + offset) % len(buffer)]
+            if self.__modifications != modifications:
+                raise RuntimeError("queue changed size during iteration")
+    
+    
+    def __str__(self):
+        '''
+        Return a string to print the queue, O(n).
+        '''
+        strings = []
+        for value in self:
+            strings.append(str(value))
+        
+        return '[' + ', '.join(strings) + ']'
\ No newline at end of file
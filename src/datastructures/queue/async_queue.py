@@ -0,0 +1,245 @@
+'''
+ * An asyncio queue implementation using a circular buffer,
+ * where producers await while the queue is full and consumers
+ * await while it is empty.
+ *
+ * Main inspiration: the asyncio.Queue class of the Python standard library
+ *
+ * @author Cosimo Giovanni Negri
+ * @date   18 Oct 2026
+'''
+
+import asyncio
+from collections import deque
+
+from .abstract_queue import AbstractQueue
+from .array_queue import ArrayQueue
+
+
+class AsyncQueue(AbstractQueue):
+    '''
+    An asyncio queue implementation using a circular buffer.
+    NOTE: enqueue and dequeue are coroutines, and the waiting tasks
+    sleep on futures woken up one at a time when a value is added
+    or removed, instead of polling the queue.
+    NOTE: if maxsize is None the queue is unbounded and enqueue never waits,
+    otherwise the producers wait while the queue holds maxsize values.
+    NOTE: the queue is not thread-safe, and must be used
+    from the tasks of a single event loop.
+    '''
+    def __init__(self, maxsize=None):
+        self.__queue = ArrayQueue(capacity=maxsize)
+        self.__getters = deque()  # futures of the consumers waiting for a value
+        self.__putters = deque()  # futures of the producers waiting for a free slot
+        self.__unfinished = 0  # values enqueued and not marked as done yet
+        self.__finished = asyncio.Event()
+        self.__finished.set()
+    
+    
+    @property
+    def maxsize(self):
+        '''
+        Return the maximum number of values in the queue,
+        or None if it is unbounded, O(1).
+        '''
+        return self.__queue.capacity
+    
+    
+    def isempty(self):
+        '''
+        Return whether or not the queue is empty, O(1).
+        '''
+        return self.__queue.isempty()
+    
+    
+    def isfull(self):
+        '''
+        Return whether or not the queue holds maxsize values, O(1).
+        NOTE: an unbounded queue is never full.
+        '''
+        return self.__queue.isfull()
+    
+    
+    def __wakeup_next(self, waiters):
+        '''
+        Wake up the first task waiting on the given
+        futures which has not been cancelled yet.
+        '''
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                break
+    
+    
+    async def __wait(self, waiters, is_ready, timeout=None):
+        '''
+        Wait until is_ready returns True or the timeout expires,
+        and return whether or not it is ready.
+        NOTE: if the task is cancelled, or it times out, after being woken up,
+        the next waiting task is woken up instead.
+        '''
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        
+        while not is_ready():
+            remaining = None if deadline is None else deadline - loop.time()
+            if remaining is not None and remaining <= 0:
+                return False
+            
+            waiter = loop.create_future()
+            waiters.append(waiter)
+            try:
+                if remaining is None:
+                    await waiter
+                else:
+                    await asyncio.wait_for(waiter, remaining)
+            except (asyncio.CancelledError, asyncio.TimeoutError) as error:
+                woken = waiter.done() and not waiter.cancelled()
+                waiter.cancel()
+                try:
+                    waiters.remove(waiter)
+                except ValueError:
+                    pass
+                # do not lose a wakeup meant for this task
+                if woken and is_ready():
+                    self.__wakeup_next(waiters)
+                if isinstance(error, asyncio.CancelledError):
+                    raise
+                return False
+        
+        return True
+    
+    
+    def enqueue_nowait(self, value):
+        '''
+        Add a value to the back of the queue without waiting, O(1) amortized.
+        NOTE: If the queue is full, raise an error.
+        '''
+        self.__queue.enqueue(value)
+        self.__unfinished += 1
+        self.__finished.clear()
+        if self.__getters:
+            self.__wakeup_next(self.__getters)
+    
+    
+    async def enqueue(self, value, timeout=None):
+        '''
+        Add a value to the back of the queue, waiting
+        while the queue is full, O(1) amortized.
+        NOTE: timeout is the maximum number of seconds to wait,
+        or None to wait as long as needed.
+        NOTE: If the queue is still full, raise an error.
+        '''
+        if self.__queue.isfull():
+            if not await self.__wait(self.__putters, lambda: not self.__queue.isfull(), timeout):
+                raise IndexError("enqueue to full queue")
+        self.enqueue_nowait(value)
+    
+    
+    def dequeue_nowait(self):
+        '''
+        Remove the value at the front of the queue
+        and return it without waiting, O(1) amortized.
+        NOTE: If the queue is empty, raise an error.
+        '''
+        value = self.__queue.dequeue()
+        if self.__putters:
+            self.__wakeup_next(self.__putters)
+        return value
+    
+    
+    async def dequeue(self, timeout=None):
+        '''
+        Remove the value at the front of the queue and return it,
+        waiting while the queue is empty, O(1) amortized.
+        NOTE: timeout is the maximum number of seconds to wait,
+        or None to wait as long as needed.
+        NOTE: If the queue is still empty, raise an error.
+        '''
+        if self.__queue.isempty():
+            if not await self.__wait(self.__getters, lambda: not self.__queue.isempty(), timeout):
+                raise IndexError("dequeue from empty queue")
+        return self.dequeue_nowait()
+    
+    
+    async def dequeue_batch(self, max_values, timeout=None):
+        '''
+        Remove up to max_values values from the front of the queue
+        and return the list of them, O(k) amortized.
+        NOTE: if timeout is None, wait for the first value and then
+        return all the values in the queue, up to max_values,
+        otherwise keep collecting values until there are max_values of them
+        or timeout seconds have passed, so the list may be empty.
+        '''
+        if max_values < 1:
+            raise ValueError("max_values must be greater or equal than 1")
+        
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        values = []
+        
+        while True:
+            while len(values) < max_values and not self.__queue.isempty():
+                values.append(self.dequeue_nowait())
+            if len(values) == max_values or (deadline is None and values):
+                break
+            
+            remaining = None if deadline is None else deadline - loop.time()
+            if not await self.__wait(self.__getters, lambda: not self.__queue.isempty(), remaining):
+                break
+        
+        # other consumers may take the values left
+        if values and not self.__queue.isempty():
+            self.__wakeup_next(self.__getters)
+        return values
+    
+    
+    def task_done(self):
+        '''
+        Mark as done the processing of a value taken from the queue, O(1).
+        NOTE: If it is called more times than the values enqueued, raise an error.
+        '''
+        if self.__unfinished <= 0:
+            raise ValueError("task_done called too many times")
+        self.__unfinished -= 1
+        if self.__unfinished == 0:
+            self.__finished.set()
+    
+    
+    async def join(self):
+        '''
+        Wait until every value enqueued has been marked as done.
+        '''
+        await self.__finished.wait()
+    
+    
+    def peek(self):
+        '''
+        Return the value at the front of the queue, O(1).
+        NOTE: If the queue is empty, raise an error.
+        '''
+        return self.__queue.peek()
+    
+    
+    def __len__(self):
+        '''
+        Return the size of the queue, O(1).
+        '''
+        return len(self.__queue)
+    
+    
+    def __iter__(self):
+        '''
+        Return a new iterator over the values of the queue
+        from the front to the back, O(1).
+        NOTE: enqueuing or dequeuing while iterating raises an error.
+        '''
+        return iter(self.__queue)
+    
+    
+    def __str__(self):
+        '''
+        Return a string to print the queue, O(n).
+        '''
+        return str(self.__queue)
\ No newline at end of file
@@ -0,0 +1,250 @@
+'''
+ * A thread-safe blocking queue implementation using a circular buffer,
+ * where producers wait while the queue is full and consumers wait
+ * while it is empty.
+ *
+ * Main inspiration: the queue module of the Python standard library
+ *
+ * @author Cosimo Giovanni Negri
+ * @date   18 Oct 2026
+'''
+
+import threading
+
+from .abstract_queue import AbstractQueue
+from .array_queue import ArrayQueue
+
+
+class BlockingQueue(AbstractQueue):
+    '''
+    A thread-safe blocking queue implementation using a circular buffer.
+    NOTE: every operation holds a single lock, and the waiting threads
+    sleep on condition variables instead of polling the queue: a consumer
+    or a producer of a single value is woken up for every value added
+    or removed, while a producer of a batch is woken up only when
+    the smallest batch waiting fits in the free slots.
+    NOTE: if maxsize is None the queue is unbounded and put never waits,
+    otherwise the producers wait while the queue holds maxsize values.
+    NOTE: enqueue and dequeue never wait, and raise an error as
+    in the other queues when the queue is full or empty.
+    '''
+    def __init__(self, maxsize=None):
+        self.__queue = ArrayQueue(capacity=maxsize)
+        self.__lock = threading.Lock()
+        self.__not_empty = threading.Condition(self.__lock)
+        self.__not_full = threading.Condition(self.__lock)
+        self.__room_for_batch = threading.Condition(self.__lock)
+        self.__batch_sizes = []  # of the producers waiting in put_many
+    
+    
+    @property
+    def maxsize(self):
+        '''
+        Return the maximum number of values in the queue,
+        or None if it is unbounded, O(1).
+        '''
+        return self.__queue.capacity
+    
+    
+    def __check_timeout(self, timeout):
+        '''
+        Raise an error if the timeout is not valid.
+        '''
+        if timeout is not None and timeout < 0:
+            raise ValueError("timeout must be None or a non-negative number")
+    
+    
+    def __free_slots(self):
+        '''
+        Return the number of values that can be added
+        without waiting, or None if the queue is unbounded.
+        NOTE: the lock must be held.
+        '''
+        maxsize = self.__queue.capacity
+        return None if maxsize is None else maxsize - len(self.__queue)
+    
+    
+    def __notify_not_full(self, freed):
+        '''
+        Wake up the producers that can use the given
+        number of slots just freed by a consumer.
+        NOTE: the lock must be held.
+        '''
+        self.__not_full.notify(freed)
+        # the other producers of a batch keep sleeping
+        if self.__batch_sizes and self.__free_slots() >= min(self.__batch_sizes):
+            self.__room_for_batch.notify_all()
+    
+    
+    def isempty(self):
+        '''
+        Return whether or not the queue is empty, O(1).
+        NOTE: the result may be outdated as soon as it is returned,
+        so it must not be used to decide whether get will wait.
+        '''
+        with self.__lock:
+            return self.__queue.isempty()
+    
+    
+    def isfull(self):
+        '''
+        Return whether or not the queue holds maxsize values, O(1).
+        NOTE: an unbounded queue is never full.
+        '''
+        with self.__lock:
+            return self.__queue.isfull()
+    
+    
+    def put(self, value, block=True, timeout=None):
+        '''
+        Add a value to the back of the queue, waiting while
+        the queue is full if block is True, O(1) amortized.
+        NOTE: timeout is the maximum number of seconds to wait,
+        or None to wait as long as needed.
+        NOTE: If the queue is still full, raise an error.
+        '''
+        self.__check_timeout(timeout)
+        with self.__not_full:
+            if self.__queue.isfull():
+                if not block or not self.__not_full.wait_for(lambda: not self.__queue.isfull(), timeout):
+                    raise IndexError("put to full queue")
+            
+            self.__queue.enqueue(value)
+            self.__not_empty.notify()
+    
+    
+    def put_many(self, values, block=True, timeout=None):
+        '''
+        Add all the values of an iterable to the back of the queue
+        at once, taking the lock a single time, O(k) amortized.
+        NOTE: the values are added only when there is room for
+        all of them, so that they are never split by other producers.
+        NOTE: If the queue still has no room for all the values,
+        raise an error without adding any of them, and if they are
+        more than maxsize, raise an error immediately.
+        '''
+        self.__check_timeout(timeout)
+        values = list(values)
+        maxsize = self.__queue.capacity
+        if maxsize is not None and len(values) > maxsize:
+            raise ValueError(f"cannot put {len(values)} values in a queue of maxsize {maxsize}")
+        if not values:
+            return
+        
+        with self.__room_for_batch:
+            def has_room():
+                free_slots = self.__free_slots()
+                return free_slots is None or free_slots >= len(values)
+            
+            if not has_room():
+                if not block:
+                    raise IndexError("put to full queue")
+                
+                self.__batch_sizes.append(len(values))
+                try:
+                    ready = self.__room_for_batch.wait_for(has_room, timeout)
+                finally:
+                    self.__batch_sizes.remove(len(values))
+                if not ready:
+                    raise IndexError("put to full queue")
+            
+            for value in values:
+                self.__queue.enqueue(value)
+            self.__not_empty.notify(len(values))
+    
+    
+    def get(self, block=True, timeout=None):
+        '''
+        Remove the value at the front of the queue and return it,
+        waiting while the queue is empty if block is True, O(1) amortized.
+        NOTE: timeout is the maximum number of seconds to wait,
+        or None to wait as long as needed.
+        NOTE: If the queue is still empty, raise an error.
+        '''
+        self.__check_timeout(timeout)
+        with self.__not_empty:
+            if self.__queue.isempty():
+                if not block or not self.__not_empty.wait_for(lambda: not self.__queue.isempty(), timeout):
+                    raise IndexError("get from empty queue")
+            
+            value = self.__queue.dequeue()
+            self.__notify_not_full(1)
+            return value
+    
+    
+    def get_many(self, max_values, block=True, timeout=None):
+        '''
+        Remove up to max_values values from the front of the queue
+        and return the list of them, taking the lock a single time,
+        waiting while the queue is empty if block is True, O(k) amortized.
+        NOTE: the values already in the queue are returned without waiting
+        for more, and if the queue is still empty the list is empty.
+        '''
+        self.__check_timeout(timeout)
+        if max_values < 1:
+            raise ValueError("max_values must be greater or equal than 1")
+        
+        with self.__not_empty:
+            if self.__queue.isempty() and block:
+                self.__not_empty.wait_for(lambda: not self.__queue.isempty(), timeout)
+            
+            values = []
+            while len(values) < max_values and not self.__queue.isempty():
+                values.append(self.__queue.dequeue())
+            if values:
+                self.__notify_not_full(len(values))
+            return values
+    
+    
+    def enqueue(self, value):
+        '''
+        Add a value to the back of the queue without waiting, O(1) amortized.
+        NOTE: If the queue is full, raise an error.
+        '''
+        self.put(value, block=False)
+    
+    
+    def dequeue(self):
+        '''
+        Remove the value at the front of the queue
+        and return it without waiting, O(1) amortized.
+        NOTE: If the queue is empty, raise an error.
+        '''
+        return self.get(block=False)
+    
+    
+    def peek(self):
+        '''
+        Return the value at the front of the queue, O(1).
+        NOTE: If the queue is empty, raise an error.
+        '''
+        with self.__lock:
+            return self.__queue.peek()
+    
+    
+    def __len__(self):
+        '''
+        Return the size of the queue, O(1).
+        '''
+        with self.__lock:
+            return len(self.__queue)
+    
+    
+    def __iter__(self):
+        '''
+        Return a new iterator over a copy of the values
+        of the queue from the front to the back, O(n).
+        NOTE: the copy is taken under the lock, so other threads
+        can keep using the queue while iterating.
+        '''
+        with self.__lock:
+            values = list(self.__queue)
+        return iter(values)
+    
+    
+    def __str__(self):
+        '''
+        Return a string to print the queue, O(n).
+        '''
+        with self.__lock:
+            return str(self.__queue)
\ No newline at end of file
@@ -18,7 +18,6 @@ class LinkedQueue(AbstractQueue):
     '''
     def __init__(self):
         self.__list = DoublyLinkedList()
-        self.__iterator = None
     
     
     def isempty(self):
@@ -63,17 +62,10 @@ class LinkedQueue(AbstractQueue):
     
     def __iter__(self):
         '''
-        Called when iteration is initialized, O(1).
+        Return a new iterator over the values of the queue, O(1).
+        NOTE: enqueuing or dequeuing while iterating raises an error.
         '''
-        self.__iterator = iter(self.__list)
-        return self
-    
-    
-    def __next__(self):
-        '''
-        To move to the next node, O(1).
-        '''
-        return next(self.__iterator)
+        return iter(self.__list)
     
     
     def __str__(self):
@@ -0,0 +1,229 @@
+'''
+ * A priority queue implementation using a binary min heap stored in an array.
+ *
+ * Main inspiration: William Fiset
+ * https://github.com/williamfiset/Algorithms/blob/master/src/main/java/com/williamfiset/algorithms/datastructures/priorityqueue/BinaryHeap.java
+ *
+ * @author Cosimo Giovanni Negri
+ * @date   18 Oct 2026
+'''
+
+from .abstract_queue import AbstractQueue
+
+
+class PriorityQueue(AbstractQueue):
+    '''
+    A priority queue implementation using a binary min heap stored in an array.
+    NOTE: the value with the smallest key is dequeued first, where the key
+    is computed once per value by the key function, or is the value itself.
+    NOTE: values with the same key are dequeued in the order in which
+    they have been enqueued, since every entry of the heap is a
+    (key, order, value) tuple, and the values are never compared.
+    '''
+    def __init__(self, key=None):
+        self.__key = key
+        self.__heap = []  # the children of index i are at 2*i + 1 and 2*i + 2
+        self.__order = 0  # order of the next value enqueued, to break ties
+        self.__modifications = 0  # to detect changes during an iteration
+    
+    
+    @classmethod
+    def heapify(cls, iterable, key=None):
+        '''
+        Return a new priority queue containing the values of
+        an iterable, sifting down every parent from the last one, O(n).
+        NOTE: If the keys are not comparable, raise an error.
+        '''
+        queue = cls(key=key)
+        queue.__heap = [queue.__entry(value) for value in iterable]
+        for index in range(len(queue.__heap) // 2 - 1, -1, -1):
+            queue.__sift_down(index)
+        return queue
+    
+    
+    def __entry(self, value):
+        '''
+        Return a new heap entry for the given value.
+        '''
+        key = value if self.__key is None else self.__key(value)
+        entry = (key, self.__order, value)
+        self.__order += 1
+        return entry
+    
+    
+    def __check_entry(self, entry):
+        '''
+        Raise an error if the key of the entry
+        is not comparable with the minimum key, O(1).
+        '''
+        if self.__heap:
+            min_key = self.__heap[0][0]
+            try:
+                entry[0] < min_key
+                entry[0] > min_key
+            except TypeError:
+                raise TypeError(f"{type(entry[0])} not comparable with {type(min_key)}") from None
+    
+    
+    def clear(self):
+        '''
+        Empty the priority queue, O(1).
+        '''
+        self.__heap = []
+        self.__modifications += 1
+    
+    
+    def isempty(self):
+        '''
+        Return whether or not the priority queue is empty, O(1).
+        '''
+        return len(self.__heap) == 0
+    
+    
+    def __sift_up(self, index):
+        '''
+        Move the entry at the given index up, while
+        it is smaller than its parent.
+        NOTE: the entries on the way are moved down into the hole,
+        instead of swapping the entry with every one of them.
+        '''
+        heap = self.__heap
+        entry = heap[index]
+        while index > 0:
+            parent = (index - 1) >> 1
+            if not entry < heap[parent]:
+                break
+            heap[index] = heap[parent]
+            index = parent
+        heap[index] = entry
+    
+    
+    def __sift_down(self, index):
+        '''
+        Move the entry at the given index down, while
+        it is greater than its smallest child.
+        '''
+        heap = self.__heap
+        size = len(heap)
+        entry = heap[index]
+        child = 2 * index + 1
+        while child < size:
+            if child + 1 < size and heap[child + 1] < heap[child]:
+                child += 1
+            if not heap[child] < entry:
+                break
+            heap[index] = heap[child]
+            index = child
+            child = 2 * index + 1
+        heap[index] = entry
+    
+    
+    def enqueue(self, value):
+        '''
+        Add a value to the priority queue, O(log(n)).
+        NOTE: If its key is not comparable with the others, raise an error.
+        '''
+        entry = self.__entry(value)
+        self.__check_entry(entry)
+        self.__heap.append(entry)
+        self.__sift_up(len(self.__heap) - 1)
+        self.__modifications += 1
+    
+    
+    def dequeue(self):
+        '''
+        Remove the value with the smallest key
+        from the priority queue and return it, O(log(n)).
+        '''
+        heap = self.__heap
+        if not heap:
+            raise IndexError("dequeue from empty queue")
+        
+        last = heap.pop()
+        self.__modifications += 1
+        if not heap:
+            return last[2]
+        
+        entry = heap[0]
+        heap[0] = last
+        self.__sift_down(0)
+        return entry[2]
+    
+    
+    def peek(self):
+        '''
+        Return the value with the smallest key in the priority queue, O(1).
+        '''
+        if not self.__heap:
+            raise IndexError("peek of empty queue")
+        return self.__heap[0][2]
+    
+    
+    def pushpop(self, value):
+        '''
+        Add a value and then remove the value with the smallest key
+        and return it, faster than an enqueue followed by a dequeue, O(log(n)).
+        NOTE: if the new value has the smallest key, the queue is not changed.
+        '''
+        entry = self.__entry(value)
+        self.__check_entry(entry)
+        heap = self.__heap
+        if not heap or not heap[0] < entry:
+            return value
+        
+        entry, heap[0] = heap[0], entry
+        self.__sift_down(0)
+        self.__modifications += 1
+        return entry[2]
+    
+    
+    def replace(self, value):
+        '''
+        Remove the value with the smallest key and then add a value,
+        returning the removed one, faster than a dequeue
+        followed by an enqueue, O(log(n)).
+        NOTE: the removed value may have a key greater than the new one.
+        '''
+        heap = self.__heap
+        if not heap:
+            raise IndexError("replace of empty queue")
+        
+        entry = self.__entry(value)
+        self.__check_entry(entry)
+        entry, heap[0] = heap[0], entry
+        self.__sift_down(0)
+        self.__modifications += 1
+        return entry[2]
+    
+    
+    def __len__(self):
+        '''
+        Return the size of the priority queue, O(1).
+        '''
+        return len(self.__heap)
+    
+    
+    def __iter__(self):
+        '''
+        Return a new iterator over the values of the priority queue
+        in the order in which they would be dequeued, O(n*log(n)).
+        NOTE: enqueuing or dequeuing while iterating raises an error.
+        '''
+        modifications = self.__modifications
+        
+        for entry in sorted(self.__heap):
+            yield entry[2]
+            if self.__modifications != modifications:
+                raise RuntimeError("queue changed size during iteration")
+    
+    
+    def __str__(self):
+        '''
+        Return a string to print the priority queue
+        in the order in which the values would be dequeued, O(n*log(n)).
+        '''
+        strings = []
+        for value in self:
+            strings.append(str(value))
+        
+        return '[' + ', '.join(strings) + ']'
\ No newline at end of file
@@ -9,14 +9,28 @@
 '''
 
 import unittest
+import asyncio
 import sys
 import os
+import random
+import heapq
+import threading
+import time
+from collections import deque
 
 if __name__ == "__main__":
     sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
     from datastructures.queue.linked_queue import LinkedQueue
+    from datastructures.queue.array_queue import ArrayQueue
+    from datastructures.queue.blocking_queue import BlockingQueue
+    from datastructures.queue.async_queue import AsyncQueue
+    from datastructures.queue.priority_queue import PriorityQueue
 else:
     from .linked_queue import LinkedQueue
+    from .array_queue import ArrayQueue
+    from .blocking_queue import BlockingQueue
+    from .async_queue import AsyncQueue
+    from .priority_queue import PriorityQueue
 
 
 class QueueTest(unittest.TestCase):
@@ -92,6 +106,28 @@ class QueueTest(unittest.TestCase):
             next(iter_obj)
     
     
+    def test_nested_iteration(self):
+        self.queue.enqueue(1)
+        self.queue.enqueue(2)
+        self.queue.enqueue(3)
+        
+        pairs = [(a, b) for a in self.queue for b in self.queue]
+        self.assertEqual(pairs, [(a, b) for a in [1, 2, 3] for b in [1, 2, 3]])
+    
+    
+    def test_change_during_iteration(self):
+        self.queue.enqueue(1)
+        self.queue.enqueue(2)
+        self.queue.enqueue(3)
+        
+        with self.assertRaises(RuntimeError):
+            for _ in self.queue:
+                self.queue.enqueue(4)
+        with self.assertRaises(RuntimeError):
+            for _ in self.queue:
+                self.queue.dequeue()
+    
+    
     def test_to_string(self):
         self.assertEqual(str(self.queue), "[]")
         self.queue.enqueue('a')
@@ -108,5 +144,538 @@ class QueueTest(unittest.TestCase):
         self.assertEqual(str(self.queue), "[c, d, e, f]")
 
 
+
+class ArrayQueueTest(QueueTest):
+    
+    def setUp(self):
+        self.queue = ArrayQueue()
+    
+    
+    def test_growth(self):
+        # many more values than the initial buffer, wrapping around it
+        for value in range(5):
+            self.queue.enqueue(value)
+        for value in range(5):
+            self.assertEqual(self.queue.dequeue(), value)
+        
+        for value in range(1000):
+            self.queue.enqueue(value)
+        self.assertEqual(len(self.queue), 1000)
+        self.assertEqual(list(self.queue), list(range(1000)))
+        self.assertIsNone(self.queue.capacity)
+        self.assertFalse(self.queue.isfull())
+        
+        for value in range(1000):
+            self.assertEqual(self.queue.dequeue(), value)
+        self.assertTrue(self.queue.isempty())
+    
+    
+    def test_indexed_peek(self):
+        for value in range(10):
+            self.queue.enqueue(value)
+        for _ in range(3):
+            self.queue.dequeue()
+        
+        self.assertEqual(self.queue.peek(), 3)
+        self.assertEqual(self.queue.peek(2), 5)
+        self.assertEqual(self.queue.peek(-1), 9)
+        self.assertEqual(self.queue.peek(6), 9)
+        with self.assertRaises(IndexError):
+            self.queue.peek(7)
+        with self.assertRaises(IndexError):
+            self.queue.peek(-8)
+    
+    
+    def test_fixed_capacity(self):
+        with self.assertRaises(ValueError):
+            ArrayQueue(capacity=0)
+        with self.assertRaises(ValueError):
+            ArrayQueue(capacity=2.5)
+        
+        queue = ArrayQueue(capacity=3)
+        self.assertEqual(queue.capacity, 3)
+        for value in range(3):
+            queue.enqueue(value)
+        self.assertTrue(queue.isfull())
+        with self.assertRaises(IndexError):
+            queue.enqueue(3)
+        self.assertEqual(list(queue), [0, 1, 2])
+        
+        # the values wrap around the buffer
+        self.assertEqual(queue.dequeue(), 0)
+        queue.enqueue(3)
+        self.assertEqual(list(queue), [1, 2, 3])
+        self.assertEqual(queue.peek(-1), 3)
+    
+    
+    def test_clear(self):
+        for value in range(20):
+            self.queue.enqueue(value)
+        self.queue.clear()
+        self.assertTrue(self.queue.isempty())
+        self.queue.enqueue(5)
+        self.assertEqual(list(self.queue), [5])
+    
+    
+    def test_random_operations(self):
+        for queue in [ArrayQueue(), ArrayQueue(capacity=50)]:
+            python_deque = deque()
+            for _ in range(5000):
+                if random.random() < 0.55 and not queue.isfull():
+                    value = random.random()
+                    queue.enqueue(value)
+                    python_deque.append(value)
+                elif python_deque:
+                    self.assertEqual(queue.dequeue(), python_deque.popleft())
+                
+                self.assertEqual(len(queue), len(python_deque))
+                if python_deque:
+                    self.assertEqual(queue.peek(), python_deque[0])
+                    self.assertEqual(queue.peek(-1), python_deque[-1])
+            
+            self.assertEqual(list(queue), list(python_deque))
+
+
+class BlockingQueueTest(QueueTest):
+    
+    def setUp(self):
+        self.queue = BlockingQueue()
+    
+    
+    def test_change_during_iteration(self):
+        # the iteration is over a copy of the values
+        for value in range(3):
+            self.queue.enqueue(value)
+        
+        for value in self.queue:
+            self.queue.enqueue(value + 3)
+        self.assertEqual(list(self.queue), [0, 1, 2, 3, 4, 5])
+    
+    
+    def test_maxsize(self):
+        queue = BlockingQueue(maxsize=2)
+        self.assertEqual(queue.maxsize, 2)
+        self.assertIsNone(self.queue.maxsize)
+        
+        queue.put(1)
+        queue.put(2)
+        self.assertTrue(queue.isfull())
+        with self.assertRaises(IndexError):
+            queue.put(3, block=False)
+        with self.assertRaises(IndexError):
+            queue.enqueue(3)
+        with self.assertRaises(IndexError):
+            queue.put(3, timeout=0.01)
+        self.assertEqual(list(queue), [1, 2])
+    
+    
+    def test_get_timeout(self):
+        with self.assertRaises(IndexError):
+            self.queue.get(block=False)
+        
+        start = time.monotonic()
+        with self.assertRaises(IndexError):
+            self.queue.get(timeout=0.05)
+        self.assertGreaterEqual(time.monotonic() - start, 0.04)
+        
+        with self.assertRaises(ValueError):
+            self.queue.get(timeout=-1)
+    
+    
+    def test_blocking_get(self):
+        results = []
+        consumer = threading.Thread(target=lambda: results.append(self.queue.get(timeout=5)))
+        consumer.start()
+        
+        time.sleep(0.02)
+        self.assertEqual(results, [])
+        self.queue.put('a')
+        consumer.join()
+        self.assertEqual(results, ['a'])
+    
+    
+    def test_backpressure(self):
+        queue = BlockingQueue(maxsize=1)
+        queue.put(1)
+        producer = threading.Thread(target=lambda: queue.put(2, timeout=5))
+        producer.start()
+        
+        # the producer waits until a value is taken
+        time.sleep(0.02)
+        self.assertEqual(len(queue), 1)
+        self.assertEqual(queue.get(), 1)
+        producer.join()
+        self.assertEqual(queue.get(), 2)
+    
+    
+    def test_put_many(self):
+        queue = BlockingQueue(maxsize=4)
+        queue.put_many([1, 2, 3])
+        queue.put_many([])
+        self.assertEqual(list(queue), [1, 2, 3])
+        
+        # the values are added all together or not at all
+        with self.assertRaises(IndexError):
+            queue.put_many([4, 5], block=False)
+        with self.assertRaises(ValueError):
+            queue.put_many(range(5))
+        self.assertEqual(list(queue), [1, 2, 3])
+        
+        producer = threading.Thread(target=lambda: queue.put_many([4, 5], timeout=5))
+        producer.start()
+        time.sleep(0.02)
+        self.assertEqual(len(queue), 3)
+        self.assertEqual(queue.get(), 1)
+        producer.join()
+        self.assertEqual(list(queue), [2, 3, 4, 5])
+    
+    
+    def test_put_many_waits_for_room(self):
+        queue = BlockingQueue(maxsize=3)
+        queue.put_many([1, 2, 3])
+        batch_producer = threading.Thread(target=lambda: queue.put_many([4, 5], timeout=5))
+        batch_producer.start()
+        
+        # one free slot is not enough for the batch
+        time.sleep(0.02)
+        self.assertEqual(queue.get(), 1)
+        time.sleep(0.02)
+        self.assertEqual(list(queue), [2, 3])
+        
+        self.assertEqual(queue.get(), 2)
+        batch_producer.join()
+        self.assertEqual(list(queue), [3, 4, 5])
+        
+        # a producer of a single value and one of a batch waiting together
+        producers = [
+            threading.Thread(target=lambda: queue.put(6, timeout=5)),
+            threading.Thread(target=lambda: queue.put_many([7, 8], timeout=5)),
+        ]
+        for producer in producers:
+            producer.start()
+        time.sleep(0.02)
+        self.assertEqual(queue.get_many(3), [3, 4, 5])
+        for producer in producers:
+            producer.join()
+        self.assertEqual(sorted(queue), [6, 7, 8])
+    
+    
+    def test_get_many(self):
+        self.assertEqual(self.queue.get_many(3, block=False), [])
+        self.assertEqual(self.queue.get_many(3, timeout=0.01), [])
+        with self.assertRaises(ValueError):
+            self.queue.get_many(0)
+        
+        self.queue.put_many(range(5))
+        self.assertEqual(self.queue.get_many(3), [0, 1, 2])
+        self.assertEqual(self.queue.get_many(3), [3, 4])
+        self.assertTrue(self.queue.isempty())
+    
+    
+    def test_producers_consumers(self):
+        queue = BlockingQueue(maxsize=8)
+        producers_num, values_num = 4, 500
+        taken = []  # values taken by every consumer
+        done = threading.Event()
+        
+        def produce(producer):
+            for value in range(values_num):
+                if value % 2:
+                    queue.put((producer, value))
+                else:
+                    queue.put_many([(producer, value)])
+        
+        def consume(values):
+            while True:
+                batch = queue.get_many(5, timeout=0.01)
+                if not batch and done.is_set():
+                    return
+                values.extend(batch)
+        
+        producers = [threading.Thread(target=produce, args=(i,)) for i in range(producers_num)]
+        consumers = []
+        for _ in range(3):
+            taken.append([])
+            consumers.append(threading.Thread(target=consume, args=(taken[-1],)))
+        for thread in producers + consumers:
+            thread.start()
+        for thread in producers:
+            thread.join()
+        done.set()
+        for thread in consumers:
+            thread.join()
+        
+        values = [value for values in taken for value in values]
+        self.assertEqual(len(values), producers_num * values_num)
+        self.assertEqual(set(values), {(i, v) for i in range(producers_num) for v in range(values_num)})
+        
+        # every consumer sees the values of every producer in order
+        for values in taken:
+            for producer in range(producers_num):
+                sequence = [value for i, value in values if i == producer]
+                self.assertEqual(sequence, sorted(sequence))
+
+
+class PriorityQueueTest(QueueTest):
+    
+    def setUp(self):
+        self.queue = PriorityQueue()
+    
+    
+    def test_priority_order(self):
+        for value in [5, 1, 4, 1, 3, 9, 2]:
+            self.queue.enqueue(value)
+        
+        self.assertEqual(self.queue.peek(), 1)
+        self.assertEqual(list(self.queue), [1, 1, 2, 3, 4, 5, 9])
+        self.assertEqual(str(self.queue), "[1, 1, 2, 3, 4, 5, 9]")
+        self.assertEqual([self.queue.dequeue() for _ in range(7)], [1, 1, 2, 3, 4, 5, 9])
+        self.assertTrue(self.queue.isempty())
+    
+    
+    def test_key(self):
+        queue = PriorityQueue(key=lambda task: -task[0])
+        for task in [(1, 'low'), (3, 'high'), (2, 'medium')]:
+            queue.enqueue(task)
+        self.assertEqual(queue.dequeue(), (3, 'high'))
+        self.assertEqual(queue.dequeue(), (2, 'medium'))
+    
+    
+    def test_stable_ties(self):
+        # the values are never compared, even when their keys are equal
+        queue = PriorityQueue(key=lambda task: task['priority'])
+        tasks = [{'priority': i % 3, 'id': i} for i in range(12)]
+        for task in tasks:
+            queue.enqueue(task)
+        
+        expected = sorted(tasks, key=lambda task: task['priority'])
+        self.assertEqual([queue.dequeue() for _ in range(12)], expected)
+    
+    
+    def test_invalid_keys(self):
+        self.queue.enqueue(1)
+        with self.assertRaises(TypeError):
+            self.queue.enqueue("A")
+        with self.assertRaises(TypeError):
+            self.queue.pushpop("A")
+        self.assertEqual(list(self.queue), [1])
+    
+    
+    def test_heapify(self):
+        values = [random.randrange(100) for _ in range(200)]
+        queue = PriorityQueue.heapify(values)
+        self.assertEqual(len(queue), 200)
+        self.assertEqual([queue.dequeue() for _ in range(200)], sorted(values))
+        
+        queue = PriorityQueue.heapify(["bb", "a", "ccc"], key=len)
+        self.assertEqual(list(queue), ["a", "bb", "ccc"])
+        self.assertTrue(PriorityQueue.heapify([]).isempty())
+    
+    
+    def test_pushpop(self):
+        self.assertEqual(self.queue.pushpop(3), 3)
+        self.assertTrue(self.queue.isempty())
+        
+        for value in [5, 7, 9]:
+            self.queue.enqueue(value)
+        self.assertEqual(self.queue.pushpop(1), 1)
+        self.assertEqual(self.queue.pushpop(8), 5)
+        self.assertEqual(list(self.queue), [7, 8, 9])
+    
+    
+    def test_replace(self):
+        with self.assertRaises(IndexError):
+            self.queue.replace(1)
+        
+        for value in [5, 7, 9]:
+            self.queue.enqueue(value)
+        self.assertEqual(self.queue.replace(1), 5)
+        self.assertEqual(self.queue.replace(8), 1)
+        self.assertEqual(list(self.queue), [7, 8, 9])
+    
+    
+    def test_clear(self):
+        for value in range(10):
+            self.queue.enqueue(value)
+        self.queue.clear()
+        self.assertTrue(self.queue.isempty())
+        self.queue.enqueue(4)
+        self.assertEqual(list(self.queue), [4])
+    
+    
+    def test_random_operations(self):
+        python_heap = []
+        for _ in range(3000):
+            value = random.randrange(100)
+            choice = random.random()
+            if choice < 0.5:
+                self.queue.enqueue(value)
+                heapq.heappush(python_heap, value)
+            elif choice < 0.7:
+                self.assertEqual(self.queue.pushpop(value), heapq.heappushpop(python_heap, value))
+            elif python_heap and choice < 0.8:
+                self.assertEqual(self.queue.replace(value), heapq.heapreplace(python_heap, value))
+            elif python_heap:
+                self.assertEqual(self.queue.dequeue(), heapq.heappop(python_heap))
+            
+            self.assertEqual(len(self.queue), len(python_heap))
+            if python_heap:
+                self.assertEqual(self.queue.peek(), python_heap[0])
+        
+        self.assertEqual(list(self.queue), sorted(python_heap))
+
+
+class AsyncQueueTest(unittest.IsolatedAsyncioTestCase):
+    
+    def setUp(self):
+        self.queue = AsyncQueue()
+    
+    
+    async def test_empty_queue(self):
+        self.assertTrue(self.queue.isempty())
+        self.assertEqual(len(self.queue), 0)
+        self.assertIsNone(self.queue.maxsize)
+        with self.assertRaises(IndexError):
+            self.queue.dequeue_nowait()
+        with self.assertRaises(IndexError):
+            self.queue.peek()
+        with self.assertRaises(IndexError):
+            await self.queue.dequeue(timeout=0.01)
+    
+    
+    async def test_general(self):
+        await self.queue.enqueue(5)
+        self.queue.enqueue_nowait(6)
+        self.assertEqual(len(self.queue), 2)
+        self.assertEqual(self.queue.peek(), 5)
+        self.assertEqual(list(self.queue), [5, 6])
+        self.assertEqual(str(self.queue), "[5, 6]")
+        self.assertEqual(await self.queue.dequeue(), 5)
+        self.assertEqual(self.queue.dequeue_nowait(), 6)
+        self.assertTrue(self.queue.isempty())
+    
+    
+    async def test_waiting_dequeue(self):
+        consumer = asyncio.create_task(self.queue.dequeue())
+        await asyncio.sleep(0)
+        self.assertFalse(consumer.done())
+        
+        await self.queue.enqueue('a')
+        self.assertEqual(await consumer, 'a')
+    
+    
+    async def test_maxsize(self):
+        queue = AsyncQueue(maxsize=2)
+        await queue.enqueue(1)
+        await queue.enqueue(2)
+        self.assertTrue(queue.isfull())
+        with self.assertRaises(IndexError):
+            queue.enqueue_nowait(3)
+        with self.assertRaises(IndexError):
+            await queue.enqueue(3, timeout=0.01)
+        
+        # the producer waits until a value is taken
+        producer = asyncio.create_task(queue.enqueue(3))
+        await asyncio.sleep(0)
+        self.assertFalse(producer.done())
+        self.assertEqual(await queue.dequeue(), 1)
+        await producer
+        self.assertEqual(list(queue), [2, 3])
+    
+    
+    async def test_cancelled_dequeue(self):
+        first = asyncio.create_task(self.queue.dequeue())
+        second = asyncio.create_task(self.queue.dequeue())
+        await asyncio.sleep(0)
+        
+        # the value must go to the consumer still waiting
+        self.queue.enqueue_nowait('a')
+        first.cancel()
+        self.assertEqual(await second, 'a')
+        with self.assertRaises(asyncio.CancelledError):
+            await first
+    
+    
+    async def test_dequeue_batch(self):
+        with self.assertRaises(ValueError):
+            await self.queue.dequeue_batch(0)
+        self.assertEqual(await self.queue.dequeue_batch(3, timeout=0.01), [])
+        
+        for value in range(5):
+            self.queue.enqueue_nowait(value)
+        self.assertEqual(await self.queue.dequeue_batch(3), [0, 1, 2])
+        self.assertEqual(await self.queue.dequeue_batch(3), [3, 4])
+        
+        # without a timeout, the values already in the queue are returned
+        consumer = asyncio.create_task(self.queue.dequeue_batch(3))
+        await asyncio.sleep(0)
+        self.queue.enqueue_nowait(5)
+        self.assertEqual(await consumer, [5])
+        
+        # with a timeout, the values are collected until the batch is full
+        consumer = asyncio.create_task(self.queue.dequeue_batch(3, timeout=5))
+        for value in range(6, 9):
+            await asyncio.sleep(0)
+            self.queue.enqueue_nowait(value)
+        self.assertEqual(await consumer, [6, 7, 8])
+        
+        self.queue.enqueue_nowait(9)
+        self.assertEqual(await self.queue.dequeue_batch(3, timeout=0.01), [9])
+    
+    
+    async def test_join(self):
+        with self.assertRaises(ValueError):
+            self.queue.task_done()
+        await asyncio.wait_for(self.queue.join(), 1)
+        
+        processed = []
+        
+        async def worker():
+            while True:
+                value = await self.queue.dequeue()
+                processed.append(value)
+                self.queue.task_done()
+        
+        workers = [asyncio.create_task(worker()) for _ in range(3)]
+        for value in range(20):
+            await self.queue.enqueue(value)
+        await asyncio.wait_for(self.queue.join(), 1)
+        self.assertEqual(sorted(processed), list(range(20)))
+        
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+    
+    
+    async def test_producers_consumers(self):
+        queue = AsyncQueue(maxsize=4)
+        producers_num, values_num = 4, 200
+        taken = []
+        
+        async def produce(producer):
+            for value in range(values_num):
+                await queue.enqueue((producer, value))
+        
+        async def consume():
+            while True:
+                batch = await queue.dequeue_batch(3)
+                taken.extend(batch)
+                for _ in batch:
+                    queue.task_done()
+        
+        consumers = [asyncio.create_task(consume()) for _ in range(2)]
+        await asyncio.gather(*[produce(i) for i in range(producers_num)])
+        await asyncio.wait_for(queue.join(), 5)
+        for task in consumers:
+            task.cancel()
+        await asyncio.gather(*consumers, return_exceptions=True)
+        
+        self.assertEqual(len(taken), producers_num * values_num)
+        self.assertEqual(set(taken), {(i, v) for i in range(producers_num) for v in range(values_num)})
+        for producer in range(producers_num):
+            sequence = [value for i, value in taken if i == producer]
+            self.assertEqual(sequence, list(range(values_num)))
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
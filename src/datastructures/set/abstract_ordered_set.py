@@ -0,0 +1,336 @@
+'''
+ * An abstract base class for a set whose values are kept sorted.
+ *
+ * @author Cosimo Giovanni Negri
+ * @date   18 Oct 2026
+'''
+
+import math
+from abc import ABC, abstractmethod
+
+
+class AbstractOrderedSet(ABC):
+    '''
+    An abstract base class for a set whose values are kept sorted.
+    NOTE: the subclasses implement the structure-specific primitives
+    (_reference_value, _build, _count_less, _select, _navigate and
+    _lazy_range), and inherit the type checks, the bulk loaders and
+    the rank, selection and range queries built on top of them.
+    '''
+    
+    @classmethod
+    def from_sorted(cls, iterable, **options):
+        '''
+        Return a new ordered set containing the values of a sorted iterable,
+        built at once instead of adding the values one by one, O(n).
+        NOTE: repeated values are added only once.
+        NOTE: every keyword argument is forwarded to the constructor.
+        NOTE: If the values are not sorted or their type is not valid, raise an error.
+        '''
+        ordered_set = cls(**options)
+        values = ordered_set._unique_sorted(iterable)
+        if values:
+            ordered_set._build(values)
+        return ordered_set
+    
+    
+    @classmethod
+    def from_iterable(cls, iterable, **options):
+        '''
+        Return a new ordered set containing the values of an iterable,
+        which are sorted once and then built as from_sorted, O(n*log(n)).
+        NOTE: If the value types are not valid, raise an error.
+        '''
+        return cls.from_sorted(sorted(iterable), **options)
+    
+    
+    def _check_value_type(self, value):
+        '''
+        Raise an error if the value type is not valid, O(1).
+        '''
+        if isinstance(value, bool):
+            raise TypeError("value must not be a boolean")
+        
+        reference = self._reference_value()
+        if reference is None:
+            try:
+                value == value
+                value > value
+                value < value
+            except:
+                raise TypeError(f"uncomparable value: {type(value)}")
+        
+        else:
+            try:
+                value == reference
+                value > reference
+                value < reference
+            except:
+                raise TypeError(f"{type(value)} not comparable with {type(reference)}")
+    
+    
+    def _check_new_value(self, value):
+        '''
+        Raise an error if the value type is not valid, O(1).
+        NOTE: unless the ordered set is empty, the value is not compared here,
+        since it is compared with the values on its path anyway.
+        '''
+        if isinstance(value, bool):
+            raise TypeError("value must not be a boolean")
+        if self._reference_value() is None:
+            self._check_value_type(value)
+    
+    
+    def _uncomparable(self, value):
+        '''
+        Return the error to raise when a value is
+        not comparable with the values in the ordered set.
+        '''
+        return TypeError(f"{type(value)} not comparable with {type(self._reference_value())}")
+    
+    
+    def _unique_sorted(self, iterable):
+        '''
+        Return a list of the values of a sorted iterable without repetitions,
+        checking the type of the first value only, since every other value is
+        compared with the previous one anyway.
+        '''
+        values = []
+        for value in iterable:
+            if not values:
+                self._check_value_type(value)
+                values.append(value)
+                continue
+            
+            if isinstance(value, bool):
+                raise TypeError("value must not be a boolean")
+            
+            last = values[-1]
+            try:
+                if value == last:
+                    continue
+                ordered = value > last
+            except TypeError:
+                raise TypeError(f"{type(value)} not comparable with {type(last)}") from None
+            
+            if not ordered:
+                raise ValueError("values must be sorted")
+            values.append(value)
+        
+        return values
+    
+    
+    @abstractmethod
+    def _reference_value(self):
+        '''
+        Return a value of the ordered set to compare the
+        other values with, or None if it is empty, O(1).
+        '''
+        pass
+    
+    @abstractmethod
+    def _build(self, values):
+        '''
+        Fill the empty ordered set with a non empty list
+        of sorted values without repetitions.
+        '''
+        pass
+    
+    @abstractmethod
+    def _count_less(self, value, inclusive):
+        '''
+        Return the number of values in the ordered set
+        less than the given value, or less or equal if inclusive.
+        '''
+        pass
+    
+    @abstractmethod
+    def _select(self, index):
+        '''
+        Return the value at the given index in the sorted order,
+        which is between 0 and the size of the ordered set.
+        '''
+        pass
+    
+    @abstractmethod
+    def _navigate(self, value, below, inclusive):
+        '''
+        Return the closest value in the ordered set below or above
+        the given one, which is included if inclusive, or None.
+        '''
+        pass
+    
+    @abstractmethod
+    def _lazy_range(self, lo, hi, lo_inclusive, hi_inclusive):
+        '''
+        Yield the values of the ordered set between lo and hi in order,
+        where a missing lo or hi means that the range is unbounded.
+        '''
+        pass
+    
+    
+    def rank(self, value):
+        '''
+        Return the number of values in the ordered set
+        less than the given value, O(log(n)).
+        NOTE: the value does not need to be in the ordered set.
+        NOTE: If the value type is not valid, raise an error.
+        '''
+        self._check_value_type(value)
+        return self._count_less(value, inclusive=False)
+    
+    
+    def count_range(self, lo, hi):
+        '''
+        Return the number of values in the ordered set
+        between lo and hi, both included, O(log(n)).
+        NOTE: If the value types are not valid, raise an error.
+        '''
+        self._check_value_type(lo)
+        self._check_value_type(hi)
+        if hi < lo:
+            return 0
+        return self._count_less(hi, inclusive=True) - self._count_less(lo, inclusive=False)
+    
+    
+    def select(self, index):
+        '''
+        Return the value at the given index in the sorted order
+        of the ordered set, O(log(n)).
+        NOTE: negative indexes count from the maximum value, as in a list.
+        NOTE: If the index is out of range, raise an error.
+        '''
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("index out of range")
+        return self._select(index)
+    
+    
+    def nth_smallest(self, n):
+        '''
+        Return the n-th smallest value in the ordered set,
+        where the first one is the minimum, O(log(n)).
+        NOTE: If n is out of range, raise an error.
+        '''
+        if not 1 <= n <= len(self):
+            raise IndexError("n out of range")
+        return self._select(n - 1)
+    
+    
+    def percentile(self, p):
+        '''
+        Return the p-th percentile of the values in the ordered set
+        with the nearest-rank method, O(log(n)).
+        NOTE: p must be between 0 and 100, and the ordered set must not be empty.
+        '''
+        if not 0 <= p <= 100:
+            raise ValueError("p must be between 0 and 100")
+        size = len(self)
+        if size == 0:
+            raise IndexError("percentile of an empty ordered set")
+        
+        # the smallest value with at least p percent of the values less or equal
+        n = math.ceil(p * size / 100)
+        return self._select(max(n, 1) - 1)
+    
+    
+    def floor(self, value):
+        '''
+        Return the greatest value in the ordered set
+        less or equal than the given one, or None if there is none, O(log(n)).
+        NOTE: If the value type is not valid, raise an error.
+        '''
+        self._check_value_type(value)
+        return self._navigate(value, below=True, inclusive=True)
+    
+    
+    def ceiling(self, value):
+        '''
+        Return the least value in the ordered set
+        greater or equal than the given one, or None if there is none, O(log(n)).
+        NOTE: If the value type is not valid, raise an error.
+        '''
+        self._check_value_type(value)
+        return self._navigate(value, below=False, inclusive=True)
+    
+    
+    def lower(self, value):
+        '''
+        Return the greatest value in the ordered set
+        strictly less than the given one, or None if there is none, O(log(n)).
+        NOTE: If the value type is not valid, raise an error.
+        '''
+        self._check_value_type(value)
+        return self._navigate(value, below=True, inclusive=False)
+    
+    
+    def higher(self, value):
+        '''
+        Return the least value in the ordered set
+        strictly greater than the given one, or None if there is none, O(log(n)).
+        NOTE: If the value type is not valid, raise an error.
+        '''
+        self._check_value_type(value)
+        return self._navigate(value, below=False, inclusive=False)
+    
+    
+    def irange(self, lo=None, hi=None, inclusive=(True, True)):
+        '''
+        Return a new lazy iterator over the values of the ordered set between
+        lo and hi in order, O(log(n)) to start and O(1) per value amortized.
+        NOTE: a missing lo or hi means that the range is unbounded on that side,
+        and the two booleans in inclusive tell whether lo and hi are included.
+        NOTE: adding or removing values while iterating raises an error.
+        '''
+        if lo is not None:
+            self._check_value_type(lo)
+        if hi is not None:
+            self._check_value_type(hi)
+        return self._lazy_range(lo, hi, inclusive[0], inclusive[1])
+    
+    
+    @abstractmethod
+    def isempty(self):
+        pass
+    
+    @abstractmethod
+    def add(self, value):
+        pass
+    
+    @abstractmethod
+    def remove(self, value):
+        pass
+    
+    @abstractmethod
+    def discard(self, value):
+        pass
+    
+    @abstractmethod
+    def getmin(self):
+        pass
+    
+    @abstractmethod
+    def getmax(self):
+        pass
+    
+    @abstractmethod
+    def inorder(self):
+        pass
+    
+    @abstractmethod
+    def __len__(self):
+        pass
+    
+    @abstractmethod
+    def __contains__(self, value):
+        pass
+    
+    @abstractmethod
+    def __iter__(self):
+        pass
+    
+    @abstractmethod
+    def __str__(self):
+        pass
\ No newline at end of file
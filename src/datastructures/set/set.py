@@ -14,7 +14,6 @@ class Set:
     '''
     def __init__(self):
         self.__hash_table = HashTableSeparateChaining()
-        self.__iterator = None
     
     
     def __raise_error(self, value):
@@ -167,17 +166,10 @@ class Set:
 
     def __iter__(self):
         '''
-        Called when iteration is initialized, O(1).
+        Return a new iterator over the values of the set, O(1).
+        NOTE: adding or removing values while iterating raises an error.
         '''
-        self.__iterator = iter(self.__hash_table)
-        return self
-    
-    
-    def __next__(self):
-        '''
-        To move to the next node, O(1).
-        '''
-        return next(self.__iterator)
+        return iter(self.__hash_table)
     
     
     def __str__(self):
@@ -314,6 +314,28 @@ class SetTest(unittest.TestCase):
             next(iter_obj)
     
     
+    def test_nested_iteration(self):
+        self.set.add(1)
+        self.set.add(2)
+        self.set.add(3)
+        
+        pairs = [(a, b) for a in self.set for b in self.set]
+        self.assertEqual(sorted(pairs), [(a, b) for a in [1, 2, 3] for b in [1, 2, 3]])
+    
+    
+    def test_change_during_iteration(self):
+        self.set.add(1)
+        self.set.add(2)
+        self.set.add(3)
+        
+        with self.assertRaises(RuntimeError):
+            for _ in self.set:
+                self.set.add(4)
+        with self.assertRaises(RuntimeError):
+            for _ in self.set:
+                self.set.remove(1)
+    
+    
     def test_to_string(self):
         self.assertEqual(str(self.set), "{}")
         self.set.add('a')
@@ -0,0 +1,455 @@
+'''
+ * A skip list implementation, used as an ordered set,
+ * where every link also stores how many values it skips.
+ *
+ * Main inspiration: Skip Lists: A Probabilistic Alternative to Balanced Trees (Pugh)
+ *
+ * @author Cosimo Giovanni Negri
+ * @date   18 Oct 2026
+'''
+
+import random
+
+from ..set.abstract_ordered_set import AbstractOrderedSet
+
+
+class Node:
+    '''
+    Node class to represent a value of the skip list, where next[i]
+    is the following node on level i and width[i] is the number of
+    positions between this node and next[i] on the bottom level.
+    '''
+    __slots__ = ('value', 'next', 'width', 'prev')
+    
+    def __init__(self, value, levels):
+        self.value = value
+        self.next = [None] * levels
+        self.width = [0] * levels
+        self.prev = None  # previous node on the bottom level
+    
+    def __str__(self):
+        return str(self.value)
+
+
+class SkipList(AbstractOrderedSet):
+    '''
+    A skip list implementation, used as an ordered set.
+    NOTE: every node is promoted to the next level with probability p,
+    so the expected number of levels is O(log(n)) and every search
+    visits O(1) expected nodes per level, O(log(n)) expected in total.
+    NOTE: an addition or a removal only relinks the neighbours of the node
+    and updates the widths of the links above it, without any rebalancing.
+    '''
+    def __init__(self, p=0.5, max_level=32, seed=None):
+        if not isinstance(p, (int, float)) or isinstance(p, bool) or not 0 < p < 1:
+            raise ValueError("p must be a number between 0 and 1, both excluded")
+        if not isinstance(max_level, int) or isinstance(max_level, bool) or max_level < 1:
+            raise ValueError("max_level must be an integer greater or equal than 1")
+        
+        self.__p = p
+        self.__max_level = max_level
+        self.__random = random.Random(seed)
+        self.__modifications = 0  # to detect changes during an iteration
+        self.__init_list()
+    
+    
+    def __init_list(self):
+        '''
+        Make the skip list empty, with a head node without levels.
+        NOTE: the head gets a new level whenever a node taller than all the others
+        is added, and loses the empty levels on top when a node is removed.
+        '''
+        self.__head = Node(None, 0)
+        self.__last = None
+        self.__size = 0
+    
+    
+    @property
+    def p(self):
+        '''
+        Return the probability of a node to be promoted to the next level, O(1).
+        '''
+        return self.__p
+    
+    
+    @property
+    def max_level(self):
+        '''
+        Return the maximum number of levels of a node, O(1).
+        '''
+        return self.__max_level
+    
+    
+    def _reference_value(self):
+        '''
+        Return the minimum value of the skip list,
+        or None if it is empty, O(1).
+        '''
+        return self.__head.next[0].value if self.__size else None
+    
+    
+    def _build(self, values):
+        '''
+        Fill the empty skip list with the sorted values, keeping
+        the last node of every level and its position to link the next one.
+        '''
+        head = self.__head
+        tails, positions = [], []
+        
+        for position, value in enumerate(values, 1):
+            node = Node(value, self.__random_level())
+            while len(head.next) < len(node.next):
+                head.next.append(None)
+                head.width.append(0)
+                tails.append(head)
+                positions.append(0)
+            
+            for level in range(len(node.next)):
+                tails[level].next[level] = node
+                tails[level].width[level] = position - positions[level]
+                tails[level], positions[level] = node, position
+            node.prev = self.__last
+            self.__last = node
+        
+        # the last link of every level skips the remaining positions
+        for level in range(len(tails)):
+            tails[level].width[level] = len(values) + 1 - positions[level]
+        self.__size = len(values)
+    
+    
+    def clear(self):
+        '''
+        Empty the skip list, O(1).
+        '''
+        self.__init_list()
+        self.__modifications += 1
+    
+    
+    def isempty(self):
+        '''
+        Return whether or not the skip list is empty, O(1).
+        '''
+        return self.__size == 0
+    
+    
+    def __random_level(self):
+        '''
+        Return the number of levels of a new node, which is
+        promoted to the next level with probability p, O(1) expected.
+        '''
+        level = 1
+        while level < self.__max_level and self.__random.random() < self.__p:
+            level += 1
+        return level
+    
+    
+    def __find_path(self, value):
+        '''
+        Return the list of the last nodes before the given value
+        on every level, from the bottom one, together with
+        the list of their positions, where the head is at position 0.
+        '''
+        levels = len(self.__head.next)
+        path = [None] * levels
+        positions = [0] * levels
+        node = self.__head
+        position = 0
+        
+        for level in range(levels - 1, -1, -1):
+            following = node.next[level]
+            while following is not None and following.value < value:
+                position += node.width[level]
+                node = following
+                following = node.next[level]
+            path[level] = node
+            positions[level] = position
+        
+        return path, positions
+    
+    
+    def add(self, value):
+        '''
+        Add the value in the right place if it does not exist
+        in the skip list, otherwise do nothing, O(log(n)) expected.
+        Return whether or not the value has been added.
+        NOTE: If the value type is not valid, raise an error.
+        '''
+        self._check_new_value(value)
+        try:
+            path, positions = self.__find_path(value)
+            following = path[0].next[0] if path else None
+            if following is not None and following.value == value:
+                return False
+        except TypeError:
+            raise self._uncomparable(value) from None
+        
+        head = self.__head
+        node = Node(value, self.__random_level())
+        while len(head.next) < len(node.next):
+            head.next.append(None)
+            head.width.append(self.__size + 1)
+            path.append(head)
+            positions.append(0)
+        
+        position = positions[0] + 1
+        for level in range(len(node.next)):
+            before = path[level]
+            node.next[level] = before.next[level]
+            before.next[level] = node
+            # the link of before is split in two around the new node
+            node.width[level] = before.width[level] - (position - positions[level]) + 1
+            before.width[level] = position - positions[level]
+        for level in range(len(node.next), len(path)):
+            path[level].width[level] += 1
+        
+        node.prev = None if path[0] is head else path[0]
+        if node.next[0] is None:
+            self.__last = node
+        else:
+            node.next[0].prev = node
+        
+        self.__size += 1
+        self.__modifications += 1
+        return True
+    
+    
+    def remove(self, value):
+        '''
+        Remove the value if it exists in the skip list,
+        otherwise raise an error, O(log(n)) expected.
+        NOTE: If the value type is not valid, raise an error.
+        '''
+        self._check_new_value(value)
+        try:
+            path, _ = self.__find_path(value)
+            node = None if not path else path[0].next[0]
+            found = node is not None and node.value == value
+        except TypeError:
+            raise self._uncomparable(value) from None
+        
+        if not found:
+            raise ValueError(f"{value} not in skip list")
+        
+        for level in range(len(node.next)):
+            before = path[level]
+            before.next[level] = node.next[level]
+            before.width[level] += node.width[level] - 1
+        for level in range(len(node.next), len(path)):
+            path[level].width[level] -= 1
+        
+        if node.next[0] is None:
+            self.__last = node.prev
+        else:
+            node.next[0].prev = node.prev
+        
+        head = self.__head
+        while head.next and head.next[-1] is None:
+            head.next.pop()
+            head.width.pop()
+        
+        self.__size -= 1
+        self.__modifications += 1
+    
+    
+    def discard(self, value):
+        '''
+        Remove the value if it exists in the skip list, otherwise
+        do nothing, O(log(n)) expected.
+        Return whether or not the value has been removed.
+        NOTE: If the value type is not valid, raise an error.
+        '''
+        try:
+            self.remove(value)
+        except ValueError:
+            return False
+        return True
+    
+    
+    def getmin(self):
+        '''
+        Return the minimum value in the skip list, O(1).
+        NOTE: If the skip list is empty, raise an error.
+        '''
+        if self.__size == 0:
+            raise ValueError("skip list is empty")
+        return self.__head.next[0].value
+    
+    
+    def getmax(self):
+        '''
+        Return the maximum value in the skip list, O(1).
+        NOTE: If the skip list is empty, raise an error.
+        '''
+        if self.__size == 0:
+            raise ValueError("skip list is empty")
+        return self.__last.value
+    
+    
+    def height(self):
+        '''
+        Return the number of levels of the skip list, O(1).
+        '''
+        return len(self.__head.next)
+    
+    
+    def inorder(self):
+        '''
+        Traverse the skip list in order and
+        return a copy of the list of values, O(n).
+        '''
+        values = []
+        node = self.__head.next[0] if self.__size else None
+        while node is not None:
+            values.append(node.value)
+            node = node.next[0]
+        return values
+    
+    
+    def __last_before(self, value, inclusive):
+        '''
+        Return the last node with a value less than the given one,
+        or less or equal if inclusive, together with its position.
+        NOTE: if there is no such node, the head is returned at position 0.
+        '''
+        node = self.__head
+        position = 0
+        for level in range(len(node.next) - 1, -1, -1):
+            following = node.next[level]
+            while following is not None and (following.value <= value if inclusive else following.value < value):
+                position += node.width[level]
+                node = following
+                following = node.next[level]
+        return node, position
+    
+    
+    def _count_less(self, value, inclusive):
+        '''
+        Return the number of values in the skip list
+        less than the given value, or less or equal if inclusive,
+        which is the position of the last one of them.
+        '''
+        _, position = self.__last_before(value, inclusive)
+        return position
+    
+    
+    def _navigate(self, value, below, inclusive):
+        '''
+        Return the closest value in the skip list below or above
+        the given one, which is included if inclusive, or None.
+        '''
+        if below:
+            node, _ = self.__last_before(value, inclusive)
+            return None if node is self.__head else node.value
+        return self.__value_after(value, not inclusive)
+    
+    
+    def __value_after(self, value, inclusive):
+        '''
+        Return the value of the node following the last one
+        less than the given value, or less or equal if inclusive,
+        or None if there is no such node.
+        '''
+        node, _ = self.__last_before(value, inclusive)
+        following = node.next[0] if node.next else None
+        return None if following is None else following.value
+    
+    
+    def _lazy_range(self, lo, hi, lo_inclusive, hi_inclusive):
+        '''
+        Yield the values of the skip list between lo and hi
+        in order, following the links of the bottom level.
+        '''
+        modifications = self.__modifications
+        
+        if lo is None:
+            node = self.__head
+        else:
+            # the first value in the range follows the last one out of it
+            node, _ = self.__last_before(lo, inclusive=not lo_inclusive)
+        node = node.next[0] if node.next else None
+        
+        while node is not None:
+            value = node.value
+            if hi is not None and (value > hi if hi_inclusive else not value < hi):
+                return
+            
+            yield value
+            if self.__modifications != modifications:
+                raise RuntimeError("skip list changed size during iteration")
+            
+            node = node.next[0]
+    
+    
+    def _select(self, index):
+        '''
+        Return the value at the given index in the sorted order,
+        following the links that do not skip past its position.
+        '''
+        target = index + 1  # the head is at position 0
+        node = self.__head
+        position = 0
+        for level in range(len(node.next) - 1, -1, -1):
+            while node.next[level] is not None and position + node.width[level] <= target:
+                position += node.width[level]
+                node = node.next[level]
+        
+        return node.value
+    
+    
+    def __len__(self):
+        '''
+        Return the size of the skip list, O(1).
+        '''
+        return self.__size
+    
+    
+    def __contains__(self, value):
+        '''
+        Return whether or not a value is in the skip list, O(log(n)) expected.
+        '''
+        node, _ = self.__last_before(value, inclusive=True)
+        return node is not self.__head and node.value == value
+    
+    
+    def __iter__(self):
+        '''
+        Return a new lazy iterator over the values
+        of the skip list in order, O(1).
+        NOTE: adding or removing values while iterating raises an error.
+        '''
+        return self._lazy_range(None, None, True, True)
+    
+    
+    def __reversed__(self):
+        '''
+        Return a new lazy iterator over the values
+        of the skip list in reverse order, O(1).
+        NOTE: adding or removing values while iterating raises an error.
+        '''
+        return self.__lazy_reversed()
+    
+    
+    def __lazy_reversed(self):
+        '''
+        Yield the values of the skip list in reverse order,
+        following the links to the previous nodes.
+        '''
+        modifications = self.__modifications
+        node = self.__last
+        
+        while node is not None:
+            yield node.value
+            if self.__modifications != modifications:
+                raise RuntimeError("skip list changed size during iteration")
+            node = node.prev
+    
+    
+    def __str__(self):
+        '''
+        Return a string to print the skip list, O(n).
+        '''
+        strings = []
+        for value in self.inorder():
+            strings.append(str(value))
+        
+        return '[' + ', '.join(strings) + ']'
\ No newline at end of file
@@ -0,0 +1,291 @@
+'''
+ * A skip list unit test.
+ *
+ * @author Cosimo Giovanni Negri
+ * @date   18 Oct 2026
+'''
+
+import unittest
+import sys
+import os
+import random
+
+if __name__ == "__main__":
+    sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+    from datastructures.skiplist.skip_list import SkipList
+else:
+    from .skip_list import SkipList
+
+
+class NonComparableObject:
+
+    def __init__(self, data):
+        self.data = data
+
+
+class SkipListTest(unittest.TestCase):
+
+    def setUp(self):
+        self.LOOPS = 200
+        self.SIZE = 40
+        self.MAX_RANDOM_NUM = 250
+        
+        self.skip_list = SkipList(seed=0)
+    
+    
+    def test_invalid_parameters(self):
+        for p in [0, 1, -0.5, True, "0.5"]:
+            with self.assertRaises(ValueError):
+                SkipList(p=p)
+        for max_level in [0, 2.5, True]:
+            with self.assertRaises(ValueError):
+                SkipList(max_level=max_level)
+        
+        skip_list = SkipList(p=0.25, max_level=8)
+        self.assertEqual(skip_list.p, 0.25)
+        self.assertEqual(skip_list.max_level, 8)
+    
+    
+    def test_empty_skip_list(self):
+        self.assertTrue(self.skip_list.isempty())
+        self.assertEqual(len(self.skip_list), 0)
+        self.assertEqual(self.skip_list.height(), 0)
+        self.assertEqual(self.skip_list.inorder(), [])
+        self.assertEqual(list(reversed(self.skip_list)), [])
+        self.assertFalse(3 in self.skip_list)
+        with self.assertRaises(ValueError):
+            self.skip_list.getmin()
+        with self.assertRaises(ValueError):
+            self.skip_list.getmax()
+        with self.assertRaises(IndexError):
+            self.skip_list.select(0)
+    
+    
+    def test_add(self):
+        self.assertTrue(self.skip_list.add("A"))
+        self.assertTrue(self.skip_list.add("C"))
+        self.assertTrue(self.skip_list.add("B"))
+        self.assertFalse(self.skip_list.add("A"))
+        self.assertEqual(len(self.skip_list), 3)
+        self.assertEqual(self.skip_list.inorder(), ["A", "B", "C"])
+        self.assertEqual(self.skip_list.getmin(), "A")
+        self.assertEqual(self.skip_list.getmax(), "C")
+    
+    
+    def test_remove(self):
+        self.skip_list.add("A")
+        with self.assertRaises(ValueError):
+            self.skip_list.remove("B")
+        self.assertFalse(self.skip_list.discard("B"))
+        
+        self.skip_list.add("B")
+        self.skip_list.remove("B")
+        self.assertEqual(self.skip_list.getmax(), "A")
+        self.assertTrue(self.skip_list.discard("A"))
+        self.assertEqual(len(self.skip_list), 0)
+        self.assertEqual(self.skip_list.height(), 0)
+    
+    
+    def test_clear(self):
+        for num in range(self.SIZE):
+            self.skip_list.add(num)
+        self.skip_list.clear()
+        self.assertEqual(len(self.skip_list), 0)
+        self.assertEqual(self.skip_list.inorder(), [])
+        
+        self.skip_list.add(8)
+        self.assertEqual(self.skip_list.inorder(), [8])
+    
+    
+    def test_invalid_values(self):
+        with self.assertRaises(TypeError):
+            self.skip_list.add(True)
+        with self.assertRaises(TypeError):
+            self.skip_list.add(None)
+        with self.assertRaises(TypeError):
+            self.skip_list.add(NonComparableObject("data"))
+        
+        self.skip_list.add(1)
+        with self.assertRaises(TypeError):
+            self.skip_list.add("A")
+        with self.assertRaises(TypeError):
+            self.skip_list.remove("A")
+        with self.assertRaises(TypeError):
+            self.skip_list.floor("A")
+        self.assertEqual(self.skip_list.inorder(), [1])
+    
+    
+    def test_height(self):
+        # with a single level the skip list is a sorted linked list
+        skip_list = SkipList(max_level=1)
+        for num in range(self.SIZE):
+            skip_list.add(num)
+        self.assertEqual(skip_list.height(), 1)
+        
+        skip_list = SkipList(max_level=4, seed=0)
+        for num in range(self.SIZE * 10):
+            skip_list.add(num)
+        self.assertLessEqual(skip_list.height(), 4)
+        
+        for num in range(self.SIZE * 10):
+            self.assertLessEqual(self.skip_list.height(), 32)
+            self.skip_list.add(num)
+        self.assertGreater(self.skip_list.height(), 1)
+    
+    
+    def test_random_operations(self):
+        for p, max_level in [(0.5, 32), (0.25, 3), (0.75, 1)]:
+            skip_list = SkipList(p=p, max_level=max_level)
+            python_set = set()
+            
+            for _ in range(self.LOOPS * 10):
+                num = random.randrange(self.MAX_RANDOM_NUM)
+                if random.random() < 0.6:
+                    self.assertEqual(skip_list.add(num), num not in python_set)
+                    python_set.add(num)
+                else:
+                    self.assertEqual(skip_list.discard(num), num in python_set)
+                    python_set.discard(num)
+                
+                self.assertEqual(len(skip_list), len(python_set))
+            
+            values = sorted(python_set)
+            self.assertEqual(skip_list.inorder(), values)
+            self.assertEqual(list(reversed(skip_list)), values[::-1])
+            for index, value in enumerate(values):
+                # every width on the way must be right
+                self.assertEqual(skip_list.select(index), value)
+                self.assertEqual(skip_list.rank(value), index)
+            for num in range(self.MAX_RANDOM_NUM):
+                self.assertEqual(num in skip_list, num in python_set)
+    
+    
+    def test_rank_select(self):
+        rand_nums = self.get_rand_list()
+        for num in rand_nums:
+            self.skip_list.add(num)
+        for num in rand_nums[:self.SIZE // 4]:
+            self.skip_list.remove(num)
+        
+        values = sorted(rand_nums[self.SIZE // 4:])
+        for index, value in enumerate(values):
+            self.assertEqual(self.skip_list.select(index), value)
+            self.assertEqual(self.skip_list.select(index - len(values)), value)
+            self.assertEqual(self.skip_list.rank(value), index)
+            self.assertEqual(self.skip_list.rank(value + 0.5), index + 1)
+            self.assertEqual(self.skip_list.nth_smallest(index + 1), value)
+        
+        with self.assertRaises(IndexError):
+            self.skip_list.select(len(values))
+        with self.assertRaises(IndexError):
+            self.skip_list.nth_smallest(0)
+        self.assertEqual(self.skip_list.percentile(100), values[-1])
+        self.assertEqual(self.skip_list.percentile(0), values[0])
+    
+    
+    def test_count_range(self):
+        for num in range(0, 100, 10):
+            self.skip_list.add(num)
+        
+        self.assertEqual(self.skip_list.count_range(0, 90), 10)
+        self.assertEqual(self.skip_list.count_range(5, 35), 3)
+        self.assertEqual(self.skip_list.count_range(30, 30), 1)
+        self.assertEqual(self.skip_list.count_range(30, 10), 0)
+    
+    
+    def test_navigation(self):
+        self.assertIsNone(self.skip_list.floor(5))
+        self.assertIsNone(self.skip_list.higher(5))
+        
+        for num in range(0, 100, 10):
+            self.skip_list.add(num)
+        
+        self.assertEqual(self.skip_list.floor(30), 30)
+        self.assertEqual(self.skip_list.floor(35), 30)
+        self.assertIsNone(self.skip_list.floor(-1))
+        self.assertEqual(self.skip_list.ceiling(35), 40)
+        self.assertIsNone(self.skip_list.ceiling(91))
+        self.assertEqual(self.skip_list.lower(30), 20)
+        self.assertIsNone(self.skip_list.lower(0))
+        self.assertEqual(self.skip_list.higher(30), 40)
+        self.assertIsNone(self.skip_list.higher(90))
+    
+    
+    def test_irange(self):
+        self.assertEqual(list(self.skip_list.irange(1, 10)), [])
+        
+        for num in range(0, 100, 10):
+            self.skip_list.add(num)
+        
+        self.assertEqual(list(self.skip_list.irange(20, 50)), [20, 30, 40, 50])
+        self.assertEqual(list(self.skip_list.irange(15, 55)), [20, 30, 40, 50])
+        self.assertEqual(list(self.skip_list.irange(20, 50, inclusive=(False, False))), [30, 40])
+        self.assertEqual(list(self.skip_list.irange(hi=20)), [0, 10, 20])
+        self.assertEqual(list(self.skip_list.irange(lo=70)), [70, 80, 90])
+        self.assertEqual(list(self.skip_list.irange(50, 20)), [])
+        
+        with self.assertRaises(RuntimeError):
+            for _ in self.skip_list.irange(10, 80):
+                self.skip_list.add(15)
+    
+    
+    def test_from_sorted(self):
+        for size in [0, 1, 2, 17, 100, 1000]:
+            skip_list = SkipList.from_sorted(range(size), seed=size)
+            self.assertEqual(len(skip_list), size)
+            self.assertEqual(skip_list.inorder(), list(range(size)))
+            for index in range(0, size, 7):
+                self.assertEqual(skip_list.select(index), index)
+            
+            # the skip list must keep working as usual
+            for num in range(0, size, 3):
+                skip_list.remove(num)
+            skip_list.add(size)
+            values = [num for num in range(size + 1) if num % 3 or num == size]
+            self.assertEqual(skip_list.inorder(), values)
+            self.assertEqual(list(reversed(skip_list)), values[::-1])
+        
+        with self.assertRaises(ValueError):
+            SkipList.from_sorted([1, 3, 2])
+        self.assertEqual(SkipList.from_iterable([3, 1, 2, 1]).inorder(), [1, 2, 3])
+    
+    
+    def test_seed(self):
+        first = SkipList(seed=42)
+        second = SkipList(seed=42)
+        for num in range(self.SIZE * 10):
+            first.add(num)
+            second.add(num)
+            self.assertEqual(first.height(), second.height())
+    
+    
+    def test_change_during_iteration(self):
+        for num in range(self.SIZE):
+            self.skip_list.add(num)
+        
+        with self.assertRaises(RuntimeError):
+            for num in self.skip_list:
+                self.skip_list.remove(num)
+        with self.assertRaises(RuntimeError):
+            for num in reversed(self.skip_list):
+                self.skip_list.add(num + self.SIZE)
+    
+    
+    def test_to_string(self):
+        self.assertEqual(str(self.skip_list), "[]")
+        for value in ["H", "D", "O", "F"]:
+            self.skip_list.add(value)
+        self.assertEqual(str(self.skip_list), "[D, F, H, O]")
+    
+    
+    def get_rand_list(self):
+        '''
+        Generate a list of random numbers.
+        '''
+        list = random.sample(range(0, self.MAX_RANDOM_NUM), self.SIZE)
+        random.shuffle(list)
+        return list
+
+
+if __name__ == "__main__":
+    unittest.main()
\ No newline at end of file
@@ -34,10 +34,6 @@ class AbstractStack(ABC):
     def __iter__(self):
         pass
     
-    @abstractmethod
-    def __next__(self):
-        pass
-    
     @abstractmethod
     def __str__(self):
         pass
\ No newline at end of file
@@ -18,7 +18,6 @@ class LinkedStack(AbstractStack):
     '''
     def __init__(self):
         self.__list = DoublyLinkedList()
-        self.__iterator = None
     
     
     def isempty(self):
@@ -61,17 +60,10 @@ class LinkedStack(AbstractStack):
     
     def __iter__(self):
         '''
-        Called when iteration is initialized, O(1).
+        Return a new iterator over the values of the stack, O(1).
+        NOTE: pushing or popping while iterating raises an error.
         '''
-        self.__iterator = iter(self.__list)
-        return self
-    
-    
-    def __next__(self):
-        '''
-        To move to the next node, O(1).
-        '''
-        return next(self.__iterator)
+        return iter(self.__list)
     
     
     def __str__(self):
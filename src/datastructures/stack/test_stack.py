@@ -92,6 +92,28 @@ class StackTest(unittest.TestCase):
             next(iter_obj)
     
     
+    def test_nested_iteration(self):
+        self.stack.push(1)
+        self.stack.push(2)
+        self.stack.push(3)
+        
+        pairs = [(a, b) for a in self.stack for b in self.stack]
+        self.assertEqual(pairs, [(a, b) for a in [1, 2, 3] for b in [1, 2, 3]])
+    
+    
+    def test_change_during_iteration(self):
+        self.stack.push(1)
+        self.stack.push(2)
+        self.stack.push(3)
+        
+        with self.assertRaises(RuntimeError):
+            for _ in self.stack:
+                self.stack.push(4)
+        with self.assertRaises(RuntimeError):
+            for _ in self.stack:
+                self.stack.pop()
+    
+    
     def test_to_string(self):
         self.assertEqual(str(self.stack), "[]")
         self.stack.push('a')
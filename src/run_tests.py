@@ -8,11 +8,20 @@
 import unittest
 
 from datastructures.linkedlist.test_doubly_linked_list import DoublyLinkedListTest
-from datastructures.queue.test_queue import QueueTest
+from datastructures.queue.test_queue import QueueTest, ArrayQueueTest, BlockingQueueTest, \
+    AsyncQueueTest, PriorityQueueTest
 from datastructures.stack.test_stack import StackTest
-from datastructures.hashtable.test_hash_table import HashTableTest
+from datastructures.hashtable.test_hash_table import HashTableTest, HashTableIncrementalTest, HashTableShrinkTest
+from datastructures.hashtable.test_hash_table_open_addressing import HashTableOpenAddressingTest, \
+    HashTableQuadraticProbingTest, HashTableRobinHoodTest, HashTableSelectorTest, HashTableEngineTest
 from datastructures.set.test_set import SetTest
-from datastructures.binarysearchtree.test_binary_search_tree import BinarySearchTreeTest
+from datastructures.binarysearchtree.test_binary_search_tree import BinarySearchTreeTest, BalancedBinarySearchTreeTest
+from datastructures.binarysearchtree.test_red_black_tree import RedBlackTreeTest
+from datastructures.binarysearchtree.test_tree_map import TreeMapTest
+from datastructures.binarysearchtree.test_persistent_tree import PersistentTreeTest
+from datastructures.binarysearchtree.test_interval_tree import IntervalTreeTest
+from datastructures.bplustree.test_b_plus_tree import BPlusTreeTest
+from datastructures.skiplist.test_skip_list import SkipListTest
 
 
 # IDEA: dd automatic imports with a recursive os.walk,
@@ -38,7 +47,7 @@ def print_message(unit_test_name, tests_num):
     Print a message containing the number of TestCase methods
     in the given unit test.
     '''
-    print("{:<25}|   {:<2} tests   |".format(unit_test_name, tests_num))
+    print("{:<32}|   {:<2} tests   |".format(unit_test_name, tests_num))
 
 
 def expand_suite(suite, unit_test, print=True):
@@ -66,10 +75,28 @@ if __name__ == '__main__':
     # Expand the suite with all the tests and print some data
     expand_suite(suite, DoublyLinkedListTest)
     expand_suite(suite, QueueTest)
+    expand_suite(suite, ArrayQueueTest)
+    expand_suite(suite, BlockingQueueTest)
+    expand_suite(suite, AsyncQueueTest)
+    expand_suite(suite, PriorityQueueTest)
     expand_suite(suite, StackTest)
     expand_suite(suite, HashTableTest)
+    expand_suite(suite, HashTableIncrementalTest)
+    expand_suite(suite, HashTableShrinkTest)
+    expand_suite(suite, HashTableOpenAddressingTest)
+    expand_suite(suite, HashTableQuadraticProbingTest)
+    expand_suite(suite, HashTableRobinHoodTest)
+    expand_suite(suite, HashTableSelectorTest)
+    expand_suite(suite, HashTableEngineTest)
     expand_suite(suite, SetTest)
     expand_suite(suite, BinarySearchTreeTest)
+    expand_suite(suite, BalancedBinarySearchTreeTest)
+    expand_suite(suite, RedBlackTreeTest)
+    expand_suite(suite, TreeMapTest)
+    expand_suite(suite, PersistentTreeTest)
+    expand_suite(suite, IntervalTreeTest)
+    expand_suite(suite, BPlusTreeTest)
+    expand_suite(suite, SkipListTest)
     
     # Run all the tests
     runner.run(suite)
\ No newline at end of file